@@ -0,0 +1,45 @@
+"""Public id and name search indexes
+
+Revision ID: 2ba89a5848cf
+Revises: 8c0caf318824
+Create Date: 2026-10-18 09:12:40.184215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ba89a5848cf'
+down_revision: Union[str, None] = '8c0caf318824'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_categorias_id'), 'categorias', ['id'], unique=True,
+                        postgresql_concurrently=True)
+        op.create_index(op.f('ix_centros_treinamento_id'), 'centros_treinamento', ['id'], unique=True,
+                        postgresql_concurrently=True)
+        op.create_index(op.f('ix_atletas_id'), 'atletas', ['id'], unique=True,
+                        postgresql_concurrently=True)
+        op.create_index('ix_atletas_nome_trgm', 'atletas', ['nome'], postgresql_using='gin',
+                        postgresql_ops={'nome': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_atletas_nome_prefix', 'atletas', ['nome'],
+                        postgresql_ops={'nome': 'varchar_pattern_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_atletas_nome_prefix', table_name='atletas', postgresql_concurrently=True)
+        op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_atletas_id'), table_name='atletas', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_centros_treinamento_id'), table_name='centros_treinamento',
+                      postgresql_concurrently=True)
+        op.drop_index(op.f('ix_categorias_id'), table_name='categorias', postgresql_concurrently=True)
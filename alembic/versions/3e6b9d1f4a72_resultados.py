@@ -0,0 +1,66 @@
+"""Resultados partitioned by month with daily and weekly rollups
+
+Revision ID: 3e6b9d1f4a72
+Revises: 7a4c2e91b0d5
+Create Date: 2026-10-18 16:05:12.418530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e6b9d1f4a72'
+down_revision: Union[str, None] = '7a4c2e91b0d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Agregados diários e semanais, mantidos pela ingestão (workout_api.resultados.ingestao) na mesma transação
+ROLLUPS = (
+    ('resultados_atleta_periodo', 'atleta_id', 'atletas'),
+    ('resultados_centro_periodo', 'centro_treinamento_id', 'centros_treinamento'),
+)
+
+
+def upgrade() -> None:
+    # As partições mensais (resultados_AAAA_MM) são criadas pela aplicação, com antecedência
+    op.create_table('resultados',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('atleta_id', sa.Integer(), nullable=False),
+    sa.Column('realizado_em', sa.DateTime(), nullable=False),
+    sa.Column('treino', sa.String(length=50), nullable=False),
+    sa.Column('unidade', sa.String(length=10), nullable=False),
+    sa.Column('valor', sa.Float(), nullable=False),
+    sa.Column('centro_treinamento_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['atleta_id'], ['atletas.pk_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['centro_treinamento_id'], ['centros_treinamento.pk_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('atleta_id', 'realizado_em', 'treino'),
+    postgresql_partition_by='RANGE (realizado_em)'
+    )
+
+    for table, column, parent in ROLLUPS:
+        op.create_table(table,
+        sa.Column(column, sa.Integer(), nullable=False),
+        sa.Column('periodo', sa.String(length=6), nullable=False),
+        sa.Column('inicio', sa.Date(), nullable=False),
+        sa.Column('treino', sa.String(length=50), nullable=False),
+        sa.Column('unidade', sa.String(length=10), nullable=False),
+        sa.Column('quantidade', sa.Integer(), nullable=False),
+        sa.Column('soma', sa.Float(), nullable=False),
+        sa.Column('minimo', sa.Float(), nullable=False),
+        sa.Column('maximo', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint([column], [f'{parent}.pk_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint(column, 'periodo', 'inicio', 'treino', 'unidade')
+        )
+
+
+def downgrade() -> None:
+    for table, _, _ in reversed(ROLLUPS):
+        op.drop_table(table)
+
+    # Remove também as partições
+    op.drop_table('resultados')
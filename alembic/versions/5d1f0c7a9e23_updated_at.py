@@ -0,0 +1,32 @@
+"""updated_at for conditional requests
+
+Revision ID: 5d1f0c7a9e23
+Revises: 2ba89a5848cf
+Create Date: 2026-10-18 11:05:12.530148
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f0c7a9e23'
+down_revision: Union[str, None] = '2ba89a5848cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('categorias', 'centros_treinamento', 'atletas')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # now() é avaliado uma única vez, então o PostgreSQL não reescreve a tabela
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                       server_default=sa.text("timezone('utc', now())")))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,33 @@
+"""Foreign key indexes for athlete listings per categoria and centro
+
+Revision ID: 7a4c2e91b0d5
+Revises: 5d1f0c7a9e23
+Create Date: 2026-10-18 13:40:27.904361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4c2e91b0d5'
+down_revision: Union[str, None] = '5d1f0c7a9e23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_atletas_categoria_id_nome', 'atletas', ['categoria_id', 'nome', 'pk_id'],
+                        postgresql_concurrently=True)
+        op.create_index('ix_atletas_centro_treinamento_id_nome', 'atletas',
+                        ['centro_treinamento_id', 'nome', 'pk_id'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_atletas_centro_treinamento_id_nome', table_name='atletas', postgresql_concurrently=True)
+        op.drop_index('ix_atletas_categoria_id_nome', table_name='atletas', postgresql_concurrently=True)
+
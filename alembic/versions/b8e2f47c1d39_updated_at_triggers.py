@@ -0,0 +1,46 @@
+"""updated_at maintained by the database on every UPDATE
+
+Revision ID: b8e2f47c1d39
+Revises: 3e6b9d1f4a72
+Create Date: 2026-10-18 18:20:44.105327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f47c1d39'
+down_revision: Union[str, None] = '3e6b9d1f4a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('atletas', 'categorias', 'centros_treinamento')
+
+
+def upgrade() -> None:
+    # Vale também para UPDATEs feitos fora do ORM (SQL direto, triggers); quando o próprio comando define
+    # updated_at, o valor é mantido. clock_timestamp(), e não now(): transações longas não gravam um instante antigo
+    op.execute("""
+    CREATE FUNCTION touch_updated_at() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at
+           AND to_jsonb(NEW) - 'updated_at' IS DISTINCT FROM to_jsonb(OLD) - 'updated_at' THEN
+            NEW.updated_at := timezone('utc', clock_timestamp());
+        END IF;
+        RETURN NEW;
+    END
+    $$""")
+
+    for table in TABLES:
+        op.execute(f"""
+        CREATE TRIGGER {table}_touch_updated_at BEFORE UPDATE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION touch_updated_at()""")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"DROP TRIGGER {table}_touch_updated_at ON {table}")
+
+    op.execute("DROP FUNCTION touch_updated_at()")
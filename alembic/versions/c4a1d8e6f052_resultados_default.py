@@ -0,0 +1,26 @@
+"""Default partition for resultados
+
+Revision ID: c4a1d8e6f052
+Revises: b8e2f47c1d39
+Create Date: 2026-10-18 18:52:09.661204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a1d8e6f052'
+down_revision: Union[str, None] = 'b8e2f47c1d39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recebe datas fora das partições mensais criadas com antecedência pela aplicação, em vez de falhar o INSERT
+    op.execute("CREATE TABLE resultados_default PARTITION OF resultados DEFAULT")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE resultados_default")
@@ -0,0 +1,115 @@
+"""Benchmark dos endpoints da Workout API, executada no próprio processo via ASGI.
+
+Exemplos:
+
+    python -m benchmarks run --db-url sqlite+aiosqlite:///benchmark.sqlite --atletas 10000 --output base.json
+    python -m benchmarks run --atletas 1000000 --concurrency 32 --output atual.json
+    python -m benchmarks compare base.json atual.json --threshold 0.10
+    FAST_JSON_ENABLED=true python -m benchmarks run --output fast_json.json
+    python -m benchmarks serialization --size 50 --size 500
+    python -m benchmarks startup --runs 5 --budget-ms 2500
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Popula o banco e mede os endpoints")
+    run.add_argument("--db-url", help="Padrão: DB_URL do ambiente (PostgreSQL local)")
+    run.add_argument("--atletas", type=int, default=10_000)
+    run.add_argument("--categorias", type=int, default=10)
+    run.add_argument("--centros", type=int, default=50)
+    run.add_argument("--concurrency", type=int, default=16)
+    run.add_argument("--requests", type=int, default=500, help="Requisições por endpoint")
+    run.add_argument("--warmup", type=int, default=20, help="Requisições descartadas por endpoint")
+    run.add_argument("--endpoint", action="append", help="Restringe aos cenários informados (repetível)")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--output", default="benchmark.json")
+
+    compare = commands.add_parser("compare", help="Compara dois resultados")
+    compare.add_argument("base")
+    compare.add_argument("atual")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Piora tolerada no p95 (fração)")
+
+    serialization = commands.add_parser("serialization", help="Compara a serialização atual com FAST_JSON_ENABLED")
+    serialization.add_argument("--size", type=int, action="append", help="Itens por página (repetível)")
+    serialization.add_argument("--repeat", type=int, default=200)
+
+    startup = commands.add_parser("startup", help="Mede a partida a frio do worker e o tempo de importação")
+    startup.add_argument("--db-url", help="Padrão: DB_URL do ambiente (PostgreSQL local)")
+    startup.add_argument("--runs", type=int, default=5, help="Processos medidos")
+    startup.add_argument("--no-lifespan", action="store_true", help="Apenas importação e primeira requisição")
+    startup.add_argument("--top", type=int, default=15, help="Pacotes e módulos listados no relatório")
+    startup.add_argument("--budget-ms", type=float, help="Falha se a mediana até a primeira resposta passar disso")
+    startup.add_argument("--output", help="Salva o relatório em JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "startup":
+        from benchmarks.startup import run as medir_partida
+
+        relatorio = medir_partida(args.runs, not args.no_lifespan, args.top, args.db_url)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as arquivo:
+                json.dump(relatorio, arquivo, indent=2)
+
+        print("Fases (mediana): " + "  ".join(f"{fase}={ms}ms" for fase, ms in relatorio["fases_ms"].items()))
+        print("\nImportação por pacote (tempo próprio):")
+        for pacote, ms in relatorio["importacao_por_pacote_ms"].items():
+            print(f"  {pacote:<32} {ms:>8}ms")
+        print("\nMódulos da aplicação:")
+        for modulo, metricas in relatorio["modulos_workout_api_ms"].items():
+            print(f"  {modulo:<48} proprio={metricas['proprio']:>8}ms cumulativo={metricas['cumulativo']:>8}ms")
+
+        pronto = relatorio["pronto_ms"]
+        print(f"\nPronto em {pronto['mediana']}ms (min={pronto['min']}ms max={pronto['max']}ms)")
+        if args.budget_ms is not None and pronto["mediana"] > args.budget_ms:
+            print(f"Partida a frio acima do orçamento de {args.budget_ms}ms")
+            return 1
+        return 0
+
+    if args.command == "serialization":
+        from benchmarks.serialization import run as medir
+
+        for tamanho, metricas in medir(args.size or [50, 500], args.repeat).items():
+            print(f"{tamanho:>6} itens  atual={metricas['atual_us']:>10}us  rapido={metricas['rapido_us']:>10}us  "
+                  f"ganho={metricas['ganho']}x")
+        return 0
+
+    if args.command == "compare":
+        from benchmarks.compare import compare as comparar
+
+        with open(args.base, encoding="utf-8") as base, open(args.atual, encoding="utf-8") as atual:
+            linhas, regressoes = comparar(json.load(base), json.load(atual), args.threshold)
+        print("\n".join(linhas))
+        if regressoes:
+            print(f"\nRegressão de p95 acima de {args.threshold:.0%}: {', '.join(regressoes)}")
+            return 1
+        return 0
+
+    if args.db_url:
+        os.environ["DB_URL"] = args.db_url
+
+    from benchmarks.runner import run as executar, salvar
+
+    resultado = asyncio.run(executar(
+        args.atletas, args.categorias, args.centros, args.concurrency, args.requests,
+        cenarios=args.endpoint, seed=args.seed, aquecimento=args.warmup,
+    ))
+    salvar(resultado, args.output)
+
+    for endpoint, metricas in resultado["endpoints"].items():
+        print(f"{endpoint:<32} p50={metricas['p50_ms']:>8}ms p95={metricas['p95_ms']:>8}ms "
+              f"p99={metricas['p99_ms']:>8}ms rps={metricas['rps']:>8} q/req={metricas['queries_per_request']}")
+    print(f"\nResultado salvo em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+from typing import Any
+
+METRICAS = ("p50_ms", "p95_ms", "p99_ms", "rps", "queries_per_request")
+
+
+def _variacao(antes: Any, depois: Any) -> str:
+    if antes in (None, 0) or depois is None:
+        return "n/a"
+    return f"{(depois - antes) / antes:+.1%}"
+
+
+def compare(base: dict[str, Any], atual: dict[str, Any], limite: float) -> tuple[list[str], list[str]]:
+    """Compara dois resultados; retorna as linhas do relatório e os endpoints cujo p95 piorou além de `limite`."""
+    linhas = [f"{'endpoint':<32}" + "".join(f"{metrica:>26}" for metrica in METRICAS)]
+    regressoes = []
+
+    for endpoint, depois in atual["endpoints"].items():
+        antes = base["endpoints"].get(endpoint)
+        if antes is None:
+            linhas.append(f"{endpoint:<32} (novo)")
+            continue
+
+        colunas = [f"{antes[m]} -> {depois[m]} ({_variacao(antes[m], depois[m])})" for m in METRICAS]
+        linhas.append(f"{endpoint:<32}" + "".join(f"{coluna:>26}" for coluna in colunas))
+
+        if antes["p95_ms"] and (depois["p95_ms"] - antes["p95_ms"]) / antes["p95_ms"] > limite:
+            regressoes.append(endpoint)
+
+    return linhas, regressoes
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import math
+import platform
+import random
+import re
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+import httpx
+from sqlalchemy import delete, func
+from sqlalchemy.future import select
+
+QUERIES_PATTERN = re.compile(r'db;[^,]*desc="(\d+) queries"')
+# CPFs criados pelo cenário de POST; removidos ao final para que o banco possa ser reutilizado
+CPF_PREFIXO = "9"
+
+
+@dataclass
+class Amostra:
+    ids: list[str]
+    cpfs: list[str]
+    nomes: list[str]
+    categorias: list[str]
+    centros: list[str]
+
+
+@dataclass
+class Cenario:
+    nome: str
+    method: str
+    request: Callable[[random.Random, Amostra, int], dict[str, Any]]
+
+
+CENARIOS = (
+    Cenario("GET /atletas/", "GET", lambda rng, a, i: {"url": "/atletas/", "params": {"page": rng.randint(1, 20)}}),
+    Cenario("GET /atletas/cursor", "GET", lambda rng, a, i: {"url": "/atletas/cursor"}),
+    Cenario("GET /atletas/busca", "GET",
+            lambda rng, a, i: {"url": "/atletas/busca", "params": {"nome": rng.choice(a.nomes).split()[0]}}),
+    Cenario("GET /atletas/by?cpf", "GET", lambda rng, a, i: {"url": "/atletas/by", "params": {"cpf": rng.choice(a.cpfs)}}),
+    Cenario("GET /atletas/by?id_atleta", "GET",
+            lambda rng, a, i: {"url": "/atletas/by", "params": {"id_atleta": rng.choice(a.ids)}}),
+    Cenario("PATCH /atletas/{id}", "PATCH",
+            lambda rng, a, i: {"url": f"/atletas/{rng.choice(a.ids)}", "json": {"idade": rng.randint(14, 70)}}),
+    Cenario("POST /atletas/", "POST", lambda rng, a, i: {"url": "/atletas/", "json": {
+        "nome": "Atleta Benchmark", "cpf": f"{CPF_PREFIXO}{i:010d}", "idade": 30, "peso": 80.0, "altura": 1.8, "sexo": "M",
+        "categoria": {"nome": rng.choice(a.categorias)}, "centro_treinamento": {"nome": rng.choice(a.centros)},
+    }}),
+    Cenario("GET /categorias/", "GET", lambda rng, a, i: {"url": "/categorias/"}),
+    Cenario("GET /centros_treinamento/", "GET", lambda rng, a, i: {"url": "/centros_treinamento/"}),
+)
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentil pelo método nearest-rank; `values` já ordenados."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(len(values) * p / 100))
+    return values[rank - 1]
+
+
+async def carregar_amostra(session_factory, tamanho: int, rng: random.Random) -> Amostra:
+    from workout_api.atleta.models import AtletaModel
+    from workout_api.categorias.models import CategoriaModel
+    from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+    async with session_factory() as db_session:
+        maximo = await db_session.scalar(select(func.max(AtletaModel.pk_id))) or 0
+        pk_ids = rng.sample(range(1, maximo + 1), min(tamanho, maximo))
+        rows = (await db_session.execute(
+            select(AtletaModel.id, AtletaModel.cpf, AtletaModel.nome).where(AtletaModel.pk_id.in_(pk_ids))
+        )).all()
+        categorias = (await db_session.execute(select(CategoriaModel.nome))).scalars().all()
+        centros = (await db_session.execute(select(CentroTreinamentoModel.nome))).scalars().all()
+
+    return Amostra(
+        ids=[str(row.id) for row in rows], cpfs=[row.cpf for row in rows], nomes=[row.nome for row in rows],
+        categorias=list(categorias), centros=list(centros),
+    )
+
+
+async def executar_cenario(
+    client: httpx.AsyncClient, cenario: Cenario, amostra: Amostra, requisicoes: int, concorrencia: int,
+    rng: random.Random, contador: list[int],
+) -> dict[str, Any]:
+    latencias: list[float] = []
+    consultas: list[int] = []
+    erros = 0
+    pendentes = iter(range(requisicoes))
+
+    async def worker() -> None:
+        nonlocal erros
+        for _ in pendentes:
+            contador[0] += 1
+            request = cenario.request(rng, amostra, contador[0])
+            start = perf_counter()
+            response = await client.request(cenario.method, **request)
+            latencias.append(perf_counter() - start)
+
+            if response.status_code >= 400:
+                erros += 1
+            match = QUERIES_PATTERN.search(response.headers.get("server-timing", ""))
+            if match:
+                consultas.append(int(match.group(1)))
+
+    inicio = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concorrencia)))
+    duracao = perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "requests": len(latencias),
+        "errors": erros,
+        "p50_ms": round(percentile(latencias, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencias, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencias, 99) * 1000, 3),
+        "mean_ms": round(sum(latencias) / len(latencias) * 1000, 3) if latencias else 0.0,
+        "rps": round(len(latencias) / duracao, 2) if duracao else 0.0,
+        "queries_per_request": round(sum(consultas) / len(consultas), 2) if consultas else None,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(
+    atletas: int, categorias: int, centros: int, concorrencia: int, requisicoes: int,
+    cenarios: Optional[list[str]] = None, seed: int = 42, aquecimento: int = 20,
+) -> dict[str, Any]:
+    # Importado aqui para que DB_URL já esteja definido no ambiente
+    from workout_api.configs.database import async_session, engine
+    from workout_api.configs.settings import settings
+    from workout_api.atleta.models import AtletaModel
+    from workout_api.main import app
+
+    from benchmarks.seed import seed as popular
+
+    await popular(engine, atletas, categorias, centros, seed)
+    rng = random.Random(seed)
+    amostra = await carregar_amostra(async_session, 1000, rng)
+    selecionados = [c for c in CENARIOS if not cenarios or c.nome in cenarios]
+    contador = [0]
+    resultados: dict[str, Any] = {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for cenario in selecionados:
+                if aquecimento:
+                    await executar_cenario(client, cenario, amostra, aquecimento, 1, rng, contador)
+                resultados[cenario.nome] = await executar_cenario(
+                    client, cenario, amostra, requisicoes, concorrencia, rng, contador
+                )
+
+    async with engine.begin() as connection:
+        await connection.execute(delete(AtletaModel).where(AtletaModel.cpf.startswith(CPF_PREFIXO)))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "atletas": atletas,
+            "categorias": categorias,
+            "centros_treinamento": centros,
+            "concurrency": concorrencia,
+            "requests_per_endpoint": requisicoes,
+            "pool_size": settings.DB_POOL_SIZE,
+        },
+        "endpoints": resultados,
+    }
+
+
+def salvar(resultado: dict[str, Any], caminho: str) -> None:
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultado, arquivo, indent=2, ensure_ascii=False, sort_keys=True)
+        arquivo.write("\n")
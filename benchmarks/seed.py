@@ -0,0 +1,93 @@
+import random
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, insert, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.future import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.models import BaseModel
+# Registra todos os modelos (inclusive os de resultados) em BaseModel.metadata para o create_all
+import workout_api.contrib.repository.models  # noqa: F401
+
+NOMES = ("Ana", "Bruno", "Carla", "Diego", "Eduarda", "Felipe", "Gabriela", "Henrique", "Isabela", "João",
+         "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Thiago", "Vanessa", "William")
+SOBRENOMES = ("Almeida", "Barbosa", "Cardoso", "Dias", "Esteves", "Ferreira", "Gomes", "Lima", "Martins",
+              "Nunes", "Oliveira", "Pereira", "Ribeiro", "Santos", "Silva", "Souza", "Teixeira", "Vieira")
+CHUNK_SIZE = 5000
+
+
+@compiles(PG_UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw) -> str:
+    # Permite usar um arquivo SQLite como substituto local do PostgreSQL
+    return "CHAR(32)"
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(BaseModel.metadata.create_all)
+
+
+async def seed(engine: AsyncEngine, atletas: int, categorias: int, centros: int, seed: int = 42) -> int:
+    """Popula as tabelas de forma determinística; não faz nada se já houver `atletas` linhas."""
+    await create_schema(engine)
+
+    async with engine.connect() as connection:
+        existentes = await connection.scalar(select(func.count()).select_from(AtletaModel))
+    if existentes == atletas:
+        return existentes
+    if existentes:
+        raise RuntimeError(f"O banco já tem {existentes} atletas; use um banco vazio ou --atletas {existentes}")
+
+    rng = random.Random(seed)
+    async with engine.begin() as connection:
+        await connection.execute(insert(CategoriaModel), [
+            {"pk_id": i + 1, "id": _uuid(rng), "nome": f"Categoria {i + 1}"} for i in range(categorias)
+        ])
+        await connection.execute(insert(CentroTreinamentoModel), [
+            {"pk_id": i + 1, "id": _uuid(rng), "nome": f"CT {i + 1}", "endereco": f"Rua {i + 1}, {rng.randint(1, 999)}",
+             "proprietario": rng.choice(NOMES)}
+            for i in range(centros)
+        ])
+
+    inicio = datetime(2023, 1, 1)
+    for offset in range(0, atletas, CHUNK_SIZE):
+        rows = [
+            {
+                "pk_id": i + 1,
+                "id": _uuid(rng),
+                "nome": f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}",
+                "cpf": f"{i:011d}",
+                "idade": rng.randint(14, 70),
+                "peso": round(rng.uniform(45, 130), 1),
+                "altura": round(rng.uniform(1.45, 2.05), 2),
+                "sexo": rng.choice("MF"),
+                "created_at": inicio + timedelta(minutes=i),
+                "categoria_id": rng.randint(1, categorias),
+                "centro_treinamento_id": rng.randint(1, centros),
+            }
+            for i in range(offset, min(offset + CHUNK_SIZE, atletas))
+        ]
+        async with engine.begin() as connection:
+            await connection.execute(insert(AtletaModel), rows)
+
+    async with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            for table in ("categorias", "centros_treinamento", "atletas"):
+                await connection.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'pk_id'), (SELECT max(pk_id) FROM {table}))"
+                ))
+            await connection.execute(text("ANALYZE"))
+
+    return atletas
@@ -0,0 +1,58 @@
+import json
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi_pagination import Page
+from pydantic import TypeAdapter
+
+
+def _tempo(funcao: Callable[[], Any], repeticoes: int) -> float:
+    funcao()
+    inicio = perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (perf_counter() - inicio) / repeticoes
+
+
+def run(tamanhos: list[int], repeticoes: int) -> dict[str, Any]:
+    """Mede, sem banco, o custo de transformar uma página de objetos ORM na resposta JSON.
+
+    `atual`: Page validada a partir dos objetos (como o `paginate`), revalidada e serializada pelo FastAPI.
+    `rapido`: serializador pré-compilado do schema e `FastJSONResponse` (FAST_JSON_ENABLED).
+    """
+    from workout_api.centro_treinamento.schemas import CentroTreinamentoSchemaOut
+    from workout_api.contrib.repository.models import CentroTreinamentoModel
+    from workout_api.contrib.responses import FastJSONResponse, serialize_many
+
+    adapter = TypeAdapter(Page[CentroTreinamentoSchemaOut])
+    transformer = serialize_many(CentroTreinamentoSchemaOut)
+    resultados: dict[str, Any] = {}
+
+    for tamanho in tamanhos:
+        objetos = [
+            CentroTreinamentoModel(id=uuid4(), nome=f"CT {i}", endereco=f"Rua {i}, {i * 10}", proprietario="João")
+            for i in range(tamanho)
+        ]
+        pagina = {"total": tamanho * 10, "page": 1, "size": tamanho, "pages": 10}
+
+        def atual() -> bytes:
+            page = Page[CentroTreinamentoSchemaOut].model_validate({**pagina, "items": objetos}, from_attributes=True)
+            # Mesmo caminho do FastAPI: dump do modelo retornado, validação pelo response_model e dump em modo JSON
+            content = adapter.dump_python(adapter.validate_python(page.model_dump()), mode="json")
+            return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+        def rapido() -> bytes:
+            return FastJSONResponse({**pagina, "items": transformer(objetos)}).body
+
+        assert json.loads(atual()) == json.loads(rapido())
+
+        tempo_atual = _tempo(atual, repeticoes)
+        tempo_rapido = _tempo(rapido, repeticoes)
+        resultados[str(tamanho)] = {
+            "atual_us": round(tempo_atual * 1e6, 1),
+            "rapido_us": round(tempo_rapido * 1e6, 1),
+            "ganho": round(tempo_atual / tempo_rapido, 2),
+        }
+
+    return resultados
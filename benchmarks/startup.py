@@ -0,0 +1,128 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+from statistics import median
+from time import time
+from typing import Any, Optional
+
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+# Executado em um interpretador novo a cada rodada; recebe o instante em que o processo foi disparado
+SCRIPT = """
+import asyncio, json, sys
+from time import perf_counter, time
+
+disparo = float(sys.argv[1])
+lifespan = sys.argv[2] == "1"
+interpretador = time() - disparo
+inicio = perf_counter()
+
+from workout_api.main import app
+
+importacao = perf_counter() - inicio
+
+
+async def main():
+    fases = {"interpretador": interpretador, "importacao": importacao}
+
+    async def primeira_requisicao():
+        mensagens = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            mensagens.append(message)
+
+        antes = perf_counter()
+        await app({
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/openapi.json", "raw_path": b"/openapi.json", "query_string": b"", "root_path": "",
+            "headers": [], "client": ("127.0.0.1", 0), "server": ("startup", 80),
+        }, receive, send)
+        assert mensagens[0]["status"] == 200, mensagens[0]
+        fases["openapi"] = perf_counter() - antes
+        fases["pronto"] = time() - disparo
+
+    if lifespan:
+        antes = perf_counter()
+        async with app.router.lifespan_context(app):
+            fases["lifespan"] = perf_counter() - antes
+            await primeira_requisicao()
+    else:
+        await primeira_requisicao()
+
+    print(json.dumps(fases))
+
+
+asyncio.run(main())
+"""
+
+
+def _importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(módulo, próprio_us, cumulativo_us) de cada linha do `-X importtime`."""
+    modulos = []
+    for linha in stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(linha)
+        if match:
+            modulos.append((match[3], int(match[1]), int(match[2])))
+    return modulos
+
+
+def _rodada(lifespan: bool, env: dict[str, str]) -> dict[str, Any]:
+    disparo = time()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT, repr(disparo), "1" if lifespan else "0"],
+        capture_output=True, text=True, env=env,
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao iniciar a aplicação:\n{processo.stderr[-4000:]}")
+
+    fases = json.loads(processo.stdout.strip().splitlines()[-1])
+    return {"fases": fases, "modulos": _importtime(processo.stderr)}
+
+
+def _ms(segundos: float) -> float:
+    return round(segundos * 1000, 1)
+
+
+def run(rodadas: int, lifespan: bool = True, top: int = 15, db_url: Optional[str] = None) -> dict[str, Any]:
+    """Mede a partida a frio do worker: cada rodada é um processo novo que importa `workout_api.main`,
+    executa o lifespan e responde à primeira requisição (`/openapi.json`, chamada direto pelo ASGI).
+
+    `pronto_ms` vai do disparo do processo até essa resposta. O relatório de importação vem do
+    `-X importtime` da rodada mediana, agrupado por pacote (tempo próprio) e pelos módulos mais caros.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))}
+    if db_url:
+        env["DB_URL"] = db_url
+
+    # Primeira execução apenas compila os .pyc, como já estariam na imagem
+    _rodada(lifespan, env)
+    resultados = sorted((_rodada(lifespan, env) for _ in range(rodadas)), key=lambda r: r["fases"]["pronto"])
+    mediana = resultados[len(resultados) // 2]
+
+    por_pacote: Counter = Counter()
+    for modulo, proprio, _ in mediana["modulos"]:
+        por_pacote[modulo.split(".")[0]] += proprio
+    app = [modulo for modulo in mediana["modulos"] if modulo[0].split(".")[0] == "workout_api"]
+
+    fases = {nome: _ms(median(r["fases"].get(nome, 0.0) for r in resultados)) for nome in mediana["fases"]}
+    return {
+        "rodadas": rodadas,
+        "lifespan": lifespan,
+        "fases_ms": fases,
+        "pronto_ms": {
+            "min": _ms(resultados[0]["fases"]["pronto"]),
+            "mediana": fases["pronto"],
+            "max": _ms(resultados[-1]["fases"]["pronto"]),
+        },
+        "importacao_por_pacote_ms": {nome: round(us / 1000, 1) for nome, us in por_pacote.most_common(top)},
+        "modulos_workout_api_ms": {
+            modulo: {"proprio": round(proprio / 1000, 1), "cumulativo": round(cumulativo / 1000, 1)}
+            for modulo, proprio, cumulativo in sorted(app, key=lambda m: m[1], reverse=True)[:top]
+        },
+    }
@@ -0,0 +1,3 @@
+#!/bin/sh
+# Permite que o serviço db-replica se conecte para replicação (executado apenas na criação do banco)
+echo "host replication all all md5" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Antes de importar a aplicação: as configurações são lidas na importação
+DB_PATH = Path(tempfile.mkdtemp()) / "workout_api.sqlite"
+os.environ["DB_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["CHANGE_FEED_BACKEND"] = "memory"
+os.environ["DB_WARMUP"] = "false"
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from benchmarks.seed import seed  # noqa: E402
+from workout_api.atleta.cache import atletas_cache  # noqa: E402
+from workout_api.atleta.models import AtletaModel  # noqa: E402
+from workout_api.configs.database import async_session, engine  # noqa: E402
+from workout_api.contrib.models import BaseModel  # noqa: E402
+from workout_api.contrib.repository import reference  # noqa: E402
+from workout_api.main import app  # noqa: E402
+
+ATLETAS = 30
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """Banco SQLite recriado e populado de forma determinística a cada teste, com os caches vazios."""
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.drop_all)
+    await seed(engine, ATLETAS, categorias=2, centros=2)
+
+    await reference.clear()
+    await atletas_cache.clear()
+    yield async_session
+
+
+@pytest.fixture
+async def client(db):
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+
+@pytest.fixture
+async def atleta(db) -> AtletaModel:
+    async with db() as db_session:
+        return (await db_session.execute(select(AtletaModel).order_by(AtletaModel.pk_id).limit(1))).scalar_one()
@@ -0,0 +1,47 @@
+import pytest
+
+from workout_api.configs.database import admission
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sem_vaga_e_com_fila_cheia_responde_503(client, monkeypatch):
+    monkeypatch.setattr(admission, "fila_max", 0)
+    monkeypatch.setattr(admission, "em_uso", admission.limite("leitura"))
+
+    response = await client.get("/atletas/")
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+async def test_lote_nao_ocupa_as_vagas_das_leituras(client, monkeypatch):
+    monkeypatch.setattr(admission, "fila_max", 0)
+    monkeypatch.setattr(admission, "em_uso", admission.limite("lote"))
+
+    bulk = await client.post("/atletas/bulk", content=b"", headers={"content-type": "text/csv"})
+    leitura = await client.get("/atletas/")
+
+    assert bulk.status_code == 503
+    assert leitura.status_code == 200
+
+
+async def test_acerto_no_cache_nao_espera_vaga(client, atleta, monkeypatch):
+    params = {"id_atleta": str(atleta.id)}
+    assert (await client.get("/atletas/by", params=params)).status_code == 200
+
+    monkeypatch.setattr(admission, "fila_max", 0)
+    monkeypatch.setattr(admission, "em_uso", admission.limite("leitura"))
+
+    assert (await client.get("/atletas/by", params=params)).status_code == 200
+    assert (await client.get("/atletas/by", params={"cpf": atleta.cpf})).status_code == 503
+
+
+async def test_estatisticas_em_cache_nao_esperam_vaga(client, monkeypatch):
+    assert (await client.get("/atletas/stats")).status_code == 200
+
+    monkeypatch.setattr(admission, "fila_max", 0)
+    monkeypatch.setattr(admission, "em_uso", admission.limite("leitura"))
+
+    assert (await client.get("/atletas/stats")).status_code == 200
+    assert (await client.get("/atletas/stats", params={"group_by": "sexo"})).status_code == 503
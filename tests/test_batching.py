@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from workout_api.atleta.batching import atletas_writer
+from workout_api.configs.database import admission
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+
+def _atleta(cpf: str) -> dict:
+    return {"nome": "Ana", "cpf": cpf, "idade": 25, "peso": 60.5, "altura": 1.65, "sexo": "F",
+            "categoria": {"nome": "Categoria 1"}, "centro_treinamento": {"nome": "CT 1"}}
+
+
+async def test_lote_ocupa_uma_vaga_de_admissao(client, monkeypatch):
+    monkeypatch.setattr(settings, "WRITE_BATCH_ENABLED", True)
+    # Janela longa: o lote sai ao juntar as quatro criações, não por tempo
+    monkeypatch.setattr(atletas_writer, "window", 5.0)
+    monkeypatch.setattr(atletas_writer, "max_size", 4)
+    monkeypatch.setattr(admission, "capacidade_efetiva", 1.0)
+    admitidas = admission.admitidas["escrita"]
+
+    cpfs = ["90000000001", "90000000002", "90000000003", "90000000001"]
+    responses = await asyncio.gather(*(client.post("/atletas/", json=_atleta(cpf)) for cpf in cpfs))
+
+    assert [response.status_code for response in responses] == [201, 201, 201, 303]
+    assert admission.admitidas["escrita"] == admitidas + 1
+    assert admission.em_uso == 0
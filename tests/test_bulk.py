@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta import bulk
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+HEADER = "nome,cpf,idade,peso,altura,sexo,categoria,centro_treinamento\n"
+
+
+def _relatorio(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+async def test_csv_reporta_cada_linha(client, db):
+    body = (
+        HEADER
+        + "Ana,90000000001,25,60.5,1.65,F,Categoria 1,CT 1\n"
+        + "Ana de novo,90000000001,25,60.5,1.65,F,Categoria 1,CT 1\n"
+        + "Bia,90000000002,25,60.5,1.65,F,Inexistente,CT 1\n"
+        + '"Carla\nSouza",90000000003,30,61,1.7,F,Categoria 2,CT 2\n'
+    ).encode() + "Dora,90000000004,30,61,1.7,F,Categoria 2,CT 2\n".encode("latin-1").replace(b"Dora", b"D\xf3ra")
+
+    response = await client.post("/atletas/bulk", content=body, headers={"content-type": "text/csv"})
+
+    assert response.status_code == 200
+    linhas = {linha["linha"]: linha for linha in _relatorio(response)}
+    assert {numero: linha["status"] for numero, linha in linhas.items()} == {
+        2: "criado", 3: "duplicado", 4: "invalido", 5: "criado", 7: "invalido",
+    }
+    assert linhas[7]["erros"][0]["erro"] == bulk.ERRO_ENCODING
+    assert response.headers["X-Atletas-Criados"] == "2"
+
+    async with db() as db_session:
+        nome = await db_session.scalar(select(AtletaModel.nome).where(AtletaModel.cpf == "90000000003"))
+    assert nome == "Carla\nSouza"
+
+
+async def test_csv_aspas_nao_fechadas(client):
+    body = HEADER + '"Ana,90000000001,25,60.5,1.65,F,Categoria 1,CT 1\n'
+
+    response = await client.post("/atletas/bulk", content=body, headers={"content-type": "text/csv"})
+
+    assert [linha["status"] for linha in _relatorio(response)] == ["invalido"]
+
+
+async def test_falha_de_um_lote_nao_descarta_o_relatorio(client, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "BULK_BATCH_SIZE", 1)
+    insert_atletas = bulk.insert_atletas
+
+    async def falha_no_primeiro(db_session, values):
+        if values[0]["cpf"] == "90000000001":
+            raise RuntimeError("conexão perdida")
+        return await insert_atletas(db_session, values)
+
+    monkeypatch.setattr(bulk, "insert_atletas", falha_no_primeiro)
+    body = "\n".join(
+        json.dumps({"nome": "Ana", "cpf": cpf, "idade": 25, "peso": 60.5, "altura": 1.65, "sexo": "F",
+                    "categoria": {"nome": "Categoria 1"}, "centro_treinamento": {"nome": "CT 1"}})
+        for cpf in ("90000000001", "90000000002")
+    )
+
+    response = await client.post("/atletas/bulk", content=body, headers={"content-type": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert [linha["status"] for linha in _relatorio(response)] == ["erro", "criado"]
+    assert response.headers["X-Atletas-Com-Erro"] == "1"
+    assert "conexão perdida" in caplog.text
+
+
+def _ndjson(cpf: str) -> str:
+    return json.dumps({"nome": "Ana", "cpf": cpf, "idade": 25, "peso": 60.5, "altura": 1.65, "sexo": "F",
+                       "categoria": {"nome": "Categoria 1"}, "centro_treinamento": {"nome": "CT 1"}})
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1000])
+async def test_linha_longa_vira_invalida_sem_interromper(client, monkeypatch, chunk_size):
+    monkeypatch.setattr(settings, "BULK_BATCH_SIZE", 1)
+    body = "\n".join(
+        [_ndjson("90000000001"), "x" * (bulk.MAX_LINE_SIZE + 10), _ndjson("90000000002")]
+    ).encode()
+
+    async def chunks():
+        for inicio in range(0, len(body), chunk_size):
+            yield body[inicio:inicio + chunk_size]
+
+    response = await client.post("/atletas/bulk", content=body if chunk_size is None else chunks(),
+                                 headers={"content-type": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    relatorio = _relatorio(response)
+    assert [(linha["linha"], linha["status"]) for linha in relatorio] == [(1, "criado"), (2, "invalido"),
+                                                                          (3, "criado")]
+    assert relatorio[1]["erros"][0]["erro"] == bulk.ERRO_TAMANHO
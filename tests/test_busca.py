@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+
+pytestmark = pytest.mark.anyio
+
+ESPECIAIS = ["Ana_Paula Souza", "Ana Paula 100% Souza", "AnaXPaula Souza"]
+
+
+def _atleta(nome: str, cpf: str) -> dict:
+    return {"nome": nome, "cpf": cpf, "idade": 25, "peso": 60.5, "altura": 1.65, "sexo": "F",
+            "categoria": {"nome": "Categoria 1"}, "centro_treinamento": {"nome": "CT 1"}}
+
+
+async def _nomes(client, **params) -> list[str]:
+    response = await client.get("/atletas/busca", params={"fields": "nome", "size": 100, **params})
+    assert response.status_code == 200
+    return [item["nome"] for item in response.json()["items"]]
+
+
+@pytest.fixture
+async def especiais(client):
+    for i, nome in enumerate(ESPECIAIS):
+        assert (await client.post("/atletas/", json=_atleta(nome, f"9{i:010d}"))).status_code == 201
+
+
+async def test_prefixo(client, db):
+    async with db() as db_session:
+        nomes = list(await db_session.scalars(select(AtletaModel.nome).order_by(AtletaModel.nome, AtletaModel.pk_id)))
+    prefixo = nomes[0].split()[0]
+
+    assert await _nomes(client, nome=prefixo) == [nome for nome in nomes if nome.startswith(prefixo)]
+
+
+async def test_trecho_ignora_maiusculas(client, db):
+    async with db() as db_session:
+        nomes = list(await db_session.scalars(select(AtletaModel.nome).order_by(AtletaModel.nome, AtletaModel.pk_id)))
+    trecho = nomes[0].split()[-1][1:].upper()
+
+    encontrados = await _nomes(client, nome=trecho, modo="trecho")
+
+    assert encontrados == [nome for nome in nomes if trecho.lower() in nome.lower()]
+    assert encontrados
+
+
+async def test_trecho_curto_rejeitado(client):
+    response = await client.get("/atletas/busca", params={"nome": "an", "modo": "trecho"})
+
+    assert response.status_code == 400
+
+
+async def test_curingas_sao_literais(client, especiais):
+    assert await _nomes(client, nome="Ana_") == ["Ana_Paula Souza"]
+    assert await _nomes(client, nome="100%", modo="trecho") == ["Ana Paula 100% Souza"]
+    assert await _nomes(client, nome="a_p", modo="trecho") == ["Ana_Paula Souza"]
+    assert await _nomes(client, nome="%", modo="prefixo") == []
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import update
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.contrib.changes import ChangeEvent, MemoryChangeFeed, PostgresChangeFeed, change_feed
+from workout_api.contrib.repository import reference
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_evento_de_outro_worker_invalida_o_cache(client, db, atleta):
+    assert isinstance(change_feed, MemoryChangeFeed)
+    params = {"id_atleta": str(atleta.id)}
+    peso = (await client.get("/atletas/by", params=params)).json()["peso"]
+
+    # Escrita feita por outro worker: este só fica sabendo pelo evento
+    async with db() as db_session:
+        await db_session.execute(update(AtletaModel).where(AtletaModel.pk_id == atleta.pk_id).values(peso=peso + 1))
+        await db_session.commit()
+
+    assert (await client.get("/atletas/by", params=params)).json()["peso"] == peso
+
+    await change_feed.dispatch(ChangeEvent("atleta", "atualizado", [str(atleta.id)], origem="outro-worker"))
+
+    assert (await client.get("/atletas/by", params=params)).json()["peso"] == peso + 1
+
+
+async def test_sse_entrega_as_alteracoes(client, atleta):
+    stream = asyncio.create_task(client.get("/atletas/changes"))
+    for _ in range(100):
+        if change_feed.subscriptions:
+            break
+        await asyncio.sleep(0.01)
+
+    await client.patch(f"/atletas/{atleta.id}", json={"peso": 80.5})
+
+    # O transporte ASGI do httpx só devolve a resposta quando o stream termina
+    for subscription in list(change_feed.subscriptions):
+        change_feed.unsubscribe(subscription)
+        subscription.close()
+    response = await asyncio.wait_for(stream, timeout=5)
+
+    blocos = [bloco for bloco in response.text.split("\n\n") if bloco.startswith("event:")]
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert len(blocos) == 1
+    evento, dados = blocos[0].split("\n")
+    assert evento == "event: atleta"
+    assert json.loads(dados.removeprefix("data: "))["ids"] == [str(atleta.id)]
+
+
+async def test_notificacoes_sao_distribuidas_e_falhas_registradas(caplog):
+    feed = PostgresChangeFeed("postgresql://localhost/workout", "canal", engine=None)
+    recebidos = []
+
+    async def handler(event: ChangeEvent) -> None:
+        recebidos.append(event.ids)
+
+    feed.on("atleta", handler)
+    feed._on_notification(None, 0, "canal", ChangeEvent("atleta", "criado", ["1"], origem="outro-worker").to_json())
+    feed._on_notification(None, 0, "canal", "não é JSON")
+
+    assert len(feed._dispatches) == 2
+    await asyncio.gather(*feed._dispatches)
+
+    assert recebidos == [["1"]]
+    assert "Falha ao distribuir notificação" in caplog.text
+
+
+async def test_referencias_invalidadas_apenas_pela_propria_entidade(db):
+    centro = await reference.centros_treinamento.by_nome("CT 1")
+    chave = ("id", centro.data.id)
+
+    await reference.on_change(ChangeEvent("atleta", "criado", [str(centro.data.id)], origem="outro-worker"))
+    assert reference.centros_treinamento.cache.peek(chave) is not None
+
+    await reference.on_change(ChangeEvent("centro_treinamento", "criado", [str(centro.data.id)], origem="outro-worker"))
+    assert reference.centros_treinamento.cache.peek(chave) is None
@@ -0,0 +1,45 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_listagem_revalidada_por_etag(client):
+    response = await client.get("/categorias/")
+    etag = response.headers["ETag"]
+
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+
+    revalidada = await client.get("/categorias/", headers={"If-None-Match": etag})
+    assert revalidada.status_code == 304
+    assert revalidada.headers["Cache-Control"] == "public, max-age=60"
+
+    await client.post("/categorias/", json={"nome": "Nova"})
+    alterada = await client.get("/categorias/", headers={"If-None-Match": etag})
+    assert alterada.status_code == 200
+    assert alterada.headers["ETag"] != etag
+
+
+async def test_atletas_aninhados_nao_vao_para_caches_compartilhados(client):
+    categoria = (await client.get("/categorias/")).json()["items"][0]
+    centro = (await client.get("/centros_treinamento/")).json()["items"][0]
+
+    for path in (f"/categorias/{categoria['id']}/atletas", f"/centros_treinamento/{centro['id']}/atletas"):
+        response = await client.get(path)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    assert (await client.get(f"/categorias/{categoria['id']}")).headers["Cache-Control"] == "public, max-age=60"
+
+
+async def test_atleta_alterado_muda_etag(client, atleta):
+    response = await client.get("/atletas/by", params={"id_atleta": str(atleta.id)})
+    etag = response.headers["ETag"]
+
+    assert (await client.get("/atletas/by", params={"id_atleta": str(atleta.id)},
+                             headers={"If-None-Match": etag})).status_code == 304
+
+    await client.patch(f"/atletas/{atleta.id}", json={"peso": 99.5})
+    response = await client.get("/atletas/by", params={"id_atleta": str(atleta.id)}, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["peso"] == 99.5
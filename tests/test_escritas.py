@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from workout_api.atleta.models import AtletaModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def _atletas(db, quantidade: int) -> list[AtletaModel]:
+    async with db() as db_session:
+        return (await db_session.scalars(select(AtletaModel).order_by(AtletaModel.pk_id).limit(quantidade))).all()
+
+
+async def test_patch_com_nova_categoria_retorna_os_nomes(client, atleta):
+    categoria = "Categoria 2" if atleta.categoria.nome == "Categoria 1" else "Categoria 1"
+
+    response = await client.patch(f"/atletas/{atleta.id}", json={"nome": "Novo Nome", "categoria": {"nome": categoria}})
+
+    assert response.status_code == 200
+    assert response.json() | {"created_at": None} == {
+        "id": str(atleta.id), "nome": "Novo Nome", "cpf": atleta.cpf, "idade": atleta.idade, "peso": atleta.peso,
+        "altura": atleta.altura, "sexo": atleta.sexo, "created_at": None,
+        "categoria": {"nome": categoria}, "centro_treinamento": {"nome": atleta.centro_treinamento.nome},
+    }
+
+
+async def test_patch_com_categoria_inexistente(client, atleta):
+    response = await client.patch(f"/atletas/{atleta.id}", json={"categoria": {"nome": "Inexistente"}})
+
+    assert response.status_code == 400
+
+
+async def test_patch_com_cpf_repetido(client, db):
+    primeiro, segundo = await _atletas(db, 2)
+
+    response = await client.patch(f"/atletas/{primeiro.id}", json={"cpf": segundo.cpf})
+
+    assert response.status_code == 303
+
+
+async def test_patch_de_atleta_inexistente(client):
+    response = await client.patch(f"/atletas/{uuid4()}", json={"nome": "Ninguém"})
+
+    assert response.status_code == 404
+
+
+async def test_patch_em_lote_retorna_apenas_os_existentes(client, db):
+    atletas = await _atletas(db, 3)
+    ids = [str(atleta.id) for atleta in atletas]
+
+    response = await client.patch("/atletas/", json={"ids": [*ids, str(uuid4())], "atleta": {"idade": 99}})
+
+    assert response.status_code == 200
+    assert sorted(item["id"] for item in response.json()) == sorted(ids)
+    assert all(item["idade"] == 99 for item in response.json())
+
+
+async def test_patch_em_lote_nao_altera_cpf(client, atleta):
+    response = await client.patch("/atletas/", json={"ids": [str(atleta.id)], "atleta": {"cpf": "99999999999"}})
+
+    assert response.status_code == 400
+
+
+async def test_delete_em_lote_retorna_os_removidos(client, db):
+    ids = [atleta.id for atleta in await _atletas(db, 2)]
+
+    response = await client.delete("/atletas/", params={"ids": [*map(str, ids), str(uuid4())]})
+
+    assert response.status_code == 200
+    assert sorted(response.json()) == sorted(map(str, ids))
+    async with db() as db_session:
+        assert await db_session.scalar(select(func.count()).where(AtletaModel.id.in_(ids))) == 0
+
+
+async def test_delete_de_atleta_inexistente(client, atleta):
+    assert (await client.delete(f"/atletas/{atleta.id}")).status_code == 204
+    assert (await client.delete(f"/atletas/{atleta.id}")).status_code == 404
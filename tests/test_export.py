@@ -0,0 +1,64 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta import export
+from workout_api.atleta.models import AtletaModel
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def esperados(db) -> list[dict]:
+    async with db() as db_session:
+        atletas = (await db_session.scalars(select(AtletaModel).order_by(AtletaModel.pk_id))).all()
+
+    return [
+        {"id": str(atleta.id), "nome": atleta.nome, "cpf": atleta.cpf, "idade": atleta.idade, "peso": atleta.peso,
+         "altura": atleta.altura, "sexo": atleta.sexo, "created_at": atleta.created_at.isoformat(),
+         "categoria": atleta.categoria.nome, "centro_treinamento": atleta.centro_treinamento.nome}
+        for atleta in atletas
+    ]
+
+
+def _ndjson(body: bytes) -> list[dict]:
+    linhas = [json.loads(linha) for linha in body.decode().splitlines()]
+    for linha in linhas:
+        linha.update(categoria=linha["categoria"]["nome"], centro_treinamento=linha["centro_treinamento"]["nome"])
+    return linhas
+
+
+def _csv(body: bytes) -> list[dict]:
+    linhas = list(csv.DictReader(io.StringIO(body.decode())))
+    for linha in linhas:
+        linha.update(idade=int(linha["idade"]), peso=float(linha["peso"]), altura=float(linha["altura"]))
+    return linhas
+
+
+@pytest.mark.parametrize("formato, media_type, ler", [
+    ("ndjson", "application/x-ndjson", _ndjson),
+    ("csv", "text/csv", _csv),
+])
+async def test_exporta_todos_os_atletas(client, esperados, monkeypatch, formato, media_type, ler):
+    # Partições pequenas: o arquivo é montado a partir de várias leituras do cursor
+    monkeypatch.setattr(export, "PARTITION_SIZE", 7)
+
+    response = await client.get("/atletas/export", params={"formato": formato})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(media_type)
+    assert response.headers["Content-Disposition"] == f'attachment; filename="atletas.{formato}"'
+    assert ler(response.content) == esperados
+
+
+@pytest.mark.parametrize("formato, ler", [("ndjson", _ndjson), ("csv", _csv)])
+async def test_exporta_compactado(client, esperados, formato, ler):
+    response = await client.get("/atletas/export", params={"formato": formato, "gzip": True})
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["Content-Disposition"] == f'attachment; filename="atletas.{formato}.gz"'
+    assert ler(gzip.decompress(response.content)) == esperados
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_repeticao_recebe_a_resposta_original(client):
+    headers = {"Idempotency-Key": "categoria-nova"}
+
+    primeira = await client.post("/categorias/", json={"nome": "Nova"}, headers=headers)
+    repetida = await client.post("/categorias/", json={"nome": "Nova"}, headers=headers)
+
+    assert primeira.status_code == repetida.status_code == 201
+    assert repetida.json() == primeira.json()
+    assert repetida.headers["Idempotent-Replayed"] == "true"
+
+
+async def test_mesma_chave_com_outro_corpo(client):
+    headers = {"Idempotency-Key": "categoria-outra"}
+
+    await client.post("/categorias/", json={"nome": "Outra"}, headers=headers)
+    response = await client.post("/categorias/", json={"nome": "Diferente"}, headers=headers)
+
+    assert response.status_code == 422
+
+
+async def test_chave_vale_por_cliente(client):
+    primeira = await client.post("/categorias/", json={"nome": "Mista"},
+                                 headers={"Idempotency-Key": "k", "Authorization": "Bearer a"})
+    outro_cliente = await client.post("/categorias/", json={"nome": "Mista"},
+                                      headers={"Idempotency-Key": "k", "Authorization": "Bearer b"})
+
+    assert primeira.status_code == 201
+    assert outro_cliente.status_code == 303
+    assert "Idempotent-Replayed" not in outro_cliente.headers
+
+
+async def test_patch_com_cpf_existente(client, db, atleta):
+    async with db() as db_session:
+        cpf = await db_session.scalar(select(AtletaModel.cpf).where(AtletaModel.pk_id != atleta.pk_id).limit(1))
+
+    response = await client.patch(f"/atletas/{atleta.id}", json={"cpf": cpf})
+
+    assert response.status_code == 303
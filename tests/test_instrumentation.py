@@ -0,0 +1,74 @@
+import logging
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from workout_api.configs.database import engine
+from workout_api.contrib.instrumentation import InstrumentationMiddleware, Metrics, RequestStats
+
+pytestmark = pytest.mark.anyio
+
+
+def _amostras(texto: str, nome: str) -> dict[str, str]:
+    return dict(linha.rsplit(" ", 1) for linha in texto.splitlines() if linha.startswith(nome))
+
+
+def test_histograma_acumulado():
+    registry = Metrics()
+    for duracao in (0.003, 0.02, 0.02, 0.3, 20.0):
+        registry.observe("GET", "/atletas/", 200, duracao, RequestStats(queries=2))
+
+    buckets = _amostras(registry.render(), "http_request_duration_seconds_bucket")
+    labels = 'method="GET",route="/atletas/"'
+
+    assert buckets[f'http_request_duration_seconds_bucket{{{labels},le="0.005"}}'] == "1"
+    assert buckets[f'http_request_duration_seconds_bucket{{{labels},le="0.025"}}'] == "3"
+    assert buckets[f'http_request_duration_seconds_bucket{{{labels},le="0.5"}}'] == "4"
+    assert buckets[f'http_request_duration_seconds_bucket{{{labels},le="10.0"}}'] == "4"
+    assert buckets[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == "5"
+    assert _amostras(registry.render(), "db_queries_total") == {f"db_queries_total{{{labels}}}": "10"}
+
+
+def test_labels_escapados():
+    registry = Metrics()
+    registry.observe("GET", 'a"b\\c\nd', 200, 0.01, RequestStats())
+
+    assert 'route="a\\"b\\\\c\\nd"' in registry.render()
+    assert all(linha.startswith(("#", "http_", "db_", "response_")) for linha in registry.render().splitlines())
+
+
+def test_coletores_incluidos():
+    registry = Metrics()
+    registry.collectors.append(lambda: ["# TYPE minha_metrica gauge", "minha_metrica 7"])
+
+    assert registry.render().endswith("# TYPE minha_metrica gauge\nminha_metrica 7\n")
+
+
+async def test_consulta_repetida_gera_aviso(caplog):
+    async def app(scope, receive, send):
+        async with engine.connect() as connection:
+            for _ in range(3):
+                await connection.execute(text("SELECT 1"))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    registry = Metrics()
+    middleware = InstrumentationMiddleware(app, repeat_threshold=2, registry=registry)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test") as client:
+        with caplog.at_level(logging.WARNING, logger="workout_api.contrib.instrumentation"):
+            response = await client.get("/qualquer")
+
+    assert 'desc="3 queries"' in response.headers["Server-Timing"]
+    assert "GET unmatched executou 3 vezes a mesma consulta (possível N+1): SELECT 1" in caplog.text
+    assert registry.requests == {("GET", "unmatched", 200): 1}
+
+
+async def test_endpoint_de_metricas(client):
+    await client.get("/atletas/cursor")
+
+    response = await client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/atletas/cursor",status="200"}' in response.text
+    assert "admission_in_use" in response.text
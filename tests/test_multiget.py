@@ -0,0 +1,64 @@
+import asyncio
+import re
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.contrib.dataloader import DataLoader
+
+pytestmark = pytest.mark.anyio
+
+
+def _queries(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"])[1])
+
+
+async def test_busca_por_ids_e_cpfs_em_uma_consulta_por_chave(client, db):
+    async with db() as db_session:
+        atletas = (await db_session.execute(select(AtletaModel.id, AtletaModel.cpf).limit(3))).all()
+    ausente = uuid4()
+
+    response = await client.post("/atletas/batch", json={
+        "ids": [str(atletas[1].id), str(ausente), str(atletas[0].id)],
+        "cpfs": [atletas[2].cpf, "99999999999"],
+    })
+
+    body = response.json()
+    assert [item["cpf"] for item in body["items"]] == [atletas[1].cpf, atletas[0].cpf, atletas[2].cpf]
+    assert body["ausentes"] == [str(ausente), "99999999999"]
+    assert _queries(response) == 2
+
+
+async def test_categorias_por_id(client):
+    categorias = (await client.get("/categorias/")).json()["items"]
+    ausente = str(uuid4())
+
+    response = await client.post("/categorias/batch", json={"ids": [ausente, *(c["id"] for c in categorias)]})
+
+    assert response.json() == {"items": categorias, "ausentes": [ausente]}
+
+
+async def test_dataloader_agrupa_e_entrega_falhas_a_todos():
+    lotes = []
+
+    async def batch_load(keys: list[int]) -> dict[int, int]:
+        lotes.append(keys)
+        if 0 in keys:
+            raise ValueError("falha no lote")
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = DataLoader(batch_load)
+    cancelada = asyncio.create_task(loader.load(1))
+    resultados = asyncio.gather(loader.load_many([2, 3, 2]), loader.load(4))
+    await asyncio.sleep(0)
+    cancelada.cancel()
+
+    assert await asyncio.wait_for(resultados, 1) == [[20, None, 20], 40]
+    assert lotes == [[1, 2, 3, 4]]
+    assert not loader._tasks
+
+    falhas = await asyncio.gather(loader.load(0), loader.load(5), return_exceptions=True)
+    assert [type(falha) for falha in falhas] == [ValueError, ValueError]
+    assert await loader.load(1) == 10
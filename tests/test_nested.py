@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import func, select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+pytestmark = pytest.mark.anyio
+
+GRUPOS = [
+    ("/categorias", CategoriaModel, AtletaModel.categoria_id),
+    ("/centros_treinamento", CentroTreinamentoModel, AtletaModel.centro_treinamento_id),
+]
+
+
+@pytest.mark.parametrize("prefixo, model, foreign_key", GRUPOS)
+async def test_atletas_do_grupo_em_ordem_com_total(client, db, prefixo, model, foreign_key):
+    async with db() as db_session:
+        grupos = (await db_session.execute(select(model.id, model.pk_id))).all()
+
+        for grupo in grupos:
+            params = {"size": 100, "fields": "nome", "include_total": True}
+            page = (await client.get(f"{prefixo}/{grupo.id}/atletas", params=params)).json()
+            esperados = await db_session.scalars(
+                select(AtletaModel.nome).where(foreign_key == grupo.pk_id).order_by(AtletaModel.nome, AtletaModel.pk_id)
+            )
+
+            assert page["items"] == [{"nome": nome} for nome in esperados]
+            assert page["total"] == len(page["items"])
+
+
+@pytest.mark.parametrize("prefixo, model, foreign_key", GRUPOS)
+async def test_totais(client, db, prefixo, model, foreign_key):
+    async with db() as db_session:
+        contagem = dict((await db_session.execute(
+            select(model.nome, func.count(AtletaModel.pk_id)).outerjoin(AtletaModel, foreign_key == model.pk_id)
+            .group_by(model.nome)
+        )).all())
+
+    totais = (await client.get(f"{prefixo}/totais")).json()
+
+    assert {total["nome"]: total["total_atletas"] for total in totais} == contagem
+    assert [total["nome"] for total in totais] == sorted(contagem)
+
+
+async def test_total_apenas_quando_pedido_e_atualizado_apos_escritas(client, db, atleta):
+    async with db() as db_session:
+        categoria = await db_session.scalar(
+            select(CategoriaModel.id).where(CategoriaModel.pk_id == atleta.categoria_id)
+        )
+    url = f"/categorias/{categoria}/atletas"
+
+    assert (await client.get(url)).json()["total"] is None
+    total = (await client.get(url, params={"include_total": True})).json()["total"]
+
+    await client.delete(f"/atletas/{atleta.id}")
+
+    assert (await client.get(url, params={"include_total": True})).json()["total"] == total - 1
+
+
+async def test_grupo_inexistente(client):
+    response = await client.get("/categorias/00000000-0000-4000-8000-000000000000/atletas")
+
+    assert response.status_code == 404
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+async def test_cursor_percorre_todos_os_atletas_em_ordem(client, db, monkeypatch, fast_json):
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", fast_json)
+    nomes, params = [], {"size": 7, "include_total": True}
+
+    while True:
+        page = (await client.get("/atletas/cursor", params=params)).json()
+        total = page["total"]
+        nomes.extend(item["nome"] for item in page["items"])
+        if page["next_page"] is None:
+            break
+        params["cursor"] = page["next_page"]
+
+    async with db() as db_session:
+        esperados = (await db_session.scalars(select(AtletaModel.nome).order_by(AtletaModel.nome, AtletaModel.pk_id)))
+        assert nomes == list(esperados)
+    assert total == len(nomes)
+
+
+async def test_cursor_invalido(client):
+    response = await client.get("/atletas/cursor", params={"cursor": "nao-e-um-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,50 @@
+import httpx
+import pytest
+
+from workout_api.contrib.profiler import ProfilerMiddleware, SamplingProfiler
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+async def _perfilar(profiler: SamplingProfiler, requisicoes: int = 20) -> None:
+    transport = httpx.ASGITransport(app=ProfilerMiddleware(app, profiler))
+    profiler.start()
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for _ in range(requisicoes):
+                assert (await client.get("/atletas/cursor", params={"size": 30})).status_code == 200
+    finally:
+        profiler.stop()
+
+
+async def test_pilhas_das_requisicoes_lentas_agregadas_por_rota(client):
+    profiler = SamplingProfiler(intervalo=0.0005, limiar=0.0, taxa=1.0, max_pilhas=10_000)
+
+    await _perfilar(profiler)
+
+    linhas = profiler.collapsed("/atletas").splitlines()
+    assert profiler.amostradas == 20
+    assert profiler.lentas == {"GET /atletas/cursor": 20}
+    assert linhas and all(linha.startswith("GET /atletas/cursor;") for linha in linhas)
+    assert any("workout_api.atleta.controller:query_cursor" in linha for linha in linhas)
+    assert profiler.collapsed("/categorias") == ""
+
+
+async def test_requisicoes_abaixo_do_limiar_nao_entram_no_perfil(client):
+    profiler = SamplingProfiler(intervalo=0.0005, limiar=60.0, taxa=1.0, max_pilhas=10_000)
+
+    await _perfilar(profiler)
+
+    assert profiler.amostradas == 20
+    assert not profiler.lentas
+    assert profiler.collapsed() == ""
+
+
+async def test_pilhas_alem_do_limite_sao_descartadas(client):
+    profiler = SamplingProfiler(intervalo=0.0005, limiar=0.0, taxa=1.0, max_pilhas=1)
+
+    await _perfilar(profiler)
+
+    assert len(profiler.pilhas) == 1
+    assert profiler.descartadas > 0
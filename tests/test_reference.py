@@ -0,0 +1,85 @@
+from time import monotonic
+
+import pytest
+from sqlalchemy import update
+
+from workout_api.categorias.models import CategoriaModel
+from workout_api.contrib import cache as cache_module
+from workout_api.contrib.changes import ChangeEvent
+from workout_api.contrib.repository import reference
+
+pytestmark = pytest.mark.anyio
+
+
+def _queries(response) -> str:
+    return response.headers["Server-Timing"].split('desc="', 1)[1].split('"', 1)[0]
+
+
+async def test_segunda_busca_vem_do_cache(client):
+    categoria = await reference.categorias.by_nome("Categoria 1")
+    stats = reference.categorias.stats()
+
+    response = await client.get(f"/categorias/{categoria.data.id}")
+
+    assert response.json()["nome"] == "Categoria 1"
+    assert _queries(response) == "0 queries"
+    assert reference.categorias.stats()["hits"] == stats["hits"] + 1
+
+
+async def test_criacao_entra_no_cache_e_muda_a_listagem(client):
+    antes = (await client.get("/categorias/")).json()["items"]
+
+    criada = (await client.post("/categorias/", json={"nome": "Nova"})).json()
+
+    response = await client.get(f"/categorias/{criada['id']}")
+    assert _queries(response) == "0 queries"
+    assert [item["nome"] for item in (await client.get("/categorias/")).json()["items"]] == sorted(
+        [*(item["nome"] for item in antes), "Nova"]
+    )
+
+
+async def test_alteracao_de_outro_worker_invalida_por_id_e_nome(db):
+    categoria = await reference.categorias.by_nome("Categoria 1")
+    async with db() as db_session:
+        await db_session.execute(update(CategoriaModel).where(CategoriaModel.pk_id == categoria.pk_id)
+                                 .values(nome="Renomeada"))
+        await db_session.commit()
+
+    assert (await reference.categorias.by_id(categoria.data.id)).data.nome == "Categoria 1"
+
+    await reference.on_change(ChangeEvent("categoria", "atualizado", [str(categoria.data.id)], origem="outro-worker"))
+
+    assert await reference.categorias.by_nome("Categoria 1") is None
+    assert (await reference.categorias.by_id(categoria.data.id)).data.nome == "Renomeada"
+
+
+async def test_invalidacao_por_nome(db):
+    centro = await reference.centros_treinamento.by_nome("CT 1")
+
+    reference.centros_treinamento.invalidate(nome="CT 1")
+
+    assert reference.centros_treinamento.cache.peek(("id", centro.data.id)) is None
+    assert (await reference.centros_treinamento.by_nome("CT 1")).data.id == centro.data.id
+
+
+async def test_entradas_expiram_apos_o_ttl(db, monkeypatch):
+    await reference.categorias.by_nome("Categoria 1")
+    misses = reference.categorias.stats()["misses"]
+
+    expirado = monotonic() + reference.categorias.cache.ttl + 1
+    monkeypatch.setattr(cache_module, "monotonic", lambda: expirado)
+
+    assert (await reference.categorias.by_nome("Categoria 1")).data.nome == "Categoria 1"
+    assert reference.categorias.stats()["misses"] == misses + 1
+
+
+async def test_metricas(db):
+    await reference.categorias.by_nome("Categoria 1")
+    await reference.categorias.by_nome("Categoria 1")
+    stats = reference.categorias.stats()
+
+    linhas = list(reference.metrics())
+
+    assert f'reference_cache_hits_total{{cache="categorias"}} {stats["hits"]}' in linhas
+    assert f'reference_cache_misses_total{{cache="categorias"}} {stats["misses"]}' in linhas
+    assert 'reference_cache_size{cache="categorias"} 2' in linhas
@@ -0,0 +1,68 @@
+import shutil
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from workout_api.configs import database
+from workout_api.contrib.replicas import STICKY_COOKIE, ReadYourWritesMiddleware, ReplicaSet
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replicas(client, tmp_path, monkeypatch):
+    """Réplica atrasada: cópia do banco feita antes das escritas do teste."""
+    copia = tmp_path / "replica.sqlite"
+    shutil.copy(database.engine.url.database, copia)
+
+    replicas = ReplicaSet([create_async_engine(f"sqlite+aiosqlite:///{copia}")], max_lag=5.0, interval=60.0)
+    await replicas.check()
+    monkeypatch.setattr(database, "replicas", replicas)
+    yield replicas
+    await replicas.stop()
+
+
+def _cliente() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=ReadYourWritesMiddleware(app, window=10.0)), base_url="http://test"
+    )
+
+
+async def _total(client: httpx.AsyncClient) -> int:
+    return (await client.get("/atletas/cursor", params={"size": 1, "include_total": True})).json()["total"]
+
+
+async def test_leituras_vao_a_replica_e_quem_escreveu_le_do_primario(replicas, atleta):
+    async with _cliente() as escritor, _cliente() as leitor:
+        response = await escritor.delete(f"/atletas/{atleta.id}")
+
+        assert STICKY_COOKIE in response.cookies
+        assert await _total(escritor) == 29
+        assert await _total(leitor) == 30
+
+    assert replicas.replicas[0].leituras == 1
+    assert replicas.leituras_primario == 1
+
+
+async def test_consultas_por_post_nao_fixam_o_primario(replicas, atleta):
+    async with _cliente() as client:
+        response = await client.post("/atletas/batch", json={"ids": [str(atleta.id)]})
+
+    assert response.status_code == 200
+    assert STICKY_COOKIE not in response.cookies
+
+
+async def test_replica_indisponivel_deixa_de_receber_leituras(client, tmp_path, monkeypatch):
+    replicas = ReplicaSet(
+        [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'inexistente' / 'replica.sqlite'}")],
+        max_lag=5.0, interval=60.0,
+    )
+    await replicas.check()
+    monkeypatch.setattr(database, "replicas", replicas)
+
+    assert await _total(client) == 30
+    assert not replicas.replicas[0].saudavel
+    assert replicas.leituras_primario == 1
+    await replicas.stop()
@@ -0,0 +1,87 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from workout_api.contrib.response_cache import MemoryBackend, ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+
+class Sessoes:
+    def __init__(self) -> None:
+        self.abertas = 0
+        self.fechadas = 0
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.abertas += 1
+        try:
+            yield object()
+        finally:
+            self.fechadas += 1
+
+
+async def test_carga_concorrente_executa_uma_vez_em_sessao_propria():
+    sessoes = Sessoes()
+    cache = ResponseCache(MemoryBackend(maxsize=10, ttl=60), sessoes)
+    liberar = asyncio.Event()
+    chamadas = 0
+
+    async def loader(db_session):
+        nonlocal chamadas
+        chamadas += 1
+        await liberar.wait()
+        return b"corpo", ["atletas"]
+
+    primeira = asyncio.create_task(cache.get_or_load("chave", loader))
+    segunda = asyncio.create_task(cache.get_or_load("chave", loader))
+    await asyncio.sleep(0)
+
+    # Quem iniciou a carga desiste; quem aguardava recebe o resultado mesmo assim
+    primeira.cancel()
+    liberar.set()
+
+    assert await segunda == b"corpo"
+    assert chamadas == 1
+    assert sessoes.abertas == sessoes.fechadas == 1
+    assert await cache.backend.get("chave") == b"corpo"
+
+
+async def test_invalidacao_durante_a_carga_nao_grava_o_corpo_anterior():
+    cache = ResponseCache(MemoryBackend(maxsize=10, ttl=60), Sessoes())
+    liberar = asyncio.Event()
+    versoes = iter([b"antes", b"depois"])
+
+    async def loader(db_session):
+        corpo = next(versoes)
+        if corpo == b"antes":
+            await liberar.wait()
+        return corpo, ["atleta:1"]
+
+    antiga = asyncio.create_task(cache.get_or_load("chave", loader))
+    await asyncio.sleep(0)
+    await cache.invalidate("atleta:1")
+
+    # Requisição posterior à escrita não se junta à carga antiga
+    assert await cache.get_or_load("chave", loader) == b"depois"
+    liberar.set()
+    assert await antiga == b"antes"
+    assert await cache.backend.get("chave") == b"depois"
+
+
+async def test_invalidacao_de_outra_tag_nao_impede_a_gravacao():
+    cache = ResponseCache(MemoryBackend(maxsize=10, ttl=60), Sessoes())
+    liberar = asyncio.Event()
+
+    async def loader(db_session):
+        await liberar.wait()
+        return b"corpo", ["atleta:1"]
+
+    carga = asyncio.create_task(cache.get_or_load("chave", loader))
+    await asyncio.sleep(0)
+    await cache.invalidate("atleta:2")
+    liberar.set()
+
+    assert await carga == b"corpo"
+    assert await cache.backend.get("chave") == b"corpo"
@@ -0,0 +1,27 @@
+import pytest
+
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+ROTAS = [
+    "/atletas/",
+    "/atletas/?fields=nome,categoria",
+    "/atletas/cursor?size=5",
+    "/categorias/",
+    "/categorias/totais",
+    "/centros_treinamento/cursor",
+    "/centros_treinamento/totais",
+]
+
+
+@pytest.mark.parametrize("rota", ROTAS)
+async def test_serializacao_rapida_igual_a_do_pydantic(client, monkeypatch, rota):
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", False)
+    esperado = await client.get(rota)
+
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", True)
+    rapido = await client.get(rota)
+
+    assert esperado.status_code == rapido.status_code == 200
+    assert rapido.json() == esperado.json()
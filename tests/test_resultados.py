@@ -0,0 +1,68 @@
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from workout_api.resultados.models import ResultadoAtletaPeriodoModel, ResultadoCentroPeriodoModel
+
+pytestmark = pytest.mark.anyio
+
+
+def _resultado(atleta_id, realizado_em: datetime, valor: float) -> dict:
+    return {"atleta_id": str(atleta_id), "treino": "Fran", "unidade": "segundos", "valor": valor,
+            "realizado_em": realizado_em.isoformat()}
+
+
+async def test_reenvio_nao_conta_duas_vezes(client, atleta):
+    ontem = (datetime.utcnow() - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    lote = {"resultados": [
+        _resultado(atleta.id, ontem, 180.0),
+        _resultado(atleta.id, ontem, 180.0),
+        _resultado(atleta.id, ontem + timedelta(hours=1), 170.0),
+        _resultado(uuid4(), ontem, 150.0),
+    ]}
+
+    primeiro = (await client.post("/resultados/", json=lote)).json()
+    reenvio = (await client.post("/resultados/", json=lote)).json()
+
+    assert primeiro == {"inseridos": 2, "duplicados": 1, "invalidos": [{"indice": 3, "erro": "Atleta não encontrado"}]}
+    assert reenvio["inseridos"] == 0
+    assert reenvio["duplicados"] == 3
+
+    historico = (await client.get(f"/resultados/atletas/{atleta.id}")).json()
+    assert [(dia["quantidade"], dia["melhor"], dia["media"]) for dia in historico] == [(2, 170.0, 175.0)]
+
+
+async def test_data_no_futuro(client, atleta):
+    lote = {"resultados": [_resultado(atleta.id, datetime.utcnow() + timedelta(days=3), 180.0)]}
+
+    response = (await client.post("/resultados/", json=lote)).json()
+
+    assert response["inseridos"] == 0
+    assert response["invalidos"] == [{"indice": 0, "erro": "Data do resultado no futuro"}]
+
+
+@pytest.fixture
+def fuso_atrasado(monkeypatch):
+    """Relógio local 12 horas atrás do UTC: a data local é a véspera durante metade do dia."""
+    monkeypatch.setenv("TZ", "Etc/GMT+12")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+async def test_historico_padrao_termina_no_dia_em_utc(client, atleta, fuso_atrasado):
+    agora = datetime.utcnow().replace(microsecond=0) - timedelta(seconds=1)
+    await client.post("/resultados/", json={"resultados": [_resultado(atleta.id, agora, 180.0)]})
+
+    historico = (await client.get(f"/resultados/atletas/{atleta.id}")).json()
+
+    assert [dia["quantidade"] for dia in historico] == [1]
+
+
+def test_agregados_sem_id():
+    for model in (ResultadoAtletaPeriodoModel, ResultadoCentroPeriodoModel):
+        assert "id" not in model.__table__.c
+        assert not [index for index in model.__table__.indexes if "id" in index.columns]
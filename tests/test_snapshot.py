@@ -0,0 +1,60 @@
+import pytest
+
+from workout_api.atleta.snapshot import _select, atletas_snapshot
+from workout_api.configs.settings import settings
+from workout_api.contrib.changes import ChangeEvent
+
+pytestmark = pytest.mark.anyio
+
+FILTROS = [
+    {},
+    {"sexo": "F"},
+    {"idade_min": 20, "idade_max": 35},
+    {"peso_min": 60.0, "peso_max": 90.0, "categoria": "Categoria 1"},
+    {"centro_treinamento": "CT 2", "sexo": "M", "idade_min": 30},
+]
+
+
+def _filtra(row, sexo=None, idade_min=None, idade_max=None, peso_min=None, peso_max=None,
+            categoria=None, centro_treinamento=None) -> bool:
+    return (
+        (sexo is None or row.sexo == sexo)
+        and (idade_min is None or row.idade >= idade_min) and (idade_max is None or row.idade <= idade_max)
+        and (peso_min is None or row.peso >= peso_min) and (peso_max is None or row.peso <= peso_max)
+        and (categoria is None or row.categoria == categoria)
+        and (centro_treinamento is None or row.centro_treinamento == centro_treinamento)
+    )
+
+
+@pytest.fixture
+async def snapshot(client, monkeypatch):
+    monkeypatch.setattr(settings, "SNAPSHOT_ENABLED", True)
+    await atletas_snapshot.load()
+    yield atletas_snapshot
+
+
+@pytest.mark.parametrize("filtros", FILTROS)
+@pytest.mark.parametrize("ordenar_por", ["peso", "nome"])
+async def test_busca_igual_a_consulta_no_banco(client, db, snapshot, filtros, ordenar_por):
+    async with db() as db_session:
+        rows = [row for row in (await db_session.execute(_select())).all() if _filtra(row, **filtros)]
+
+    params = {**filtros, "ordenar_por": ordenar_por, "ordem": "desc", "limit": 500}
+    page = (await client.get("/atletas/search", params=params)).json()
+
+    assert page["total"] == len(rows)
+    assert {item["id"] for item in page["items"]} == {str(row.id) for row in rows}
+    chaves = [item[ordenar_por] for item in page["items"]]
+    assert chaves == sorted(chaves, reverse=True)
+
+    janela = (await client.get("/atletas/search", params={**params, "offset": 3, "limit": 4})).json()
+    assert janela["items"] == page["items"][3:7]
+
+
+async def test_alteracao_aplicada_ao_snapshot(client, snapshot, atleta):
+    await client.patch(f"/atletas/{atleta.id}", json={"peso": 999.0})
+    await snapshot.apply(ChangeEvent("atleta", "atualizado", [str(atleta.id)]))
+
+    page = (await client.get("/atletas/search", params={"peso_min": 900})).json()
+
+    assert [item["id"] for item in page["items"]] == [str(atleta.id)]
@@ -0,0 +1,15 @@
+import os
+from pathlib import Path
+
+from benchmarks.startup import run
+
+# Mesmo orçamento do exemplo em `python -m benchmarks startup`; ajustável em máquinas de CI mais lentas
+BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 2500))
+
+
+def test_partida_a_frio_dentro_do_orcamento(monkeypatch):
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent)
+
+    resultado = run(rodadas=3, lifespan=True, db_url=os.environ["DB_URL"])
+
+    assert resultado["pronto_ms"]["mediana"] <= BUDGET_MS, resultado["fases_ms"]
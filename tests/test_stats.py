@@ -0,0 +1,35 @@
+from statistics import fmean, median, quantiles
+
+import pytest
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_estatisticas_gerais_e_por_grupo(client, db):
+    async with db() as db_session:
+        pesos = list(await db_session.scalars(select(AtletaModel.peso)))
+
+    stats = (await client.get("/atletas/stats", params={"group_by": "categoria,sexo"})).json()
+
+    assert stats["geral"]["quantidade"] == len(pesos)
+    assert stats["geral"]["peso"]["media"] == pytest.approx(fmean(pesos))
+    assert stats["geral"]["peso"]["p50"] == pytest.approx(median(pesos))
+    p10, *_, p90 = quantiles(pesos, n=10, method="inclusive")
+    assert (stats["geral"]["peso"]["p10"], stats["geral"]["peso"]["p90"]) == (pytest.approx(p10), pytest.approx(p90))
+    for dimensao in ("categoria", "sexo"):
+        assert sum(grupo["quantidade"] for grupo in stats["grupos"][dimensao]) == len(pesos)
+
+
+async def test_escrita_invalida_as_estatisticas_em_cache(client, db):
+    antes = (await client.get("/atletas/stats")).json()["geral"]["quantidade"]
+
+    response = await client.post("/atletas/", json={
+        "nome": "Ana", "cpf": "90000000001", "idade": 25, "peso": 60.5, "altura": 1.65, "sexo": "F",
+        "categoria": {"nome": "Categoria 1"}, "centro_treinamento": {"nome": "CT 1"},
+    })
+
+    assert response.status_code == 201
+    assert (await client.get("/atletas/stats")).json()["geral"]["quantidade"] == antes + 1
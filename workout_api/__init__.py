@@ -1,3 +1,15 @@
-from workout_api.atleta.models import AtletaModel
-from workout_api.categorias.models import CategoriaModel
-from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from importlib import import_module
+
+# Carregados sob demanda: importar apenas configs ou contrib não traz o ORM nem os demais modelos
+_MODELS = {
+    "AtletaModel": "workout_api.atleta.models",
+    "CategoriaModel": "workout_api.categorias.models",
+    "CentroTreinamentoModel": "workout_api.centro_treinamento.models",
+    "ResultadoModel": "workout_api.resultados.models",
+}
+
+
+def __getattr__(name: str):
+    if name in _MODELS:
+        return getattr(import_module(_MODELS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
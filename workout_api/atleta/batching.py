@@ -0,0 +1,32 @@
+from typing import Any
+
+from workout_api.atleta.cache import invalidate_atletas
+from workout_api.atleta.queries import insert_atletas
+from workout_api.configs.database import admitted_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.batching import WriteCoalescer
+from workout_api.contrib.changes import change_feed
+
+
+async def _insert_batch(values: list[dict[str, Any]]) -> list[bool]:
+    unicos = {}
+    for atleta in values:
+        unicos.setdefault(atleta["cpf"], atleta)
+
+    async with admitted_session("/atletas/", "escrita") as db_session:
+        criados = await insert_atletas(db_session, list(unicos.values()))
+        await db_session.commit()
+
+    ids = [unicos[cpf]["id"] for cpf in criados]
+    await invalidate_atletas(ids)
+    await change_feed.publish("atleta", "criado", ids)
+
+    # Com CPF repetido no mesmo lote, apenas a primeira ocorrência é considerada criada
+    return [atleta["cpf"] in criados and unicos[atleta["cpf"]] is atleta for atleta in values]
+
+
+atletas_writer: WriteCoalescer[dict[str, Any], bool] = WriteCoalescer(
+    _insert_batch,
+    window=settings.WRITE_BATCH_WINDOW_MS / 1000,
+    max_size=settings.WRITE_BATCH_MAX_SIZE,
+)
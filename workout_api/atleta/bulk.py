@@ -0,0 +1,269 @@
+import csv
+import json
+import logging
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Iterator, Union
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.cache import invalidate_atletas
+from workout_api.atleta.queries import insert_atletas
+from workout_api.atleta.schemas import AtletaSchemaIn
+from workout_api.configs.settings import settings
+from workout_api.contrib.changes import change_feed
+from workout_api.contrib.repository import reference
+
+CSV_COLUMNS = ("nome", "cpf", "idade", "peso", "altura", "sexo", "categoria", "centro_treinamento")
+MAX_LINE_SIZE = 64 * 1024
+REPORT_MEMORY_SIZE = 1024 * 1024
+ERRO_ENCODING = "Linha não está em UTF-8"
+ERRO_TAMANHO = f"Linha excede {MAX_LINE_SIZE} bytes"
+
+logger = logging.getLogger(__name__)
+
+Erros = list[dict[str, str]]
+Registro = Union[dict[str, Any], Erros]
+# Linha decodificada, ou os erros que impediram a leitura (encoding, tamanho)
+Linha = Union[str, Erros]
+
+
+def _erro(mensagem: str) -> Erros:
+    return [{"campo": "", "erro": mensagem}]
+
+
+def _decode(line: bytes, numero: int) -> Linha:
+    if len(line) > MAX_LINE_SIZE:
+        return _erro(ERRO_TAMANHO)
+
+    try:
+        return line.decode("utf-8-sig" if numero == 1 else "utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return _erro(ERRO_ENCODING)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Linha]]:
+    """Linhas físicas numeradas a partir de 1.
+
+    Uma linha acima de `MAX_LINE_SIZE` não é acumulada: o restante dela é descartado até a próxima quebra de
+    linha e ela vira um erro no relatório, sem interromper a importação (lotes anteriores já foram gravados).
+    """
+    buffer = b""
+    numero = 0
+    descartando = False
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            numero += 1
+            yield numero, _erro(ERRO_TAMANHO) if descartando else _decode(line, numero)
+            descartando = False
+
+        if len(buffer) > MAX_LINE_SIZE:
+            buffer, descartando = b"", True
+
+    if descartando:
+        yield numero + 1, _erro(ERRO_TAMANHO)
+    elif buffer:
+        yield numero + 1, _decode(buffer, numero + 1)
+
+
+async def _iter_csv_records(
+    lines: AsyncIterator[tuple[int, Linha]]
+) -> AsyncIterator[tuple[int, Union[list[str], Erros]]]:
+    """Registros CSV (RFC 4180) numerados pela primeira linha física: campos entre aspas podem conter quebras
+    de linha, então as linhas são acumuladas até as aspas fecharem, limitadas a `MAX_LINE_SIZE` por registro.
+    """
+    partes: list[str] = []
+    inicio = tamanho = aspas = 0
+
+    async for numero, line in lines:
+        if not isinstance(line, str):
+            yield (inicio if partes else numero), line
+            partes, tamanho, aspas = [], 0, 0
+            continue
+
+        if not partes:
+            if not line.strip():
+                continue
+            inicio = numero
+
+        partes.append(line + "\n")
+        tamanho += len(line) + 1
+        aspas += line.count('"')
+
+        if aspas % 2:
+            if tamanho > MAX_LINE_SIZE:
+                yield inicio, _erro(f"Campo entre aspas não fechado em {MAX_LINE_SIZE} bytes")
+                partes, tamanho, aspas = [], 0, 0
+            continue
+
+        yield inicio, next(csv.reader(partes))
+        partes, tamanho, aspas = [], 0, 0
+
+    if partes:
+        yield inicio, _erro("Campo entre aspas não fechado")
+
+
+async def iter_csv(lines: AsyncIterator[tuple[int, Linha]]) -> AsyncIterator[tuple[int, Registro]]:
+    header = None
+
+    async for numero, values in _iter_csv_records(lines):
+        if values and isinstance(values[0], dict):
+            yield numero, values
+            continue
+
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+
+        if len(values) != len(header):
+            yield numero, _erro(f"Esperadas {len(header)} colunas, encontradas {len(values)}")
+            continue
+
+        record: dict[str, Any] = dict(zip(header, values))
+        for key in ("categoria", "centro_treinamento"):
+            if key in record:
+                record[key] = {"nome": record[key]}
+
+        yield numero, record
+
+
+async def iter_ndjson(lines: AsyncIterator[tuple[int, Linha]]) -> AsyncIterator[tuple[int, Registro]]:
+    async for numero, line in lines:
+        if not isinstance(line, str):
+            yield numero, line
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield numero, _erro("JSON inválido")
+            continue
+
+        yield numero, record if isinstance(record, dict) else _erro("Esperado um objeto JSON")
+
+
+def _write(report: SpooledTemporaryFile, result: dict[str, Any]) -> None:
+    report.write(json.dumps(result, ensure_ascii=False, default=str).encode() + b"\n")
+
+
+async def _flush(
+    db_session: AsyncSession, batch: list[tuple[int, Any]], report: SpooledTemporaryFile, resumo: dict[str, int]
+) -> None:
+    validos = [atleta for _, atleta in batch if isinstance(atleta, AtletaSchemaIn)]
+    categorias = {
+        nome: await reference.categorias.by_nome(nome)
+        for nome in {atleta.categoria.nome for atleta in validos}
+    }
+    centros = {
+        nome: await reference.centros_treinamento.by_nome(nome)
+        for nome in {atleta.centro_treinamento.nome for atleta in validos}
+    }
+
+    results: list[dict[str, Any]] = []
+    pendentes: dict[str, dict[str, Any]] = {}
+    values = []
+    created_at = datetime.utcnow()
+
+    for numero, atleta in batch:
+        if not isinstance(atleta, AtletaSchemaIn):
+            results.append({"linha": numero, "status": "invalido", "erros": atleta})
+            continue
+
+        categoria = categorias[atleta.categoria.nome]
+        centro_treinamento = centros[atleta.centro_treinamento.nome]
+
+        if categoria is None:
+            results.append({"linha": numero, "status": "invalido", "erros": _erro("Categoria não encontrada")})
+        elif centro_treinamento is None:
+            results.append({"linha": numero, "status": "invalido",
+                            "erros": _erro("Centro de treinamento não encontrado")})
+        elif atleta.cpf in pendentes:
+            results.append({"linha": numero, "status": "duplicado",
+                            "detalhe": f"CPF {atleta.cpf} repetido no arquivo"})
+        else:
+            result = {"linha": numero, "status": "criado", "id": uuid4()}
+            pendentes[atleta.cpf] = result
+            results.append(result)
+            values.append({
+                **atleta.model_dump(exclude={"categoria", "centro_treinamento"}),
+                "id": result["id"],
+                "created_at": created_at,
+                "categoria_id": categoria.pk_id,
+                "centro_treinamento_id": centro_treinamento.pk_id,
+            })
+
+    if values:
+        try:
+            criados = await insert_atletas(db_session, values)
+            await db_session.commit()
+        except Exception:
+            # Cada lote é uma transação: os anteriores já foram gravados, então a falha vai para o relatório
+            # e a importação segue com o próximo lote em vez de descartar tudo com um 500
+            logger.exception("Erro ao gravar lote de %d atletas (linhas %d a %d)", len(values), batch[0][0],
+                             batch[-1][0])
+            await db_session.rollback()
+            for result in pendentes.values():
+                result.update(status="erro", detalhe="Erro ao gravar o lote; reenvie esta linha")
+                del result["id"]
+        else:
+            for cpf, result in pendentes.items():
+                if cpf not in criados:
+                    result.update(status="duplicado", detalhe=f"Já existe um atleta com o CPF {cpf}")
+                    del result["id"]
+
+            ids = [pendentes[cpf]["id"] for cpf in criados]
+            await invalidate_atletas(ids)
+            await change_feed.publish("atleta", "criado", ids)
+
+    for result in results:
+        resumo[result["status"]] += 1
+        _write(report, result)
+
+
+async def import_atletas(
+    db_session: AsyncSession, records: AsyncIterator[tuple[int, Registro]]
+) -> tuple[SpooledTemporaryFile, dict[str, int]]:
+    """Valida e insere os registros em lotes de `BULK_BATCH_SIZE`, gravando o resultado de cada linha em NDJSON."""
+    report = SpooledTemporaryFile(max_size=REPORT_MEMORY_SIZE)
+    resumo = {"criado": 0, "duplicado": 0, "invalido": 0, "erro": 0}
+    batch: list[tuple[int, Any]] = []
+
+    try:
+        async for numero, record in records:
+            if isinstance(record, dict):
+                try:
+                    record = AtletaSchemaIn.model_validate(record)
+                except ValidationError as e:
+                    record = [{"campo": ".".join(map(str, error["loc"])), "erro": error["msg"]}
+                              for error in e.errors()]
+
+            batch.append((numero, record))
+            if len(batch) >= settings.BULK_BATCH_SIZE:
+                await _flush(db_session, batch, report, resumo)
+                batch = []
+
+        if batch:
+            await _flush(db_session, batch, report, resumo)
+    except BaseException:
+        report.close()
+        raise
+
+    report.seek(0)
+    return report, resumo
+
+
+def iter_report(report: SpooledTemporaryFile, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        while chunk := report.read(chunk_size):
+            yield chunk
+    finally:
+        report.close()
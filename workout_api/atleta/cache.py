@@ -0,0 +1,28 @@
+from typing import Any
+
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.changes import ChangeEvent
+from workout_api.contrib.response_cache import ResponseCache, load_backend
+
+atletas_cache = ResponseCache(
+    load_backend(settings.RESPONSE_CACHE_BACKEND, settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL),
+    async_session,
+)
+
+
+# Respostas que dependem do conjunto de atletas (ex.: estatísticas), invalidadas a cada escrita
+ATLETAS_TAG = "atletas"
+
+
+def atleta_tag(id_atleta: Any) -> str:
+    return f"atleta:{id_atleta}"
+
+
+async def invalidate_atletas(ids: list[Any]) -> None:
+    if ids:
+        await atletas_cache.invalidate(ATLETAS_TAG, *(atleta_tag(id_atleta) for id_atleta in ids))
+
+
+async def on_change(event: ChangeEvent) -> None:
+    await invalidate_atletas(event.ids)
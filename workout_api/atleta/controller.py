@@ -1,15 +1,46 @@
+import asyncio
+from functools import partial
 from uuid import uuid4
 from datetime import datetime
-from fastapi import APIRouter, status, Body, HTTPException, Query
+from typing import Any, AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, status, Body, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from workout_api.atleta.models import AtletaModel
-from workout_api.atleta.schemas import AtletaSchemaIn, AtletaSchemaOut, AtletaSchemaPatch, AllAthletesSchemaOut
-from workout_api.contrib.dependencies import DatabaseDependency
-from sqlalchemy.future import select
-from workout_api.categorias.models import CategoriaModel
-from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from fastapi_pagination import Page, paginate
+from workout_api.atleta.schemas import (
+    AtletaSchemaIn, AtletaSchemaOut, AtletaSchemaPatch, AtletaSchemaPatchLote, AllAthletesSchemaOut,
+    AtletasBatchSchemaIn, AtletasSearchSchemaOut, AtletasStatsSchemaOut
+)
+from workout_api.configs.database import admitted_session, primary_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.admission import prioridade
+from workout_api.contrib.changes import change_feed
+from workout_api.contrib.conditional import is_not_modified, validators, weak_etag
+from workout_api.contrib.dependencies import DatabaseDependency, ReadOnlyDatabaseDependency
+from workout_api.contrib.dialects import insert, is_unique_violation
+from workout_api.contrib.idempotency import idempotency_key
+from sqlalchemy import delete, update
+from workout_api.contrib.repository import reference
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from workout_api.contrib.pagination import KeysetPage, paginate_content, paginate_keyset, paginate_keyset_content
+from workout_api.contrib.responses import FastJSONResponse, dumps
+from workout_api.contrib.schemas import BatchSchemaOut
+from workout_api.atleta.queries import (
+    completo_from_row, escape_like, parse_fields, resumo_transformer, returning_completo, select_atletas_completo,
+    select_atletas_resumo, values_from_patch
+)
+from workout_api.atleta.batching import atletas_writer
+from workout_api.atleta.loaders import AtletaLoadersDependency
+from workout_api.atleta.cache import ATLETAS_TAG, atleta_tag, atletas_cache, invalidate_atletas
+from workout_api.atleta.export import export_atletas, gzip_stream
+from workout_api.atleta.snapshot import SORT_FIELDS, atletas_snapshot
+from workout_api.atleta.stats import GROUP_FIELDS, atletas_stats
+from workout_api.atleta.bulk import CSV_COLUMNS, import_atletas, iter_csv, iter_lines, iter_ndjson, iter_report
+
+FIELDS_DESCRIPTION = "Campos retornados, separados por vírgula (nome, categoria, centro_treinamento)"
 
 router = APIRouter()
 
@@ -18,62 +49,331 @@ router = APIRouter()
     "/",
     status_code=status.HTTP_201_CREATED,
     summary="Cria um novo atleta",
-    response_model=AtletaSchemaOut
+    response_model=AtletaSchemaOut,
+    dependencies=[Depends(idempotency_key)]
 )
 async def post(
-    db_session: DatabaseDependency,
+    request: Request,
     atleta_in: AtletaSchemaIn = Body(...)
 ) -> AtletaSchemaOut:
-    categoria = ((await db_session.execute(select(CategoriaModel).filter_by(nome=atleta_in.categoria.nome)))
-                 .scalars().first())
+    categoria = await reference.categorias.by_nome(atleta_in.categoria.nome)
 
     if categoria is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Categoria não encontrada")
 
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(nome=atleta_in.centro_treinamento.nome)
-    )).scalars().first()
+    centro_treinamento = await reference.centros_treinamento.by_nome(atleta_in.centro_treinamento.nome)
 
     if centro_treinamento is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Centro de treinamento não encontrado")
 
-    atleta_out = None
-    try:
-        atleta_out = AtletaSchemaOut(id=uuid4(), created_at=datetime.utcnow(), **atleta_in.dict())
-        atleta_model = AtletaModel(**atleta_out.model_dump(exclude={"categoria", "centro_treinamento"}))
-        atleta_model.categoria_id = categoria.pk_id
-        atleta_model.centro_treinamento_id = centro_treinamento.pk_id
-
-        db_session.add(atleta_model)
-        await db_session.commit()
-    except IntegrityError as e:
-        await db_session.rollback()
-        if "duplicate key value" in str(e):
-            raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
-                                detail=f"Já existe um atleta com o CPF {atleta_in.cpf}")
+    atleta_out = AtletaSchemaOut(id=uuid4(), created_at=datetime.utcnow(), **atleta_in.dict())
+    values = {
+        **atleta_out.model_dump(exclude={"categoria", "centro_treinamento"}),
+        "categoria_id": categoria.pk_id,
+        "centro_treinamento_id": centro_treinamento.pk_id,
+    }
 
+    try:
+        if settings.WRITE_BATCH_ENABLED:
+            # Sem sessão própria: o lote ocupa uma única vaga de admissão e uma conexão (atleta.batching)
+            criado = await atletas_writer.submit(values)
+        else:
+            async with primary_session(request) as db_session:
+                criado = await _insert(db_session, values)
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="Erro ao criar atleta")
 
+    if not criado:
+        raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
+                            detail=f"Já existe um atleta com o CPF {atleta_in.cpf}")
+
     return atleta_out
 
 
+async def _insert(db_session: AsyncSession, values: dict[str, Any]) -> bool:
+    statement = (
+        insert(db_session, AtletaModel).values(**values)
+        .on_conflict_do_nothing(index_elements=["cpf"])
+        .returning(AtletaModel.pk_id)
+    )
+    pk_id = await db_session.scalar(statement)
+    await db_session.commit()
+
+    if pk_id is None:
+        return False
+
+    await invalidate_atletas([values["id"]])
+    await change_feed.publish("atleta", "criado", [values["id"]])
+    return True
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Busca vários atletas por id e CPF, com uma consulta por tipo de chave",
+    response_model=BatchSchemaOut[AtletaSchemaOut],
+    dependencies=[Depends(prioridade("leitura"))]
+)
+async def batch(
+    loaders: AtletaLoadersDependency,
+    lote: AtletasBatchSchemaIn = Body(...)
+) -> BatchSchemaOut[AtletaSchemaOut]:
+    por_id, por_cpf = await asyncio.gather(loaders.por_id.load_many(lote.ids), loaders.por_cpf.load_many(lote.cpfs))
+    chaves = [*map(str, lote.ids), *lote.cpfs]
+    atletas = [*por_id, *por_cpf]
+
+    content = {
+        "items": [atleta for atleta in atletas if atleta is not None],
+        "ausentes": [chave for chave, atleta in zip(chaves, atletas) if atleta is None],
+    }
+    return FastJSONResponse(content) if settings.FAST_JSON_ENABLED else content
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    summary="Importa atletas em lote a partir de CSV ou NDJSON",
+    response_class=StreamingResponse,
+    dependencies=[Depends(prioridade("lote", limite=settings.ADMISSION_BULK_CONCURRENCY))],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"},
+                             "example": ",".join(CSV_COLUMNS) + "\nJoão da Silva,12345678900,25,75.5,1.75,M,Scale,CT King"},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        },
+        "responses": {"200": {"content": {"application/x-ndjson": {}},
+                              "description": "Resultado de cada linha importada"}},
+    }
+)
+async def bulk(
+    db_session: DatabaseDependency,
+    request: Request,
+    formato: Literal["csv", "ndjson"] = Query(None, description="Padrão: deduzido do Content-Type")
+) -> StreamingResponse:
+    if formato is None:
+        formato = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+    lines = iter_lines(request.stream())
+    records = iter_csv(lines) if formato == "csv" else iter_ndjson(lines)
+    report, resumo = await import_atletas(db_session, records)
+
+    return StreamingResponse(
+        iter_report(report),
+        media_type="application/x-ndjson",
+        headers={
+            "X-Atletas-Criados": str(resumo["criado"]),
+            "X-Atletas-Duplicados": str(resumo["duplicado"]),
+            "X-Atletas-Invalidos": str(resumo["invalido"]),
+            "X-Atletas-Com-Erro": str(resumo["erro"]),
+        }
+    )
+
+
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
     summary="Lista atletas ordenados por nome",
-    response_model=Page[AllAthletesSchemaOut]
+    response_model=Page[AllAthletesSchemaOut],
+    response_model_exclude_unset=True
 )
 async def query(
-    db_session: DatabaseDependency
+    db_session: ReadOnlyDatabaseDependency,
+    fields: str = Query(None, description=FIELDS_DESCRIPTION)
 ) -> Page[AllAthletesSchemaOut]:
+    selected = parse_fields(fields)
+    query_atleta = select_atletas_resumo(selected).order_by(AtletaModel.nome, AtletaModel.pk_id)
+
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse(await paginate_content(db_session, query_atleta, resumo_transformer(selected)))
+
+    return await paginate(db_session, query_atleta, transformer=resumo_transformer(selected))
+
+
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    summary="Lista atletas ordenados por nome usando paginação por cursor",
+    response_model=KeysetPage[AllAthletesSchemaOut],
+    response_model_exclude_unset=True
+)
+async def query_cursor(
+    db_session: ReadOnlyDatabaseDependency,
+    fields: str = Query(None, description=FIELDS_DESCRIPTION)
+) -> KeysetPage[AllAthletesSchemaOut]:
+    selected = parse_fields(fields)
+    paginate_cursor = paginate_keyset_content if settings.FAST_JSON_ENABLED else paginate_keyset
+
+    page = await paginate_cursor(
+        db_session, select_atletas_resumo(selected), AtletaModel.nome, AtletaModel.pk_id,
+        transformer=resumo_transformer(selected)
+    )
+    return FastJSONResponse(page) if settings.FAST_JSON_ENABLED else page
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exporta todos os atletas em NDJSON ou CSV",
+    response_class=StreamingResponse,
+    dependencies=[Depends(prioridade("lote", limite=settings.ADMISSION_BULK_CONCURRENCY))],
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}, "application/gzip": {}}}}
+)
+async def export(
+    db_session: ReadOnlyDatabaseDependency,
+    formato: Literal["ndjson", "csv"] = Query("ndjson"),
+    gzip: bool = Query(False, description="Compacta o arquivo com gzip")
+) -> StreamingResponse:
+    filename = f"atletas.{formato}"
+    media_type = "text/csv" if formato == "csv" else "application/x-ndjson"
+    content = export_atletas(db_session, formato)
+
+    if gzip:
+        filename, media_type, content = f"{filename}.gz", "application/gzip", gzip_stream(content)
+
+    return StreamingResponse(
+        content, media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get(
+    "/busca",
+    status_code=status.HTTP_200_OK,
+    summary="Busca atletas pelo início ou por um trecho do nome",
+    response_model=KeysetPage[AllAthletesSchemaOut],
+    response_model_exclude_unset=True
+)
+async def search(
+    db_session: ReadOnlyDatabaseDependency,
+    nome: str = Query(..., min_length=1, max_length=100),
+    modo: Literal["prefixo", "trecho"] = Query("prefixo", description="prefixo: nome começa com; trecho: nome contém"),
+    fields: str = Query(None, description=FIELDS_DESCRIPTION)
+) -> KeysetPage[AllAthletesSchemaOut]:
+    selected = parse_fields(fields)
+    query_atleta = select_atletas_resumo(selected)
 
-    query_atleta = select(AtletaModel).order_by(AtletaModel.nome)
-    result = await db_session.execute(query_atleta)
-    atletas = result.scalars().all()
+    if modo == "prefixo":
+        query_atleta = query_atleta.filter(AtletaModel.nome.like(escape_like(nome) + "%", escape="/"))
+    elif len(nome) < 3:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="A busca por trecho exige ao menos 3 caracteres")
+    else:
+        query_atleta = query_atleta.filter(AtletaModel.nome.ilike("%" + escape_like(nome) + "%", escape="/"))
 
-    return paginate(atletas)
+    paginate_cursor = paginate_keyset_content if settings.FAST_JSON_ENABLED else paginate_keyset
+    page = await paginate_cursor(
+        db_session, query_atleta, AtletaModel.nome, AtletaModel.pk_id, transformer=resumo_transformer(selected)
+    )
+    return FastJSONResponse(page) if settings.FAST_JSON_ENABLED else page
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    summary="Filtra e ordena atletas a partir do snapshot em memória, sem consultar o banco",
+    response_model=AtletasSearchSchemaOut
+)
+async def search_snapshot(
+    sexo: str = Query(None, max_length=1),
+    idade_min: int = Query(None, ge=0),
+    idade_max: int = Query(None, ge=0),
+    peso_min: float = Query(None, ge=0),
+    peso_max: float = Query(None, ge=0),
+    categoria: str = Query(None, description="Nome da categoria"),
+    centro_treinamento: str = Query(None, description="Nome do centro de treinamento"),
+    ordenar_por: Literal[SORT_FIELDS] = Query("peso"),
+    ordem: Literal["asc", "desc"] = Query("asc"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+) -> AtletasSearchSchemaOut:
+    if not settings.SNAPSHOT_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot de atletas desativado")
+
+    if not atletas_snapshot.pronto:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Snapshot de atletas ainda não carregado", headers={"Retry-After": "5"})
+
+    total, items = atletas_snapshot.search(
+        sexo=sexo, idade_min=idade_min, idade_max=idade_max, peso_min=peso_min, peso_max=peso_max,
+        categoria=categoria, centro_treinamento=centro_treinamento,
+        ordenar_por=ordenar_por, descendente=ordem == "desc", limit=limit, offset=offset
+    )
+
+    content = {"items": items, "total": total, "limit": limit, "offset": offset, "snapshot": atletas_snapshot.status()}
+    return FastJSONResponse(content) if settings.FAST_JSON_ENABLED else content
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Estatísticas de peso, altura, idade e IMC dos atletas por categoria e centro de treinamento",
+    response_model=AtletasStatsSchemaOut
+)
+async def stats(
+    group_by: str = Query(
+        "categoria,centro_treinamento", description=f"Dimensões separadas por vírgula ({', '.join(GROUP_FIELDS)})"
+    ),
+    categoria: str = Query(None, description="Nome da categoria"),
+    centro_treinamento: str = Query(None, description="Nome do centro de treinamento"),
+    sexo: str = Query(None, max_length=1),
+    idade_min: int = Query(None, ge=0),
+    idade_max: int = Query(None, ge=0)
+) -> Response:
+    dimensoes = parse_fields(group_by, GROUP_FIELDS)
+    filtros = dict(categoria=categoria, centro_treinamento=centro_treinamento, sexo=sexo,
+                   idade_min=idade_min, idade_max=idade_max)
+
+    async def load(db_session: AsyncSession) -> tuple[bytes, list[str]]:
+        resultado = AtletasStatsSchemaOut.model_validate(await atletas_stats(db_session, dimensoes, **filtros))
+        return resultado.model_dump_json().encode(), [ATLETAS_TAG]
+
+    # Como em /by, apenas a carga ocupa uma vaga de admissão, com prioridade de lote
+    session_factory = partial(admitted_session, "/atletas/stats", "lote")
+    if settings.RESPONSE_CACHE_ENABLED:
+        key = "atletas:stats:" + ",".join(dimensoes) + ":" + ":".join(f"{value}" for value in filtros.values())
+        content = await atletas_cache.get_or_load(key, load, session_factory)
+    else:
+        async with session_factory() as db_session:
+            content, _ = await load(db_session)
+
+    return Response(content=content, media_type="application/json")
+
+
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    summary="Acompanha as alterações de atletas, categorias e centros de treinamento (Server-Sent Events)",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def changes() -> StreamingResponse:
+    subscription = change_feed.subscribe()
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await subscription.get(timeout=settings.CHANGE_FEED_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event is None:
+                    return
+
+                yield f"event: {event.entidade}\ndata: {event.to_json()}\n\n"
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get(
@@ -83,28 +383,109 @@ async def query(
     response_model=AtletaSchemaOut
 )
 async def get(
-    db_session: DatabaseDependency,
+    request: Request,
     id_atleta: UUID4 = Query(None),
     nome: str = Query(None),
     cpf: str = Query(None)
-) -> AtletaSchemaOut:
-    custom_query = select(AtletaModel)
+) -> Response:
+    custom_query = select_atletas_completo().add_columns(AtletaModel.updated_at)
+    key = None
 
     if id_atleta:
-        custom_query = custom_query.filter_by(id=id_atleta)
+        custom_query = custom_query.filter(AtletaModel.id == id_atleta)
+        key = f"atleta:id:{id_atleta}"
     elif cpf:
-        custom_query = custom_query.filter_by(cpf=cpf)
+        custom_query = custom_query.filter(AtletaModel.cpf == cpf)
+        key = f"atleta:cpf:{cpf}"
     elif nome:
         pattern = f"%{nome}%"
         custom_query = custom_query.filter(AtletaModel.nome.ilike(pattern))
+        key = f"atleta:nome:{nome.lower()}"
+
+    async def load(db_session: AsyncSession) -> Optional[tuple[bytes, list[str]]]:
+        row = (await db_session.execute(custom_query.limit(1))).first()
+        if row is None:
+            return None
+
+        atleta = completo_from_row(row)
+        updated_at = atleta.pop("updated_at")
+        if settings.FAST_JSON_ENABLED:
+            body = dumps(atleta)
+        else:
+            body = AtletaSchemaOut.model_validate(atleta).model_dump_json().encode()
 
-    result = await db_session.execute(custom_query)
-    atleta: AtletaSchemaOut = result.scalars().first()
+        # A versão vai junto do corpo no cache, para responder 304 sem consultar o banco
+        return f"{row.id}|{updated_at.isoformat()}\n".encode() + body, [atleta_tag(row.id)]
 
-    if not atleta:
+    # Sem sessão da rota: acertos no cache não esperam vaga; apenas a carga ocupa uma
+    session_factory = partial(admitted_session, "/atletas/by", "leitura")
+    if key is not None and settings.RESPONSE_CACHE_ENABLED:
+        content = await atletas_cache.get_or_load(key, load, session_factory)
+    else:
+        async with session_factory() as db_session:
+            loaded = await load(db_session)
+        content = loaded[0] if loaded else None
+
+    if content is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Atleta não encontrado")
 
-    return atleta
+    versao, _, body = content.partition(b"\n")
+    id_encontrado, _, updated_at = versao.decode().partition("|")
+    last_modified = datetime.fromisoformat(updated_at)
+    etag = weak_etag(id_encontrado, updated_at)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators(etag, last_modified))
+
+    return Response(content=body, media_type="application/json", headers=validators(etag, last_modified))
+
+
+async def _update(db_session: AsyncSession, atleta_patch: AtletaSchemaPatch, *criteria) -> list:
+    values = values_from_patch(atleta_patch)
+
+    if not values:
+        return (await db_session.execute(select_atletas_completo().where(*criteria))).all()
+
+    statement = (
+        update(AtletaModel).where(*criteria).values(**values)
+        .returning(*returning_completo())
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        rows = (await db_session.execute(statement)).all()
+        await db_session.commit()
+    except IntegrityError as e:
+        await db_session.rollback()
+        # Entre as colunas atualizáveis, só o CPF é único
+        if is_unique_violation(e):
+            raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
+                                detail=f"Já existe um atleta com o CPF {atleta_patch.cpf}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Categoria ou centro de treinamento não encontrado")
+
+    return rows
+
+
+@router.patch(
+    "/",
+    status_code=status.HTTP_200_OK,
+    summary="Atualiza vários atletas por id",
+    response_model=list[AtletaSchemaOut]
+)
+async def patch_many(
+    db_session: DatabaseDependency,
+    atletas_patch: AtletaSchemaPatchLote = Body(...)
+) -> list[AtletaSchemaOut]:
+    if atletas_patch.atleta.cpf is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="O CPF não pode ser alterado em lote")
+
+    rows = await _update(db_session, atletas_patch.atleta, AtletaModel.id.in_(atletas_patch.ids))
+    await invalidate_atletas([row.id for row in rows])
+    await change_feed.publish("atleta", "atualizado", [row.id for row in rows])
+
+    atletas = [completo_from_row(row) for row in rows]
+    return FastJSONResponse(atletas) if settings.FAST_JSON_ENABLED else atletas
 
 
 @router.patch(
@@ -118,22 +499,37 @@ async def patch(
     id_atleta: UUID4,
     atleta_patch: AtletaSchemaPatch = Body(...)
 ) -> AtletaSchemaOut:
+    rows = await _update(db_session, atleta_patch, AtletaModel.id == id_atleta)
 
-    atleta: AtletaSchemaOut = (
-        await db_session.execute(select(AtletaModel).filter_by(id=id_atleta))
-    ).scalars().first()
-
-    if not atleta:
+    if not rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Atleta não encontrado")
 
-    atleta_update = atleta_patch.model_dump(exclude_unset=True).items()
-    for key, value in atleta_update:
-        setattr(atleta, key, value)
+    await invalidate_atletas([id_atleta])
+    await change_feed.publish("atleta", "atualizado", [id_atleta])
+
+    atleta = completo_from_row(rows[0])
+    return FastJSONResponse(atleta) if settings.FAST_JSON_ENABLED else atleta
 
+
+@router.delete(
+    "/",
+    status_code=status.HTTP_200_OK,
+    summary="Deleta vários atletas por id",
+    response_model=list[UUID4]
+)
+async def delete_many(
+    db_session: DatabaseDependency,
+    ids: list[UUID4] = Query(..., max_length=1000)
+) -> list[UUID4]:
+    removidos = (await db_session.execute(
+        delete(AtletaModel).where(AtletaModel.id.in_(ids)).returning(AtletaModel.id)
+        .execution_options(synchronize_session=False)
+    )).scalars().all()
     await db_session.commit()
-    await db_session.refresh(atleta)
+    await invalidate_atletas(removidos)
+    await change_feed.publish("atleta", "removido", removidos)
 
-    return atleta
+    return removidos
 
 
 @router.delete(
@@ -141,16 +537,18 @@ async def patch(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Deleta um atleta por id"
 )
-async def delete(
+async def delete_one(
     db_session: DatabaseDependency,
     id_atleta: UUID4
 ) -> None:
-    atleta: AtletaSchemaOut = (
-        await db_session.execute(select(AtletaModel).filter_by(id=id_atleta))
-    ).scalars().first()
+    removido = (await db_session.execute(
+        delete(AtletaModel).where(AtletaModel.id == id_atleta).returning(AtletaModel.pk_id)
+        .execution_options(synchronize_session=False)
+    )).scalar()
 
-    if not atleta:
+    if removido is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Atleta não encontrado")
 
-    await db_session.delete(atleta)
     await db_session.commit()
+    await invalidate_atletas([id_atleta])
+    await change_feed.publish("atleta", "removido", [id_atleta])
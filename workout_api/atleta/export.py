@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+from uuid import UUID
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.queries import completo_from_row, select_atletas_completo
+
+EXPORT_COLUMNS = (
+    "id", "nome", "cpf", "idade", "peso", "altura", "sexo", "created_at", "categoria", "centro_treinamento"
+)
+PARTITION_SIZE = 1000
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} não é serializável")
+
+
+def _ndjson(rows: Sequence[Row]) -> bytes:
+    lines = [json.dumps(completo_from_row(row), ensure_ascii=False, default=_default) for row in rows]
+
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        [*row[:7], row.created_at.isoformat(), row.categoria, row.centro_treinamento] for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def export_atletas(db_session: AsyncSession, formato: str) -> AsyncIterator[bytes]:
+    """Percorre a tabela com um cursor no servidor, serializando uma partição por vez."""
+    if formato == "csv":
+        yield (",".join(EXPORT_COLUMNS) + "\n").encode()
+
+    serialize = _csv if formato == "csv" else _ndjson
+    query = select_atletas_completo().order_by(AtletaModel.pk_id).execution_options(yield_per=PARTITION_SIZE)
+
+    result = await db_session.stream(query)
+    async for rows in result.partitions():
+        yield serialize(rows)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
@@ -0,0 +1,33 @@
+import asyncio
+from functools import partial
+from typing import Annotated, Any, Sequence
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.queries import completo_from_row, select_atletas_completo
+from workout_api.contrib.dataloader import DataLoader
+from workout_api.contrib.dependencies import ReadOnlyDatabaseDependency
+from workout_api.contrib.dialects import in_array
+
+
+async def _load_atletas(db_session: AsyncSession, column: Any, keys: Sequence[Any]) -> dict[Any, dict[str, Any]]:
+    query = select_atletas_completo().where(in_array(db_session, column, keys))
+    return {getattr(row, column.key): completo_from_row(row) for row in await db_session.execute(query)}
+
+
+class AtletaLoaders:
+    """DataLoaders de atletas por id e por CPF de uma requisição, sobre a mesma sessão."""
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        lock = asyncio.Lock()
+        self.por_id = DataLoader(partial(_load_atletas, db_session, AtletaModel.id), lock=lock)
+        self.por_cpf = DataLoader(partial(_load_atletas, db_session, AtletaModel.cpf), lock=lock)
+
+
+def get_atleta_loaders(db_session: ReadOnlyDatabaseDependency) -> AtletaLoaders:
+    return AtletaLoaders(db_session)
+
+
+AtletaLoadersDependency = Annotated[AtletaLoaders, Depends(get_atleta_loaders)]
@@ -1,10 +1,16 @@
 from workout_api.contrib.models import BaseModel
-from sqlalchemy import String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
 class AtletaModel(BaseModel):
     __tablename__ = "atletas"
+    __table_args__ = (
+        Index("ix_atletas_nome_trgm", "nome", postgresql_using="gin", postgresql_ops={"nome": "gin_trgm_ops"}),
+        Index("ix_atletas_nome_prefix", "nome", postgresql_ops={"nome": "varchar_pattern_ops"}),
+        Index("ix_atletas_categoria_id_nome", "categoria_id", "nome", "pk_id"),
+        Index("ix_atletas_centro_treinamento_id_nome", "centro_treinamento_id", "nome", "pk_id"),
+    )
 
     pk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     nome: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -0,0 +1,67 @@
+from typing import Any, Type, Union
+
+from fastapi_pagination.api import resolve_params
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from workout_api.atleta.cache import ATLETAS_TAG, atletas_cache
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.queries import resumo_transformer, select_atletas_resumo
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.settings import settings
+from workout_api.contrib.pagination import KeysetPage, paginate_keyset, paginate_keyset_content
+
+Grupo = Type[Union[CategoriaModel, CentroTreinamentoModel]]
+
+# Listas de atletas aninhadas em categorias e centros: como as de /atletas, não vão para caches compartilhados
+ATLETAS_CACHE_CONTROL = "private, no-cache"
+
+FOREIGN_KEYS = {
+    CategoriaModel: AtletaModel.categoria_id,
+    CentroTreinamentoModel: AtletaModel.centro_treinamento_id,
+}
+
+
+def select_totais(model: Grupo) -> Select:
+    """id, nome e quantidade de atletas de cada categoria ou centro de treinamento."""
+    foreign_key = FOREIGN_KEYS[model]
+    contagem = select(foreign_key.label("pk_id"), func.count().label("total")).group_by(foreign_key).subquery()
+    return (
+        select(model.id, model.nome, func.coalesce(contagem.c.total, 0).label("total_atletas"))
+        .outerjoin(contagem, contagem.c.pk_id == model.pk_id)
+        .order_by(model.nome)
+    )
+
+
+async def total_atletas(db_session: AsyncSession, model: Grupo, pk_id: int) -> int:
+    # Varre apenas o trecho do índice (chave estrangeira, nome, pk_id) da categoria ou centro
+    query = select(func.count()).where(FOREIGN_KEYS[model] == pk_id)
+
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return await db_session.scalar(query)
+
+    async def load(db_session: AsyncSession) -> tuple[bytes, list[str]]:
+        return str(await db_session.scalar(query)).encode(), [ATLETAS_TAG]
+
+    return int(await atletas_cache.get_or_load(f"atletas:total:{model.__tablename__}:{pk_id}", load))
+
+
+async def atletas_por(
+    db_session: AsyncSession, model: Grupo, pk_id: int, fields: tuple[str, ...], fast: bool = False
+) -> Union[KeysetPage[Any], dict[str, Any]]:
+    """Atletas de uma categoria ou centro por nome; o total, quando pedido (`include_total`), vem do cache.
+
+    A ordenação (nome, pk_id) percorre o índice composto da chave estrangeira; com `fields=nome` a consulta é
+    respondida apenas pelo índice.
+    """
+    query = select_atletas_resumo(fields).where(FOREIGN_KEYS[model] == pk_id)
+    paginate_cursor = paginate_keyset_content if fast else paginate_keyset
+    params = resolve_params()
+    total = await total_atletas(db_session, model, pk_id) if params.include_total else None
+
+    return await paginate_cursor(
+        db_session, query, AtletaModel.nome, AtletaModel.pk_id, params=params,
+        transformer=resumo_transformer(fields), total=total
+    )
@@ -0,0 +1,147 @@
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.dialects import insert
+
+LIST_FIELDS = ("nome", "categoria", "centro_treinamento")
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str] = LIST_FIELDS) -> tuple[str, ...]:
+    if not fields:
+        return tuple(allowed)
+
+    selected = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    invalid = [field for field in selected if field not in allowed]
+
+    if invalid or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos inválidos: {', '.join(invalid)}. Permitidos: {', '.join(allowed)}"
+        )
+
+    return selected
+
+
+def escape_like(value: str) -> str:
+    """Escapa `%`, `_` e `/` para uso em LIKE com `escape="/"`.
+
+    O padrão completo vai como parâmetro: montado no SQL (`$1 || '%'`), o planejador não usa os índices de nome.
+    """
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def select_atletas_resumo(fields: Sequence[str] = LIST_FIELDS) -> Select:
+    query = select(AtletaModel.pk_id, AtletaModel.nome)
+
+    if "categoria" in fields:
+        query = query.add_columns(CategoriaModel.nome.label("categoria")).join(
+            CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id
+        )
+
+    if "centro_treinamento" in fields:
+        query = query.add_columns(CentroTreinamentoModel.nome.label("centro_treinamento")).join(
+            CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id
+        )
+
+    return query
+
+
+def resumo_from_row(row: Row, fields: Sequence[str] = LIST_FIELDS) -> dict[str, Any]:
+    atleta: dict[str, Any] = {}
+
+    if "nome" in fields:
+        atleta["nome"] = row.nome
+    if "categoria" in fields:
+        atleta["categoria"] = {"nome": row.categoria}
+    if "centro_treinamento" in fields:
+        atleta["centro_treinamento"] = {"nome": row.centro_treinamento}
+
+    return atleta
+
+
+def resumo_transformer(fields: Sequence[str] = LIST_FIELDS):
+    def transformer(rows: Sequence[Row]) -> list[dict[str, Any]]:
+        return [resumo_from_row(row, fields) for row in rows]
+
+    return transformer
+
+
+ATLETA_COLUMNS = (
+    AtletaModel.id,
+    AtletaModel.nome,
+    AtletaModel.cpf,
+    AtletaModel.idade,
+    AtletaModel.peso,
+    AtletaModel.altura,
+    AtletaModel.sexo,
+    AtletaModel.created_at,
+)
+
+
+def select_atletas_completo() -> Select:
+    return (
+        select(
+            *ATLETA_COLUMNS,
+            CategoriaModel.nome.label("categoria"),
+            CentroTreinamentoModel.nome.label("centro_treinamento"),
+        )
+        .join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+        .join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+    )
+
+
+def returning_completo() -> tuple:
+    """Colunas para UPDATE/DELETE ... RETURNING equivalentes às de `select_atletas_completo`."""
+    return (
+        *ATLETA_COLUMNS,
+        select(CategoriaModel.nome)
+        .where(CategoriaModel.pk_id == AtletaModel.categoria_id)
+        .scalar_subquery().label("categoria"),
+        select(CentroTreinamentoModel.nome)
+        .where(CentroTreinamentoModel.pk_id == AtletaModel.centro_treinamento_id)
+        .scalar_subquery().label("centro_treinamento"),
+    )
+
+
+def completo_from_row(row: Row) -> dict[str, Any]:
+    atleta = row._asdict()
+    atleta["categoria"] = {"nome": atleta["categoria"]}
+    atleta["centro_treinamento"] = {"nome": atleta["centro_treinamento"]}
+    return atleta
+
+
+def values_from_patch(patch: BaseModel) -> dict[str, Any]:
+    """Valores do UPDATE, com categoria e centro resolvidos por subconsulta no próprio comando."""
+    values = patch.model_dump(exclude_unset=True, exclude={"categoria", "centro_treinamento"})
+
+    if patch.categoria is not None:
+        values["categoria_id"] = (
+            select(CategoriaModel.pk_id).where(CategoriaModel.nome == patch.categoria.nome).scalar_subquery()
+        )
+    if patch.centro_treinamento is not None:
+        values["centro_treinamento_id"] = (
+            select(CentroTreinamentoModel.pk_id)
+            .where(CentroTreinamentoModel.nome == patch.centro_treinamento.nome)
+            .scalar_subquery()
+        )
+
+    return values
+
+
+async def insert_atletas(db_session: AsyncSession, values: list[dict[str, Any]]) -> set[str]:
+    """INSERT de várias linhas ignorando CPFs já cadastrados; retorna os CPFs efetivamente inseridos."""
+    statement = (
+        insert(db_session, AtletaModel).values(values)
+        .on_conflict_do_nothing(index_elements=["cpf"])
+        .returning(AtletaModel.cpf)
+    )
+    return set((await db_session.execute(statement)).scalars())
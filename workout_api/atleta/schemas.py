@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Annotated, Optional
-from pydantic import Field, PositiveFloat
-from workout_api.contrib.schemas import BaseSchema
+from pydantic import Field, PositiveFloat, UUID4
+from workout_api.contrib.schemas import BATCH_MAX_SIZE, BaseSchema
 from workout_api.contrib.schemas import OutMixin
 from workout_api.categorias.schemas import CategoriaSchemaIn
 from workout_api.centro_treinamento.schemas import CentroTreinamentoAtleta
@@ -37,7 +38,68 @@ class AtletaSchemaPatch(BaseSchema):
         None, description="Centro de treinamento do atleta")]
 
 
+class AtletasBatchSchemaIn(BaseSchema):
+    ids: Annotated[list[UUID4], Field([], max_length=BATCH_MAX_SIZE, description="Ids dos atletas")]
+    cpfs: Annotated[list[str], Field([], max_length=BATCH_MAX_SIZE, description="CPFs dos atletas")]
+
+
+class AtletaSchemaPatchLote(BaseSchema):
+    ids: Annotated[list[UUID4], Field(min_length=1, max_length=1000, description="Ids dos atletas a atualizar")]
+    atleta: Annotated[AtletaSchemaPatch, Field(description="Campos aplicados a todos os atletas")]
+
+
 class AllAthletesSchemaOut(BaseSchema):
-    nome: Annotated[str, Field(max_length=100, description="Nome do atleta", example="João da Silva")]
-    centro_treinamento: Annotated[CentroTreinamentoAtleta, Field(description="Centro de treinamento do atleta")]
-    categoria: Annotated[CategoriaSchemaIn, Field(description="Categoria do atleta")]
+    nome: Annotated[Optional[str], Field(None, max_length=100, description="Nome do atleta", example="João da Silva")]
+    centro_treinamento: Annotated[Optional[CentroTreinamentoAtleta], Field(
+        None, description="Centro de treinamento do atleta")]
+    categoria: Annotated[Optional[CategoriaSchemaIn], Field(None, description="Categoria do atleta")]
+
+
+class EstatisticaSchema(BaseSchema):
+    media: Annotated[Optional[float], Field(None, description="Média")]
+    p10: Annotated[Optional[float], Field(None, description="Percentil 10")]
+    p50: Annotated[Optional[float], Field(None, description="Mediana")]
+    p90: Annotated[Optional[float], Field(None, description="Percentil 90")]
+
+
+class GrupoEstatisticasSchema(BaseSchema):
+    grupo: Annotated[Optional[str], Field(None, description="Valor da dimensão agrupada", example="Scale")]
+    quantidade: Annotated[int, Field(description="Quantidade de atletas", example=42)]
+    peso: Annotated[EstatisticaSchema, Field(description="Peso")]
+    altura: Annotated[EstatisticaSchema, Field(description="Altura")]
+    idade: Annotated[EstatisticaSchema, Field(description="Idade")]
+    imc: Annotated[EstatisticaSchema, Field(description="Índice de massa corporal (peso / altura²)")]
+
+
+class AtletasStatsSchemaOut(BaseSchema):
+    geral: Annotated[GrupoEstatisticasSchema, Field(description="Todos os atletas filtrados")]
+    grupos: Annotated[dict[str, list[GrupoEstatisticasSchema]], Field(description="Estatísticas por dimensão")]
+
+
+class AtletaSnapshotSchemaOut(BaseSchema):
+    id: Annotated[UUID4, Field(description="Identificador")]
+    nome: Annotated[str, Field(description="Nome do atleta", example="João da Silva")]
+    idade: Annotated[int, Field(description="Idade do atleta", example=25)]
+    peso: Annotated[float, Field(description="Peso do atleta", example=75.5)]
+    altura: Annotated[float, Field(description="Altura do atleta", example=1.75)]
+    sexo: Annotated[str, Field(description="Sexo do atleta", example="M")]
+    categoria: Annotated[Optional[str], Field(None, description="Nome da categoria", example="Scale")]
+    centro_treinamento: Annotated[Optional[str], Field(None, description="Nome do centro de treinamento",
+                                                       example="CT King")]
+
+
+class SnapshotStatusSchema(BaseSchema):
+    linhas: Annotated[int, Field(description="Atletas no snapshot")]
+    removidos: Annotated[int, Field(description="Linhas removidas aguardando a próxima recarga completa")]
+    memoria_bytes: Annotated[int, Field(description="Memória aproximada ocupada pelo snapshot")]
+    versao: Annotated[int, Field(description="Incrementada a cada atualização")]
+    atualizado_em: Annotated[Optional[datetime], Field(None, description="Última atualização (UTC)")]
+    defasagem_segundos: Annotated[Optional[float], Field(None, description="Segundos desde a última atualização")]
+
+
+class AtletasSearchSchemaOut(BaseSchema):
+    items: list[AtletaSnapshotSchemaOut]
+    total: Annotated[int, Field(description="Atletas que atendem aos filtros")]
+    limit: int
+    offset: int
+    snapshot: SnapshotStatusSchema
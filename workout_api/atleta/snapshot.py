@@ -0,0 +1,414 @@
+import asyncio
+import logging
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import reduce
+from itertools import chain, islice
+from math import floor
+from operator import and_
+from time import monotonic
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.changes import ChangeEvent
+
+logger = logging.getLogger(__name__)
+
+SORT_FIELDS = ("peso", "idade", "altura", "nome")
+MAP_FIELDS = ("sexo", "categoria", "centro_treinamento", "idade", "peso")
+NONZERO_BYTE = re.compile(rb"[^\x00]")
+BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+class Dicionario:
+    """Codifica valores repetidos (nomes de categoria, centro, sexo) como índices em uma lista."""
+
+    def __init__(self) -> None:
+        self.valores: list[Optional[str]] = []
+        self.codigos: dict[Optional[str], int] = {}
+
+    def codificar(self, valor: Optional[str]) -> int:
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = self.codigos[valor] = len(self.valores)
+            self.valores.append(valor)
+        return codigo
+
+    def memoria(self) -> int:
+        return sys.getsizeof(self.valores) + sys.getsizeof(self.codigos) + sum(
+            sys.getsizeof(valor) for valor in self.valores
+        )
+
+
+def _select() -> Select:
+    return (
+        select(
+            AtletaModel.id,
+            AtletaModel.nome,
+            AtletaModel.idade,
+            AtletaModel.peso,
+            AtletaModel.altura,
+            AtletaModel.sexo,
+            AtletaModel.updated_at,
+            CategoriaModel.nome.label("categoria"),
+            CentroTreinamentoModel.nome.label("centro_treinamento"),
+        )
+        .join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+        .join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+    )
+
+
+class _Colunas:
+    """Buffers de uma carga completa do snapshot e os índices usados pela busca.
+
+    Cada coluna é um `array` (ou `bytearray`) indexado pela posição da linha; categoria, centro e sexo são
+    codificados por dicionário. Linhas removidas viram lápides até a próxima carga completa.
+
+    Depois de `indexar`, cada gravação ou remoção atualiza os índices: as posições vivas ordenadas por
+    (valor, posição) de cada campo de ordenação, mantidas com bisect, e um bitmap (um `int`, bit i = posição i)
+    das posições vivas por valor de sexo, categoria e centro e por faixa inteira de idade e peso. Os filtros de
+    uma busca são combinados com `&` entre bitmaps, sem percorrer as linhas.
+    """
+
+    def __init__(self) -> None:
+        self.ids = bytearray()
+        self.nomes: list[str] = []
+        self.idades = array("h")
+        self.pesos = array("d")
+        self.alturas = array("d")
+        self.sexos = array("B")
+        self.categorias = array("H")
+        self.centros = array("H")
+        self.vivos = bytearray()
+        self.posicoes: dict[bytes, int] = {}
+        self.dicionarios = {"sexo": Dicionario(), "categoria": Dicionario(), "centro_treinamento": Dicionario()}
+        self.removidos = 0
+        self.ultimo_updated_at: Optional[datetime] = None
+        self.ordens: dict[str, array] = {campo: array("l") for campo in SORT_FIELDS}
+        self.mapas: dict[str, dict[int, int]] = {campo: {} for campo in MAP_FIELDS}
+        self.indexado = False
+
+    def _colunas(self) -> tuple:
+        return self.nomes, self.idades, self.pesos, self.alturas, self.sexos, self.categorias, self.centros
+
+    def _coluna(self, campo: str) -> Any:
+        return {
+            "peso": self.pesos, "idade": self.idades, "altura": self.alturas, "nome": self.nomes,
+            "sexo": self.sexos, "categoria": self.categorias, "centro_treinamento": self.centros,
+        }[campo]
+
+    def _chave(self, campo: str) -> Callable[[int], tuple]:
+        coluna = self._coluna(campo)
+        return lambda posicao: (coluna[posicao], posicao)
+
+    def _faixa(self, campo: str, posicao: int) -> int:
+        return floor(self._coluna(campo)[posicao])
+
+    def _indexar_posicao(self, posicao: int) -> None:
+        if not self.indexado:
+            return
+        for campo, ordem in self.ordens.items():
+            insort(ordem, posicao, key=self._chave(campo))
+        for campo, mapas in self.mapas.items():
+            faixa = self._faixa(campo, posicao)
+            mapas[faixa] = mapas.get(faixa, 0) | 1 << posicao
+
+    def _desindexar_posicao(self, posicao: int) -> None:
+        if not self.indexado:
+            return
+        for campo, ordem in self.ordens.items():
+            chave = self._chave(campo)
+            del ordem[bisect_left(ordem, chave(posicao), key=chave)]
+        for campo, mapas in self.mapas.items():
+            faixa = self._faixa(campo, posicao)
+            mapas[faixa] &= ~(1 << posicao)
+            if not mapas[faixa]:
+                del mapas[faixa]
+
+    def gravar(self, row: Row) -> None:
+        chave = row.id.bytes
+        valores = (
+            row.nome, row.idade, row.peso, row.altura,
+            self.dicionarios["sexo"].codificar(row.sexo),
+            self.dicionarios["categoria"].codificar(row.categoria),
+            self.dicionarios["centro_treinamento"].codificar(row.centro_treinamento),
+        )
+        posicao = self.posicoes.get(chave)
+
+        if posicao is None:
+            posicao = self.posicoes[chave] = len(self.vivos)
+            self.ids += chave
+            for coluna, valor in zip(self._colunas(), valores):
+                coluna.append(valor)
+            self.vivos.append(1)
+        else:
+            if self.vivos[posicao]:
+                self._desindexar_posicao(posicao)
+            else:
+                self.vivos[posicao] = 1
+                self.removidos -= 1
+            for coluna, valor in zip(self._colunas(), valores):
+                coluna[posicao] = valor
+        self._indexar_posicao(posicao)
+
+        if self.ultimo_updated_at is None or row.updated_at > self.ultimo_updated_at:
+            self.ultimo_updated_at = row.updated_at
+
+    def remover(self, chave: bytes) -> None:
+        posicao = self.posicoes.get(chave)
+        if posicao is not None and self.vivos[posicao]:
+            self._desindexar_posicao(posicao)
+            self.vivos[posicao] = 0
+            self.removidos += 1
+
+    def _bitmap(self, posicoes: Iterable[int]) -> int:
+        bits = bytearray((len(self.vivos) + 7) // 8)
+        for posicao in posicoes:
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+        return int.from_bytes(bits, "little")
+
+    def indexar(self) -> None:
+        """Monta os índices de uma só vez, ao final da carga (sem concorrência: roda fora do loop)."""
+        vivas = [posicao for posicao, vivo in enumerate(self.vivos) if vivo]
+        for campo in SORT_FIELDS:
+            # Ordenação estável sobre as posições crescentes: empates ficam em ordem de posição, como em `_chave`
+            self.ordens[campo] = array("l", sorted(vivas, key=self._coluna(campo).__getitem__))
+        for campo in MAP_FIELDS:
+            faixas, coluna = defaultdict(list), self._coluna(campo)
+            for posicao in vivas:
+                faixas[floor(coluna[posicao])].append(posicao)
+            self.mapas[campo] = {faixa: self._bitmap(posicoes) for faixa, posicoes in faixas.items()}
+        self.indexado = True
+
+    def _intervalo(self, campo: str, minimo: Optional[float], maximo: Optional[float]) -> int:
+        """Faixas inteiras contidas no intervalo pelos bitmaps; as das pontas, posição a posição pela ordem."""
+        ordem, coluna = self.ordens[campo], self._coluna(campo)
+        inicio = 0 if minimo is None else bisect_left(ordem, minimo, key=coluna.__getitem__)
+        fim = len(ordem) if maximo is None else bisect_right(ordem, maximo, key=coluna.__getitem__)
+        if inicio >= fim:
+            return 0
+
+        primeira, ultima = floor(coluna[ordem[inicio]]), floor(coluna[ordem[fim - 1]])
+        fim_primeira = bisect_left(ordem, primeira + 1, inicio, fim, key=coluna.__getitem__)
+        inicio_ultima = max(bisect_left(ordem, ultima, fim_primeira, fim, key=coluna.__getitem__), fim_primeira)
+
+        mapa, pontas = 0, []
+        for faixa, bitmap in self.mapas[campo].items():
+            if primeira < faixa < ultima:
+                mapa |= bitmap
+        for faixa, posicoes in ((primeira, ordem[inicio:fim_primeira]), (ultima, ordem[inicio_ultima:fim])):
+            # Ponta com todas as posições da faixa dentro do intervalo: usa o bitmap pronto
+            if posicoes and len(posicoes) == self.mapas[campo][faixa].bit_count():
+                mapa |= self.mapas[campo][faixa]
+            else:
+                pontas.append(posicoes)
+        return mapa | self._bitmap(chain(*pontas)) if pontas else mapa
+
+    def search(
+        self,
+        sexo: Optional[str] = None,
+        idade_min: Optional[int] = None,
+        idade_max: Optional[int] = None,
+        peso_min: Optional[float] = None,
+        peso_max: Optional[float] = None,
+        categoria: Optional[str] = None,
+        centro_treinamento: Optional[str] = None,
+        ordenar_por: str = "peso",
+        descendente: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Combina os bitmaps dos filtros e percorre a ordem de `ordenar_por` apenas até a página pedida."""
+        mapas: list[int] = []
+        for campo, valor in (("sexo", sexo), ("categoria", categoria), ("centro_treinamento", centro_treinamento)):
+            if valor is not None:
+                codigo = self.dicionarios[campo].codigos.get(valor)
+                mapas.append(self.mapas[campo].get(codigo, 0))
+
+        for campo, minimo, maximo in (("idade", idade_min, idade_max), ("peso", peso_min, peso_max)):
+            if minimo is not None or maximo is not None:
+                mapas.append(self._intervalo(campo, minimo, maximo))
+
+        ordem = self.ordens[ordenar_por]
+        if not mapas:
+            total = len(ordem)
+            if descendente:
+                pagina = ordem[max(total - offset - limit, 0):max(total - offset, 0)][::-1]
+            else:
+                pagina = ordem[offset:offset + limit]
+            return total, [self._linha(posicao) for posicao in pagina]
+
+        mapa = reduce(and_, mapas)
+        total = mapa.bit_count()
+        if total <= offset:
+            return total, []
+
+        bits = mapa.to_bytes((len(self.vivos) + 7) // 8, "little")
+        # Percorrer a ordem até a página custa em média (offset + limit) * len(ordem) / total posições
+        if (offset + limit) * len(ordem) < total * (4 * total + len(bits)):
+            sequencia: Iterable[int] = (
+                posicao for posicao in (reversed(ordem) if descendente else ordem)
+                if bits[posicao >> 3] >> (posicao & 7) & 1
+            )
+        else:
+            selecionadas = []
+            for match in NONZERO_BYTE.finditer(bits):
+                indice = match.start()
+                selecionadas.extend(indice * 8 + bit for bit in BITS[bits[indice]])
+            sequencia = sorted(selecionadas, key=self._chave(ordenar_por), reverse=descendente)
+
+        return total, [self._linha(posicao) for posicao in islice(sequencia, offset, offset + limit)]
+
+    def _linha(self, posicao: int) -> dict[str, Any]:
+        return {
+            "id": UUID(bytes=bytes(self.ids[posicao * 16:posicao * 16 + 16])),
+            "nome": self.nomes[posicao],
+            "idade": self.idades[posicao],
+            "peso": self.pesos[posicao],
+            "altura": self.alturas[posicao],
+            "sexo": self.dicionarios["sexo"].valores[self.sexos[posicao]],
+            "categoria": self.dicionarios["categoria"].valores[self.categorias[posicao]],
+            "centro_treinamento": self.dicionarios["centro_treinamento"].valores[self.centros[posicao]],
+        }
+
+    def memoria(self) -> int:
+        buffers = (self.ids, self.idades, self.pesos, self.alturas, self.sexos, self.categorias, self.centros,
+                   self.vivos, *self.ordens.values())
+        return (
+            sum(sys.getsizeof(buffer) for buffer in buffers)
+            + sys.getsizeof(self.nomes) + sum(sys.getsizeof(nome) for nome in self.nomes)
+            + sys.getsizeof(self.posicoes)
+            + sum(sys.getsizeof(bitmap) for mapas in self.mapas.values() for bitmap in mapas.values())
+            + sum(dicionario.memoria() for dicionario in self.dicionarios.values())
+        )
+
+
+class AtletasSnapshot:
+    """Cópia colunar dos atletas em memória para filtros e ordenações sem acessar o banco.
+
+    A atualização é incremental: eventos de alteração recarregam apenas os ids afetados e, periodicamente, são
+    lidos os atletas com `updated_at` posterior ao último carregado. Cargas completas (inicial, após reconexão do
+    feed ou para descartar lápides) são feitas em um `_Colunas` novo, que só substitui o atual quando termina:
+    buscas concorrentes continuam respondendo com os dados anteriores.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.dados = _Colunas()
+        self.versao = 0
+        self.atualizado_em: Optional[datetime] = None
+        self._atualizado_monotonic = 0.0
+        self.pronto = False
+
+    def _marcar(self) -> None:
+        self.versao += 1
+        self.atualizado_em = datetime.utcnow()
+        self._atualizado_monotonic = monotonic()
+
+    async def _carregar(self, dados: _Colunas, query: Select) -> None:
+        async with async_session() as db_session:
+            result = await db_session.stream(query.execution_options(yield_per=1000))
+            async for partition in result.partitions():
+                for row in partition:
+                    dados.gravar(row)
+
+    async def load(self) -> None:
+        async with self._lock:
+            dados = _Colunas()
+            await self._carregar(dados, _select())
+            await asyncio.get_running_loop().run_in_executor(None, dados.indexar)
+            self.dados = dados
+            self._marcar()
+            self.pronto = True
+
+    async def refresh(self) -> None:
+        """Lê os atletas criados ou alterados desde o último carregado, relendo `SNAPSHOT_OVERLAP` segundos para trás."""
+        if not self.pronto or self.dados.removidos > max(1000, len(self.dados.vivos) // 4):
+            await self.load()
+            return
+
+        async with self._lock:
+            query = _select()
+            if self.dados.ultimo_updated_at is not None:
+                desde = self.dados.ultimo_updated_at - timedelta(seconds=settings.SNAPSHOT_OVERLAP)
+                query = query.where(AtletaModel.updated_at >= desde)
+            await self._carregar(self.dados, query)
+            self._marcar()
+
+    async def apply(self, event: ChangeEvent) -> None:
+        if not self.pronto:
+            return
+
+        ids = [UUID(id_) for id_ in event.ids]
+        async with self._lock:
+            if event.acao == "removido":
+                for id_ in ids:
+                    self.dados.remover(id_.bytes)
+            else:
+                await self._carregar(self.dados, _select().where(AtletaModel.id.in_(ids)))
+            self._marcar()
+
+    def search(self, **filtros: Any) -> tuple[int, list[dict[str, Any]]]:
+        return self.dados.search(**filtros)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "linhas": len(self.dados.vivos) - self.dados.removidos,
+            "removidos": self.dados.removidos,
+            "memoria_bytes": self.dados.memoria(),
+            "versao": self.versao,
+            "atualizado_em": self.atualizado_em,
+            "defasagem_segundos": monotonic() - self._atualizado_monotonic if self.pronto else None,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SNAPSHOT_REFRESH_INTERVAL)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("Falha ao atualizar o snapshot de atletas", exc_info=True)
+
+    async def start(self) -> None:
+        try:
+            await self.load()
+        except Exception:
+            logger.warning("Falha ao carregar o snapshot de atletas; nova tentativa na próxima atualização",
+                           exc_info=True)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def reset(self) -> None:
+        """Eventos podem ter sido perdidos: recarrega tudo."""
+        await self.load()
+
+    def metrics(self) -> Iterable[str]:
+        status = self.status()
+        yield "# TYPE atletas_snapshot_rows gauge"
+        yield f"atletas_snapshot_rows {status['linhas']}"
+        yield "# TYPE atletas_snapshot_memory_bytes gauge"
+        yield f"atletas_snapshot_memory_bytes {status['memoria_bytes']}"
+        if status["defasagem_segundos"] is not None:
+            yield "# TYPE atletas_snapshot_age_seconds gauge"
+            yield f"atletas_snapshot_age_seconds {status['defasagem_segundos']}"
+
+
+atletas_snapshot = AtletasSnapshot()
@@ -0,0 +1,166 @@
+from collections import defaultdict
+from math import floor
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Float, func, literal_column, select, tuple_, type_coerce
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+GROUP_FIELDS = ("categoria", "centro_treinamento", "sexo")
+METRICAS = ("peso", "altura", "idade", "imc")
+PERCENTIS = (0.1, 0.5, 0.9)
+
+DIMENSOES = {
+    "categoria": CategoriaModel.nome,
+    "centro_treinamento": CentroTreinamentoModel.nome,
+    "sexo": AtletaModel.sexo,
+}
+
+
+def _colunas() -> dict[str, Any]:
+    return {
+        "peso": AtletaModel.peso,
+        "altura": AtletaModel.altura,
+        "idade": AtletaModel.idade,
+        "imc": AtletaModel.peso / func.nullif(AtletaModel.altura * AtletaModel.altura, 0, type_=Float),
+    }
+
+
+def _base_query(
+    columns: Sequence[Any], dimensoes: Sequence[str], categoria: Optional[str], centro_treinamento: Optional[str],
+    sexo: Optional[str], idade_min: Optional[int], idade_max: Optional[int]
+) -> Select:
+    query = select(*columns).select_from(AtletaModel)
+
+    if "categoria" in dimensoes or categoria is not None:
+        query = query.join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+    if "centro_treinamento" in dimensoes or centro_treinamento is not None:
+        query = query.join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+
+    if categoria is not None:
+        query = query.where(CategoriaModel.nome == categoria)
+    if centro_treinamento is not None:
+        query = query.where(CentroTreinamentoModel.nome == centro_treinamento)
+    if sexo is not None:
+        query = query.where(AtletaModel.sexo == sexo)
+    if idade_min is not None:
+        query = query.where(AtletaModel.idade >= idade_min)
+    if idade_max is not None:
+        query = query.where(AtletaModel.idade <= idade_max)
+
+    return query
+
+
+def _resultado(grupos: dict[str, list[dict[str, Any]]], geral: Optional[dict[str, Any]]) -> dict[str, Any]:
+    for dimensao in grupos:
+        grupos[dimensao].sort(key=lambda grupo: grupo["grupo"] or "")
+
+    return {"geral": geral or _estatisticas(None, 0, {}), "grupos": grupos}
+
+
+def _estatisticas(grupo: Optional[str], quantidade: int, metricas: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    vazio = {"media": None, "p10": None, "p50": None, "p90": None}
+    return {"grupo": grupo, "quantidade": quantidade, **{nome: metricas.get(nome, vazio) for nome in METRICAS}}
+
+
+async def _stats_sql(db_session: AsyncSession, dimensoes: Sequence[str], **filtros: Any) -> dict[str, Any]:
+    """Uma única varredura com GROUPING SETS: um conjunto por dimensão e o total geral."""
+    columns = [DIMENSOES[dimensao].label(dimensao) for dimensao in dimensoes]
+    columns += [func.grouping(DIMENSOES[dimensao]).label(f"agrupado_{dimensao}") for dimensao in dimensoes]
+    columns.append(func.count().label("quantidade"))
+    percentis = postgresql.array([literal_column(str(p)) for p in PERCENTIS])
+
+    for nome, coluna in _colunas().items():
+        columns.append(func.avg(coluna).label(f"{nome}_media"))
+        columns.append(type_coerce(
+            func.percentile_cont(percentis).within_group(coluna), postgresql.ARRAY(Float)
+        ).label(f"{nome}_percentis"))
+
+    query = _base_query(columns, dimensoes, **filtros).group_by(
+        func.grouping_sets(*(tuple_(DIMENSOES[dimensao]) for dimensao in dimensoes), tuple_())
+    )
+
+    grupos: dict[str, list[dict[str, Any]]] = {dimensao: [] for dimensao in dimensoes}
+    geral = None
+
+    for row in (await db_session.execute(query)).mappings():
+        metricas = {
+            nome: {"media": row[f"{nome}_media"], **dict(zip(("p10", "p50", "p90"), row[f"{nome}_percentis"] or ()))}
+            for nome in METRICAS
+        } if row["quantidade"] else {}
+        dimensao = next((dimensao for dimensao in dimensoes if row[f"agrupado_{dimensao}"] == 0), None)
+
+        if dimensao is None:
+            geral = _estatisticas(None, row["quantidade"], metricas)
+        else:
+            grupos[dimensao].append(_estatisticas(row[dimensao], row["quantidade"], metricas))
+
+    return _resultado(grupos, geral)
+
+
+def _percentil(ordenados: list[float], p: float) -> float:
+    """Interpolação linear entre os vizinhos mais próximos, como o `percentile_cont` do PostgreSQL."""
+    posicao = p * (len(ordenados) - 1)
+    inferior = floor(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+def _resumir(valores: list[float]) -> dict[str, Any]:
+    valores = sorted(valor for valor in valores if valor is not None)
+    if not valores:
+        return {"media": None, "p10": None, "p50": None, "p90": None}
+
+    return {
+        "media": sum(valores) / len(valores),
+        **{f"p{round(p * 100)}": _percentil(valores, p) for p in PERCENTIS},
+    }
+
+
+async def _stats_colunar(db_session: AsyncSession, dimensoes: Sequence[str], **filtros: Any) -> dict[str, Any]:
+    """Para bancos sem `percentile_cont` (ex.: SQLite): busca apenas as colunas usadas e agrega em memória."""
+    colunas = _colunas()
+    query = _base_query(
+        [*(DIMENSOES[dimensao].label(dimensao) for dimensao in dimensoes),
+         *(coluna.label(nome) for nome, coluna in colunas.items())],
+        dimensoes, **filtros
+    )
+    rows = (await db_session.execute(query)).all()
+    valores = dict(zip((*dimensoes, *colunas), zip(*rows))) if rows else {}
+
+    def agregar(grupo: Optional[str], indices: Sequence[int]) -> dict[str, Any]:
+        return _estatisticas(grupo, len(indices), {
+            nome: _resumir([valores[nome][i] for i in indices]) for nome in METRICAS
+        })
+
+    grupos: dict[str, list[dict[str, Any]]] = {}
+    for dimensao in dimensoes:
+        indices: defaultdict[str, list[int]] = defaultdict(list)
+        for i, valor in enumerate(valores.get(dimensao, ())):
+            indices[valor].append(i)
+        grupos[dimensao] = [agregar(grupo, membros) for grupo, membros in indices.items()]
+
+    return _resultado(grupos, agregar(None, range(len(rows))) if rows else None)
+
+
+async def atletas_stats(
+    db_session: AsyncSession,
+    dimensoes: Sequence[str] = ("categoria", "centro_treinamento"),
+    categoria: Optional[str] = None,
+    centro_treinamento: Optional[str] = None,
+    sexo: Optional[str] = None,
+    idade_min: Optional[int] = None,
+    idade_max: Optional[int] = None,
+) -> dict[str, Any]:
+    filtros = dict(categoria=categoria, centro_treinamento=centro_treinamento, sexo=sexo,
+                   idade_min=idade_min, idade_max=idade_max)
+
+    if db_session.bind.dialect.name == "postgresql":
+        return await _stats_sql(db_session, dimensoes, **filtros)
+
+    return await _stats_colunar(db_session, dimensoes, **filtros)
@@ -1,13 +1,26 @@
-from fastapi import APIRouter, status, Body, HTTPException
+from fastapi import APIRouter, Depends, status, Body, HTTPException, Query, Request, Response
 from pydantic import UUID4
-from sqlalchemy.exc import IntegrityError
 
+from workout_api.atleta.nested import ATLETAS_CACHE_CONTROL, atletas_por, select_totais
+from workout_api.atleta.queries import parse_fields
+from workout_api.atleta.schemas import AllAthletesSchemaOut
 from workout_api.categorias.models import CategoriaModel
-from workout_api.categorias.schemas import CategoriaSchemaIn, CategoriaSchemaOut
-from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.categorias.schemas import CategoriaSchemaIn, CategoriaSchemaOut, CategoriaTotalSchemaOut
+from workout_api.contrib.changes import change_feed
+from workout_api.contrib.conditional import cache_control, not_modified, validators, weak_etag
+from workout_api.contrib.admission import prioridade
+from workout_api.contrib.dependencies import DatabaseDependency, ReadOnlyDatabaseDependency
+from workout_api.contrib.dialects import insert
+from workout_api.contrib.idempotency import idempotency_key
+from workout_api.contrib.repository import reference
 from uuid import uuid4
 from sqlalchemy.future import select
-from fastapi_pagination import Page, paginate
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from workout_api.configs.settings import settings
+from workout_api.contrib.pagination import KeysetPage, paginate_content, paginate_keyset, paginate_keyset_content
+from workout_api.contrib.responses import FastJSONResponse, serialize_many
+from workout_api.contrib.schemas import BatchSchemaIn, BatchSchemaOut
 
 router = APIRouter()
 
@@ -16,33 +29,59 @@ router = APIRouter()
     "/",
     summary="Criar nova categoria",
     status_code=status.HTTP_201_CREATED,
-    response_model=CategoriaSchemaOut
+    response_model=CategoriaSchemaOut,
+    dependencies=[Depends(idempotency_key)]
 )
 async def post(
     db_session: DatabaseDependency,
     categoria_in: CategoriaSchemaIn = Body(...)
 ) -> CategoriaSchemaOut:
 
-    categoria_out = None
+    categoria_out = CategoriaSchemaOut(id=uuid4(), **categoria_in.model_dump())
+    statement = (
+        insert(db_session, CategoriaModel).values(**categoria_out.model_dump())
+        .on_conflict_do_nothing(index_elements=["nome"])
+        .returning(CategoriaModel)
+    )
+
     try:
-        categoria_out = CategoriaSchemaOut(id=uuid4(), **categoria_in.model_dump())
-        categoria_model = CategoriaModel(**categoria_out.model_dump())
-        db_session.add(categoria_model)
+        categoria_model = await db_session.scalar(statement)
         await db_session.commit()
-
-    except IntegrityError as e:
-        await db_session.rollback()
-        if "duplicate key value" in str(e):
-            raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
-                                detail=f"Já existe uma categoria com o nome {categoria_in.nome}")
-
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="Erro ao criar categoria")
 
+    if categoria_model is None:
+        raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
+                            detail=f"Já existe uma categoria com o nome {categoria_in.nome}")
+
+    reference.categorias.changed()
+    reference.categorias.add(categoria_model)
+    await change_feed.publish("categoria", "criado", [categoria_out.id])
+
     return categoria_out
 
 
+@router.post(
+    "/batch",
+    summary="Busca vários categorias por id em uma única consulta",
+    status_code=status.HTTP_200_OK,
+    response_model=BatchSchemaOut[CategoriaSchemaOut],
+    dependencies=[Depends(prioridade("leitura"))]
+)
+async def batch(
+    db_session: ReadOnlyDatabaseDependency,
+    lote: BatchSchemaIn = Body(...)
+) -> BatchSchemaOut[CategoriaSchemaOut]:
+    referencias = await reference.categorias.loader(db_session).load_many(lote.ids)
+
+    content = {
+        "items": [referencia.data for referencia in referencias if referencia is not None],
+        "ausentes": [str(id_) for id_, referencia in zip(lote.ids, referencias) if referencia is None],
+    }
+    return FastJSONResponse(content) if settings.FAST_JSON_ENABLED else content
+
+
 @router.get(
     "/",
     summary="Listar todas as categorias",
@@ -50,13 +89,64 @@ async def post(
     response_model=Page[CategoriaSchemaOut]
 )
 async def query(
-    db_session: DatabaseDependency
+    db_session: ReadOnlyDatabaseDependency,
+    request: Request,
+    response: Response
 ) -> Page[CategoriaSchemaOut]:
 
-    query_category = select(CategoriaModel)
-    result = await db_session.execute(query_category)
-    categorias: list[CategoriaSchemaOut] = result.scalars().all()
-    return paginate(categorias)
+    versao = await reference.categorias.versao(db_session)
+    etag = weak_etag("categorias", *versao)
+    if (not_modified_response := not_modified(request, response, etag, versao.updated_at)) is not None:
+        return not_modified_response
+
+    query_category = select(CategoriaModel).order_by(CategoriaModel.nome, CategoriaModel.pk_id)
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse(await paginate_content(
+            db_session, query_category, serialize_many(CategoriaSchemaOut)
+        ), headers=validators(etag, versao.updated_at))
+
+    return await paginate(db_session, query_category)
+
+
+@router.get(
+    "/cursor",
+    summary="Listar categorias usando paginação por cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=KeysetPage[CategoriaSchemaOut]
+)
+async def query_cursor(
+    db_session: ReadOnlyDatabaseDependency,
+    request: Request,
+    response: Response
+) -> KeysetPage[CategoriaSchemaOut]:
+
+    versao = await reference.categorias.versao(db_session)
+    etag = weak_etag("categorias", *versao)
+    if (not_modified_response := not_modified(request, response, etag, versao.updated_at)) is not None:
+        return not_modified_response
+
+    keys = (CategoriaModel.nome, CategoriaModel.pk_id)
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse(await paginate_keyset_content(
+            db_session, select(CategoriaModel), *keys, transformer=serialize_many(CategoriaSchemaOut)
+        ), headers=validators(etag, versao.updated_at))
+
+    return await paginate_keyset(db_session, select(CategoriaModel), *keys)
+
+
+@router.get(
+    "/totais",
+    summary="Quantidade de atletas de cada categoria",
+    status_code=status.HTTP_200_OK,
+    response_model=list[CategoriaTotalSchemaOut]
+)
+async def totais(db_session: ReadOnlyDatabaseDependency) -> list[CategoriaTotalSchemaOut]:
+    rows = (await db_session.execute(select_totais(CategoriaModel))).mappings().all()
+
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse([dict(row) for row in rows])
+
+    return rows
 
 
 @router.get(
@@ -65,12 +155,37 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=CategoriaSchemaOut
 )
-async def get(db_session: DatabaseDependency, id_categoria: UUID4) -> CategoriaSchemaOut:
-    categoria_out: CategoriaSchemaOut = (
-        await db_session.execute(select(CategoriaModel).filter_by(id=id_categoria))
-    ).scalars().first()
+async def get(request: Request, response: Response, id_categoria: UUID4) -> CategoriaSchemaOut:
+    categoria = await reference.categorias.by_id(id_categoria)
 
-    if not categoria_out:
+    if not categoria:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Categoria não encontrada")
 
-    return categoria_out
+    etag = weak_etag(id_categoria, categoria.updated_at)
+    if (not_modified_response := not_modified(request, response, etag, categoria.updated_at)) is not None:
+        return not_modified_response
+
+    return categoria.data
+
+
+@router.get(
+    "/{id_categoria}/atletas",
+    summary="Lista os atletas da categoria usando paginação por cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=KeysetPage[AllAthletesSchemaOut],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(cache_control(ATLETAS_CACHE_CONTROL))]
+)
+async def query_atletas(
+    db_session: ReadOnlyDatabaseDependency,
+    id_categoria: UUID4,
+    fields: str = Query(None, description="Campos retornados, separados por vírgula (nome, centro_treinamento)")
+) -> KeysetPage[AllAthletesSchemaOut]:
+    selected = parse_fields(fields, ("nome", "centro_treinamento"))
+    categoria = await reference.categorias.by_id(id_categoria)
+
+    if not categoria:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Categoria não encontrada")
+
+    page = await atletas_por(db_session, CategoriaModel, categoria.pk_id, selected, fast=settings.FAST_JSON_ENABLED)
+    return FastJSONResponse(page) if settings.FAST_JSON_ENABLED else page
@@ -9,3 +9,7 @@ class CategoriaSchemaIn(BaseSchema):
 
 class CategoriaSchemaOut(CategoriaSchemaIn):
     id: Annotated[UUID4, Field(description="Identificador da categoria")]
+
+
+class CategoriaTotalSchemaOut(CategoriaSchemaOut):
+    total_atletas: Annotated[int, Field(description="Quantidade de atletas da categoria", example=12)]
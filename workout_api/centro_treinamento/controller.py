@@ -1,13 +1,28 @@
 from uuid import uuid4
-from fastapi import APIRouter, Body, HTTPException, status
+from fastapi import APIRouter, Depends, Body, HTTPException, Query, status, Request, Response
 from pydantic import UUID4
-from sqlalchemy.exc import IntegrityError
 
+from workout_api.atleta.nested import ATLETAS_CACHE_CONTROL, atletas_por, select_totais
+from workout_api.atleta.queries import parse_fields
+from workout_api.atleta.schemas import AllAthletesSchemaOut
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from workout_api.centro_treinamento.schemas import CentroTreinamentoSchemaIn, CentroTreinamentoSchemaOut
-from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.centro_treinamento.schemas import (
+    CentroTreinamentoSchemaIn, CentroTreinamentoSchemaOut, CentroTreinamentoTotalSchemaOut
+)
+from workout_api.contrib.changes import change_feed
+from workout_api.contrib.conditional import cache_control, not_modified, validators, weak_etag
+from workout_api.contrib.admission import prioridade
+from workout_api.contrib.dependencies import DatabaseDependency, ReadOnlyDatabaseDependency
+from workout_api.contrib.dialects import insert
+from workout_api.contrib.idempotency import idempotency_key
+from workout_api.contrib.repository import reference
 from sqlalchemy.future import select
-from fastapi_pagination import Page, paginate
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from workout_api.configs.settings import settings
+from workout_api.contrib.pagination import KeysetPage, paginate_content, paginate_keyset, paginate_keyset_content
+from workout_api.contrib.responses import FastJSONResponse, serialize_many
+from workout_api.contrib.schemas import BatchSchemaIn, BatchSchemaOut
 
 router = APIRouter()
 
@@ -16,34 +31,58 @@ router = APIRouter()
     "/",
     summary="Cria um novo centro de treinamento",
     response_model=CentroTreinamentoSchemaOut,
-    status_code=status.HTTP_201_CREATED
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(idempotency_key)]
 )
 async def post(
         db_session: DatabaseDependency,
         centro_treinamento_in: CentroTreinamentoSchemaIn = Body(...)
 ) -> CentroTreinamentoSchemaOut:
-    centro_treinamento_out = None
+    centro_treinamento_out = CentroTreinamentoSchemaOut(id=uuid4(), **centro_treinamento_in.model_dump())
+    statement = (
+        insert(db_session, CentroTreinamentoModel).values(**centro_treinamento_out.model_dump())
+        .on_conflict_do_nothing(index_elements=["nome"])
+        .returning(CentroTreinamentoModel)
+    )
 
     try:
-        centro_treinamento_out = CentroTreinamentoSchemaOut(id=uuid4(), **centro_treinamento_in.model_dump())
-        centro_treinamento_model = CentroTreinamentoModel(**centro_treinamento_out.model_dump())
-
-        db_session.add(centro_treinamento_model)
+        centro_treinamento_model = await db_session.scalar(statement)
         await db_session.commit()
-
-    except IntegrityError as e:
-        await db_session.rollback()
-        if "duplicate key value" in str(e):
-            raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
-                                detail=f"Já existe um centro de treinamento com o nome {centro_treinamento_in.nome}")
-
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="Erro ao criar centro de treinamento")
 
+    if centro_treinamento_model is None:
+        raise HTTPException(status_code=status.HTTP_303_SEE_OTHER,
+                            detail=f"Já existe um centro de treinamento com o nome {centro_treinamento_in.nome}")
+
+    reference.centros_treinamento.changed()
+    reference.centros_treinamento.add(centro_treinamento_model)
+    await change_feed.publish("centro_treinamento", "criado", [centro_treinamento_out.id])
+
     return centro_treinamento_out
 
 
+@router.post(
+    "/batch",
+    summary="Busca vários centros de treinamento por id em uma única consulta",
+    status_code=status.HTTP_200_OK,
+    response_model=BatchSchemaOut[CentroTreinamentoSchemaOut],
+    dependencies=[Depends(prioridade("leitura"))]
+)
+async def batch(
+    db_session: ReadOnlyDatabaseDependency,
+    lote: BatchSchemaIn = Body(...)
+) -> BatchSchemaOut[CentroTreinamentoSchemaOut]:
+    referencias = await reference.centros_treinamento.loader(db_session).load_many(lote.ids)
+
+    content = {
+        "items": [referencia.data for referencia in referencias if referencia is not None],
+        "ausentes": [str(id_) for id_, referencia in zip(lote.ids, referencias) if referencia is None],
+    }
+    return FastJSONResponse(content) if settings.FAST_JSON_ENABLED else content
+
+
 @router.get(
     "/",
     summary="Lista todos os centros de treinamento",
@@ -51,13 +90,66 @@ async def post(
     status_code=status.HTTP_200_OK
 )
 async def query(
-        db_session: DatabaseDependency
+        db_session: ReadOnlyDatabaseDependency,
+        request: Request,
+        response: Response
 ) -> Page[CentroTreinamentoSchemaOut]:
 
-    query_centros_treinamento = select(CentroTreinamentoModel)
-    result = await db_session.execute(query_centros_treinamento)
-    centros_treinamento: list[CentroTreinamentoSchemaOut] = result.scalars().all()
-    return paginate(centros_treinamento)
+    versao = await reference.centros_treinamento.versao(db_session)
+    etag = weak_etag("centros_treinamento", *versao)
+    if (not_modified_response := not_modified(request, response, etag, versao.updated_at)) is not None:
+        return not_modified_response
+
+    query_centros_treinamento = select(CentroTreinamentoModel).order_by(
+        CentroTreinamentoModel.nome, CentroTreinamentoModel.pk_id
+    )
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse(await paginate_content(
+            db_session, query_centros_treinamento, serialize_many(CentroTreinamentoSchemaOut)
+        ), headers=validators(etag, versao.updated_at))
+
+    return await paginate(db_session, query_centros_treinamento)
+
+
+@router.get(
+    "/cursor",
+    summary="Lista centros de treinamento usando paginação por cursor",
+    response_model=KeysetPage[CentroTreinamentoSchemaOut],
+    status_code=status.HTTP_200_OK
+)
+async def query_cursor(
+        db_session: ReadOnlyDatabaseDependency,
+        request: Request,
+        response: Response
+) -> KeysetPage[CentroTreinamentoSchemaOut]:
+
+    versao = await reference.centros_treinamento.versao(db_session)
+    etag = weak_etag("centros_treinamento", *versao)
+    if (not_modified_response := not_modified(request, response, etag, versao.updated_at)) is not None:
+        return not_modified_response
+
+    keys = (CentroTreinamentoModel.nome, CentroTreinamentoModel.pk_id)
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse(await paginate_keyset_content(
+            db_session, select(CentroTreinamentoModel), *keys, transformer=serialize_many(CentroTreinamentoSchemaOut)
+        ), headers=validators(etag, versao.updated_at))
+
+    return await paginate_keyset(db_session, select(CentroTreinamentoModel), *keys)
+
+
+@router.get(
+    "/totais",
+    summary="Quantidade de atletas de cada centro de treinamento",
+    response_model=list[CentroTreinamentoTotalSchemaOut],
+    status_code=status.HTTP_200_OK
+)
+async def totais(db_session: ReadOnlyDatabaseDependency) -> list[CentroTreinamentoTotalSchemaOut]:
+    rows = (await db_session.execute(select_totais(CentroTreinamentoModel))).mappings().all()
+
+    if settings.FAST_JSON_ENABLED:
+        return FastJSONResponse([dict(row) for row in rows])
+
+    return rows
 
 
 @router.get(
@@ -67,14 +159,42 @@ async def query(
     status_code=status.HTTP_200_OK
 )
 async def get(
-        db_session: DatabaseDependency,
+        request: Request,
+        response: Response,
         id: UUID4
 ) -> CentroTreinamentoSchemaOut:
-    centro_treinamento_out: CentroTreinamentoSchemaOut = (
-        await db_session.execute(select(CentroTreinamentoModel).filter_by(id=id))
-    ).scalars().first()
+    centro_treinamento = await reference.centros_treinamento.by_id(id)
 
-    if not centro_treinamento_out:
+    if not centro_treinamento:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Centro de treinamento não encontrado")
 
-    return centro_treinamento_out
+    etag = weak_etag(id, centro_treinamento.updated_at)
+    if (not_modified_response := not_modified(request, response, etag, centro_treinamento.updated_at)) is not None:
+        return not_modified_response
+
+    return centro_treinamento.data
+
+
+@router.get(
+    "/{id}/atletas",
+    summary="Lista os atletas do centro de treinamento usando paginação por cursor",
+    response_model=KeysetPage[AllAthletesSchemaOut],
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_control(ATLETAS_CACHE_CONTROL))]
+)
+async def query_atletas(
+        db_session: ReadOnlyDatabaseDependency,
+        id: UUID4,
+        fields: str = Query(None, description="Campos retornados, separados por vírgula (nome, categoria)")
+) -> KeysetPage[AllAthletesSchemaOut]:
+    selected = parse_fields(fields, ("nome", "categoria"))
+    centro_treinamento = await reference.centros_treinamento.by_id(id)
+
+    if not centro_treinamento:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Centro de treinamento não encontrado")
+
+    page = await atletas_por(
+        db_session, CentroTreinamentoModel, centro_treinamento.pk_id, selected, fast=settings.FAST_JSON_ENABLED
+    )
+    return FastJSONResponse(page) if settings.FAST_JSON_ENABLED else page
@@ -15,3 +15,8 @@ class CentroTreinamentoAtleta(BaseSchema):
 
 class CentroTreinamentoSchemaOut(CentroTreinamentoSchemaIn):
     id: Annotated[UUID4, Field(description="Identificador único do centro de treinamento")]
+
+
+class CentroTreinamentoTotalSchemaOut(CentroTreinamentoAtleta):
+    id: Annotated[UUID4, Field(description="Identificador único do centro de treinamento")]
+    total_atletas: Annotated[int, Field(description="Quantidade de atletas do centro de treinamento", example=12)]
@@ -1,12 +1,96 @@
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator
+
+from fastapi import Request
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from workout_api.configs.settings import settings
+from workout_api.contrib.admission import AdmissionController
+from workout_api.contrib.instrumentation import InstrumentedQueuePool
+from workout_api.contrib.replicas import ReplicaSet
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {"echo": False, "query_cache_size": settings.DB_QUERY_CACHE_SIZE}
+
+    if make_url(url).get_backend_name() == "postgresql":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+        )
+
+    return options
+
 
-engine = create_async_engine(settings.DB_URL, echo=False)
+engine = create_async_engine(settings.DB_URL, **engine_options(settings.DB_URL))
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+replicas = ReplicaSet(
+    [create_async_engine(url, **engine_options(url)) for url in settings.DB_REPLICA_URLS],
+    max_lag=settings.DB_REPLICA_MAX_LAG,
+    interval=settings.DB_REPLICA_CHECK_INTERVAL,
+)
+
+admission = AdmissionController(
+    capacidade=settings.ADMISSION_CAPACITY or settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+    fila_max=settings.ADMISSION_QUEUE_SIZE,
+    espera_max=settings.ADMISSION_MAX_WAIT,
+    alvo_espera_pool=settings.ADMISSION_POOL_WAIT_TARGET,
+    pool_wait=lambda: getattr(engine.pool, "checkout_wait", 0.0),
+)
+
+
+@asynccontextmanager
+async def primary_session(request: Request) -> AsyncIterator[AsyncSession]:
+    if not settings.ADMISSION_ENABLED:
+        async with async_session() as session:
+            yield session
+        return
+
+    async with admission.slot(request):
+        async with async_session() as session:
+            yield session
+
+
+@asynccontextmanager
+async def admitted_session(rota: str, prioridade: str) -> AsyncIterator[AsyncSession]:
+    """Sessão no primário aberta fora da dependência de uma rota, com uma vaga de admissão própria.
+
+    Usada por lotes de escritas agrupadas e por cargas do cache de respostas: as requisições que aguardam o lote
+    ou a carga não ocupam vaga nem sessão enquanto esperam.
+    """
+    if not settings.ADMISSION_ENABLED:
+        async with async_session() as session:
+            yield session
+        return
+
+    async with admission.vaga(prioridade, rota):
+        async with async_session() as session:
+            yield session
+
+
+async def get_session(request: Request) -> AsyncGenerator:
+    async with primary_session(request) as session:
+        yield session
+
+
+async def get_read_session(request: Request) -> AsyncGenerator:
+    """Sessão para consultas: em uma réplica quando houver uma disponível, senão no primário.
+
+    Réplicas têm pool próprio e não passam pelo controle de admissão, que protege o pool do primário.
+    """
+    replica = replicas.escolher(request)
+
+    if replica is None:
+        async with primary_session(request) as session:
+            yield session
+        return
 
-async def get_session() -> AsyncGenerator:
-    async with async_session() as session:
+    async with replica.session() as session:
         yield session
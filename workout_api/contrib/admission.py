@@ -0,0 +1,198 @@
+import asyncio
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from math import ceil
+from time import monotonic
+from typing import AsyncIterator, Callable, Iterable, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, status
+
+# Fração da capacidade que cada prioridade pode ocupar: operações em lote nunca tomam o pool inteiro
+PRIORIDADES = {"leitura": 1.0, "escrita": 0.8, "lote": 0.4}
+
+
+class Politica(NamedTuple):
+    prioridade: str
+    limite: Optional[int] = None
+
+
+def prioridade(nome: str, limite: Optional[int] = None):
+    """Dependência de rota que define a prioridade e o limite de requisições simultâneas da rota.
+
+    Deve vir em `dependencies=[...]` do decorator, que o FastAPI resolve antes da sessão do banco.
+    """
+    if nome not in PRIORIDADES:
+        raise ValueError(f"Prioridade inválida: {nome}")
+
+    def dependency(request: Request) -> None:
+        request.state.admissao = Politica(nome, limite)
+
+    return dependency
+
+
+class Rejeitada(Exception):
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Pedido:
+    prioridade: str
+    rota: str
+    limite: Optional[int]
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class AdmissionController:
+    """Limita as requisições que usam o banco a uma capacidade derivada do pool de conexões.
+
+    Acima da capacidade (ou do limite da rota), a requisição entra em uma fila por prioridade; quando uma vaga
+    abre, as filas são atendidas na ordem leitura, escrita, lote. Uma requisição é rejeitada de imediato, com o
+    tempo estimado para nova tentativa, se a fila estiver cheia ou se a espera estimada passar de `espera_max`;
+    quem entra na fila e não é atendido até o prazo também é rejeitado.
+
+    A capacidade efetiva se ajusta pela espera média por uma conexão (`pool_wait`): cai 10% quando passa de
+    `alvo_espera_pool` (o pool está disputado por outras tarefas ou conexões lentas) e volta gradualmente
+    quando normaliza.
+    """
+
+    def __init__(
+        self,
+        capacidade: int,
+        fila_max: int,
+        espera_max: float,
+        alvo_espera_pool: float,
+        pool_wait: Callable[[], float] = lambda: 0.0,
+    ) -> None:
+        self.capacidade = capacidade
+        self.capacidade_efetiva = float(capacidade)
+        self.fila_max = fila_max
+        self.espera_max = espera_max
+        self.alvo_espera_pool = alvo_espera_pool
+        self.pool_wait = pool_wait
+        self.em_uso = 0
+        self.por_rota: Counter = Counter()
+        self.filas: dict[str, deque[_Pedido]] = {nome: deque() for nome in PRIORIDADES}
+        self.duracao_media = 0.05
+        self.admitidas: Counter = Counter()
+        self.rejeitadas: Counter = Counter()
+
+    def limite(self, prioridade: str) -> int:
+        return max(1, int(self.capacidade_efetiva * PRIORIDADES[prioridade]))
+
+    def _livre(self, pedido: _Pedido) -> bool:
+        return self.em_uso < self.limite(pedido.prioridade) and (
+            pedido.limite is None or self.por_rota[pedido.rota] < pedido.limite
+        )
+
+    def _na_frente(self, prioridade: str) -> int:
+        ordem = list(PRIORIDADES)
+        return sum(len(self.filas[nome]) for nome in ordem[:ordem.index(prioridade) + 1])
+
+    def estimativa(self, prioridade: str) -> float:
+        """Segundos estimados até uma nova requisição com esta prioridade ser admitida."""
+        return (self._na_frente(prioridade) + 1) * self.duracao_media / self.limite(prioridade)
+
+    async def acquire(self, prioridade: str, rota: str, limite: Optional[int] = None) -> None:
+        pedido = _Pedido(prioridade, rota, limite)
+
+        if self._na_frente(prioridade) == 0 and self._livre(pedido):
+            self._admitir(pedido)
+            return
+
+        estimativa = self.estimativa(prioridade)
+        if sum(map(len, self.filas.values())) >= self.fila_max or estimativa > self.espera_max:
+            self.rejeitadas[prioridade] += 1
+            raise Rejeitada(estimativa)
+
+        self.filas[prioridade].append(pedido)
+        self._despachar()
+        try:
+            await asyncio.wait_for(asyncio.shield(pedido.future), self.espera_max)
+        except asyncio.TimeoutError:
+            if pedido.future.done():
+                return
+            self.filas[prioridade].remove(pedido)
+            self.rejeitadas[prioridade] += 1
+            raise Rejeitada(self.estimativa(prioridade))
+        except asyncio.CancelledError:
+            if pedido.future.done():
+                self.release(pedido.rota, 0.0)
+            else:
+                self.filas[prioridade].remove(pedido)
+            raise
+
+    def _admitir(self, pedido: _Pedido) -> None:
+        self.em_uso += 1
+        self.por_rota[pedido.rota] += 1
+        self.admitidas[pedido.prioridade] += 1
+
+    def release(self, rota: str, duracao: float) -> None:
+        self.em_uso -= 1
+        self.por_rota[rota] -= 1
+        self.duracao_media += (duracao - self.duracao_media) * 0.1
+        self._ajustar()
+        self._despachar()
+
+    def _ajustar(self) -> None:
+        espera = self.pool_wait()
+        if espera > self.alvo_espera_pool:
+            self.capacidade_efetiva = max(1.0, self.capacidade_efetiva * 0.9)
+        elif espera < self.alvo_espera_pool / 2:
+            self.capacidade_efetiva = min(
+                float(self.capacidade), self.capacidade_efetiva + 1 / self.capacidade_efetiva
+            )
+
+    def _despachar(self) -> None:
+        for fila in self.filas.values():
+            for pedido in list(fila):
+                if not self._livre(pedido):
+                    continue
+                fila.remove(pedido)
+                self._admitir(pedido)
+                pedido.future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, request: Request) -> AsyncIterator[None]:
+        politica = getattr(request.state, "admissao", None) or Politica(
+            "leitura" if request.method in ("GET", "HEAD") else "escrita"
+        )
+        rota = getattr(request.scope.get("route"), "path", request.url.path)
+
+        async with self.vaga(politica.prioridade, rota, politica.limite):
+            yield
+
+    @asynccontextmanager
+    async def vaga(self, prioridade: str, rota: str, limite: Optional[int] = None) -> AsyncIterator[None]:
+        """Ocupa uma vaga fora de uma requisição (ex.: um lote de escritas agrupadas); rejeição vira 503."""
+        try:
+            await self.acquire(prioridade, rota, limite)
+        except Rejeitada as rejeitada:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Serviço sobrecarregado, tente novamente em instantes",
+                headers={"Retry-After": str(max(1, ceil(rejeitada.retry_after)))},
+            )
+
+        inicio = monotonic()
+        try:
+            yield
+        finally:
+            self.release(rota, monotonic() - inicio)
+
+    def metrics(self) -> Iterable[str]:
+        yield "# TYPE admission_in_use gauge"
+        yield f"admission_in_use {self.em_uso}"
+        yield "# TYPE admission_capacity gauge"
+        yield f"admission_capacity {self.capacidade_efetiva}"
+        yield "# TYPE admission_pool_wait_seconds gauge"
+        yield f"admission_pool_wait_seconds {self.pool_wait()}"
+        yield "# TYPE admission_queued gauge"
+        for nome, fila in self.filas.items():
+            yield f'admission_queued{{priority="{nome}"}} {len(fila)}'
+        for metrica, contador in (("admission_admitted_total", self.admitidas),
+                                  ("admission_rejected_total", self.rejeitadas)):
+            yield f"# TYPE {metrica} counter"
+            for nome in PRIORIDADES:
+                yield f'{metrica}{{priority="{nome}"}} {contador[nome]}'
@@ -0,0 +1,64 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+FlushFunction = Callable[[list[T]], Awaitable[Sequence[Union[R, BaseException]]]]
+
+
+class WriteCoalescer(Generic[T, R]):
+    """Agrupa escritas concorrentes e as grava juntas.
+
+    Os itens recebidos dentro de `window` segundos (ou até `max_size` itens) são entregues de uma vez a `flush`,
+    que devolve um resultado ou uma exceção por item, na mesma ordem; cada chamador de `submit` recebe o seu.
+    """
+
+    def __init__(self, flush: FlushFunction, window: float, max_size: int) -> None:
+        self.flush = flush
+        self.window = window
+        self.max_size = max_size
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush_pending)
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        try:
+            results = await self.flush([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        self._flush_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from workout_api.configs.database import engine
+from workout_api.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# O payload de um NOTIFY é limitado a 8000 bytes
+MAX_IDS_PER_EVENT = 100
+WORKER_ID = f"{os.getpid()}-{uuid4().hex[:8]}"
+
+Handler = Callable[["ChangeEvent"], Awaitable[None]]
+
+
+@dataclass
+class ChangeEvent:
+    entidade: str
+    acao: str
+    ids: list[str]
+    origem: str = field(default=WORKER_ID)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "ChangeEvent":
+        return cls(**json.loads(payload))
+
+
+class Subscription:
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[Optional[ChangeEvent]] = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, event: ChangeEvent) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[ChangeEvent]:
+        """Próximo evento, ou None quando a assinatura foi encerrada; `asyncio.TimeoutError` após `timeout`."""
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class ChangeFeed(ABC):
+    """Publica eventos de escrita e os distribui aos handlers locais (invalidação de cache) e aos assinantes (SSE).
+
+    Por padrão, handlers não são chamados para eventos publicados pelo próprio worker, que já invalidou seus caches.
+    """
+
+    def __init__(self, subscriber_queue_size: int = 1000) -> None:
+        self.handlers: defaultdict[str, list[tuple[Handler, bool]]] = defaultdict(list)
+        self.reset_handlers: list[Callable[[], Awaitable[None]]] = []
+        self.subscriptions: set[Subscription] = set()
+        self.subscriber_queue_size = subscriber_queue_size
+
+    def on(self, entidade: str, handler: Handler, local: bool = False) -> None:
+        """Registra `handler` para os eventos de `entidade`; com `local`, também para os publicados por este worker."""
+        self.handlers[entidade].append((handler, local))
+
+    def on_reset(self, handler: Callable[[], Awaitable[None]]) -> None:
+        """Chamado quando eventos podem ter sido perdidos (ex.: reconexão), para limpar os caches locais."""
+        self.reset_handlers.append(handler)
+
+    async def publish(self, entidade: str, acao: str, ids: Iterable[Any]) -> None:
+        ids = [str(id_) for id_ in ids]
+        for start in range(0, len(ids), MAX_IDS_PER_EVENT):
+            try:
+                await self._send(ChangeEvent(entidade, acao, ids[start:start + MAX_IDS_PER_EVENT]))
+            except Exception:
+                logger.warning("Falha ao publicar evento de %s", entidade, exc_info=True)
+
+    async def dispatch(self, event: ChangeEvent) -> None:
+        for handler, local in self.handlers[event.entidade]:
+            if event.origem == WORKER_ID and not local:
+                continue
+            try:
+                await handler(event)
+            except Exception:
+                logger.warning("Falha ao processar evento %s", event, exc_info=True)
+
+        for subscription in list(self.subscriptions):
+            if not subscription.put(event):
+                # Assinante lento demais: encerra a assinatura em vez de acumular eventos
+                self.unsubscribe(subscription)
+                subscription.close()
+
+    async def reset(self) -> None:
+        for handler in self.reset_handlers:
+            await handler()
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.subscriber_queue_size)
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscriptions.discard(subscription)
+
+    @abstractmethod
+    async def _send(self, event: ChangeEvent) -> None:
+        ...
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        for subscription in list(self.subscriptions):
+            self.unsubscribe(subscription)
+            subscription.close()
+
+
+class MemoryChangeFeed(ChangeFeed):
+    """Distribuição apenas dentro do processo; usada com SQLite, em testes ou com um único worker."""
+
+    async def _send(self, event: ChangeEvent) -> None:
+        await self.dispatch(event)
+
+
+class PostgresChangeFeed(ChangeFeed):
+    """Distribui os eventos entre workers via LISTEN/NOTIFY.
+
+    Escuta em uma conexão asyncpg dedicada e envia os NOTIFY por uma conexão do pool de `engine`: eventos
+    publicados enquanto a conexão de escuta reconecta ainda chegam aos demais workers.
+    """
+
+    def __init__(self, dsn: str, channel: str, engine: AsyncEngine, reconnect_delay: float = 1.0) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.engine = engine
+        self.reconnect_delay = reconnect_delay
+        self._connection = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        # Referências das tasks de distribuição: sem elas o loop pode descartá-las antes de terminarem
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def _send(self, event: ChangeEvent) -> None:
+        async with self.engine.begin() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": event.to_json()}
+            )
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        task = asyncio.create_task(self._dispatch_notification(payload))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch_notification(self, payload: str) -> None:
+        try:
+            await self.dispatch(ChangeEvent.from_json(payload))
+        except Exception:
+            logger.exception("Falha ao distribuir notificação do feed de alterações: %s", payload)
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        primeira = True
+        while True:
+            try:
+                self._connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                self._connection.add_termination_listener(lambda _: lost.set())
+                await self._connection.add_listener(self.channel, self._on_notification)
+                self._connected.set()
+
+                if not primeira:
+                    await self.reset()
+                primeira = False
+
+                await lost.wait()
+                logger.warning("Conexão do feed de alterações perdida; reconectando")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Falha ao conectar o feed de alterações", exc_info=True)
+            finally:
+                self._connected.clear()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("Feed de alterações ainda não conectado; seguindo em segundo plano")
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+
+
+def create_change_feed() -> ChangeFeed:
+    url = make_url(settings.DB_URL)
+
+    if settings.CHANGE_FEED_BACKEND == "postgres" and url.get_backend_name() == "postgresql":
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        return PostgresChangeFeed(dsn, settings.CHANGE_FEED_CHANNEL, engine)
+
+    return MemoryChangeFeed()
+
+
+change_feed = create_change_feed()
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = blake2b(":".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def validators(etag: str, last_modified: Optional[datetime] = None) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def _opaque(etag: str) -> str:
+    return etag.strip().removeprefix("W/")
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Avalia `If-None-Match` (comparação fraca) ou, na sua ausência, `If-Modified-Since`."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return if_none_match.strip() == "*" or _opaque(etag) in {_opaque(tag) for tag in if_none_match.split(",")}
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+def not_modified(
+    request: Request, response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> Optional[Response]:
+    """Resposta 304 quando o cliente já tem a versão atual; caso contrário grava `ETag` e `Last-Modified` em
+    `response` e retorna None. Rotas que retornam um `Response` próprio devem repassar `validators(...)`.
+    """
+    headers = validators(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def cache_control(policy: str):
+    """Dependência que define o `Cache-Control` das respostas GET; a de uma rota prevalece sobre a do router,
+    que roda antes.
+    """
+
+    def dependency(request: Request) -> None:
+        request.state.cache_control = policy
+
+    return dependency
+
+
+class CacheControlMiddleware:
+    """Aplica a política registrada por `cache_control` às respostas 200 e 304 de GET/HEAD que não a definiram.
+
+    Funciona também para rotas que retornam um `Response` pronto, cujos cabeçalhos o FastAPI não mescla.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                policy = scope.get("state", {}).get("cache_control")
+                headers = MutableHeaders(scope=message)
+                if policy and "cache-control" not in headers:
+                    headers["Cache-Control"] = policy
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
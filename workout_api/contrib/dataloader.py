@@ -0,0 +1,69 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFunction = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """Agrupa as chaves pedidas na mesma volta do event loop em uma única chamada a `batch_load`.
+
+    Deve viver apenas durante uma requisição: cada chave é buscada uma vez e o resultado fica memorizado.
+    `batch_load` recebe as chaves sem repetição e devolve um mapeamento chave → valor; chaves ausentes resultam
+    em None. Loaders que compartilham uma sessão do banco devem receber o mesmo `lock`, já que a sessão não aceita
+    consultas simultâneas.
+    """
+
+    def __init__(
+        self, batch_load: BatchLoadFunction, max_batch_size: int = 500, lock: Optional[asyncio.Lock] = None
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.lock = lock or asyncio.Lock()
+        self._futures: dict[K, asyncio.Future] = {}
+        self._pendentes: list[K] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def _future(self, key: K) -> asyncio.Future:
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._pendentes.append(key)
+            if len(self._pendentes) == 1:
+                loop.call_soon(self._despachar)
+        return future
+
+    async def load(self, key: K) -> Optional[V]:
+        return await self._future(key)
+
+    async def load_many(self, keys: Iterable[K]) -> list[Optional[V]]:
+        return list(await asyncio.gather(*[self._future(key) for key in keys]))
+
+    def _despachar(self) -> None:
+        pendentes, self._pendentes = self._pendentes, []
+        for inicio in range(0, len(pendentes), self.max_batch_size):
+            task = asyncio.create_task(self._carregar(pendentes[inicio:inicio + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _carregar(self, keys: list[K]) -> None:
+        try:
+            async with self.lock:
+                valores = await self.batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            # Quem pediu a chave pode ter sido cancelado; as demais chaves do lote ainda recebem o resultado
+            if future.cancelled():
+                del self._futures[key]
+            else:
+                future.set_result(valores.get(key))
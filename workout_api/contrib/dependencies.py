@@ -1,6 +1,7 @@
 from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from workout_api.configs.database import get_session
+from workout_api.configs.database import get_read_session, get_session
 
 DatabaseDependency = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlyDatabaseDependency = Annotated[AsyncSession, Depends(get_read_session)]
@@ -0,0 +1,65 @@
+from typing import Any, Sequence
+
+from sqlalchemy import any_, bindparam, cast, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+
+def insert(db_session: AsyncSession, model):
+    """INSERT com suporte a ON CONFLICT para o dialeto da sessão (PostgreSQL ou SQLite)."""
+    if db_session.bind.dialect.name == "sqlite":
+        return sqlite.insert(model)
+
+    return postgresql.insert(model)
+
+
+def in_array(db_session: AsyncSession, column: Any, values: Sequence[Any]) -> ColumnElement[bool]:
+    """`column = ANY(:values)` no PostgreSQL: um único parâmetro do tipo array, então o comando preparado é o mesmo
+    para qualquer quantidade de valores. Nos demais bancos, `IN`.
+    """
+    if db_session.bind.dialect.name == "postgresql":
+        return column == any_(bindparam(None, list(values), type_=postgresql.ARRAY(column.type)))
+
+    return column.in_(values)
+
+
+def insert_many(db_session: AsyncSession, model, rows: Sequence[dict[str, Any]]):
+    """INSERT de várias linhas. No PostgreSQL, `INSERT ... SELECT unnest(:coluna), ...` com um array por coluna: o
+    comando preparado é o mesmo para qualquer quantidade de linhas. Nos demais bancos, um único VALUES.
+
+    Defaults do lado do Python não são aplicados: todas as colunas vêm em `rows`.
+    """
+    statement = insert(db_session, model)
+    if db_session.bind.dialect.name != "postgresql":
+        return statement.values(list(rows))
+
+    columns = list(rows[0])
+    arrays = []
+    for name in columns:
+        array_type = postgresql.ARRAY(model.__table__.c[name].type)
+        values = bindparam(None, [row[name] for row in rows], type_=array_type)
+        # O tipo explícito é necessário: unnest() aceita qualquer array e não informa o tipo do parâmetro
+        arrays.append(func.unnest(cast(values, array_type)).label(name))
+    return statement.from_select(columns, select(*arrays))
+
+
+def least(db_session: AsyncSession, *values: Any) -> ColumnElement:
+    """`least(...)` no PostgreSQL; `min(...)` com vários argumentos no SQLite."""
+    return func.min(*values) if db_session.bind.dialect.name == "sqlite" else func.least(*values)
+
+
+def greatest(db_session: AsyncSession, *values: Any) -> ColumnElement:
+    return func.max(*values) if db_session.bind.dialect.name == "sqlite" else func.greatest(*values)
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Se a violação de integridade é de unicidade, pelo código do erro do driver (SQLSTATE 23505 no PostgreSQL)
+    em vez do texto da mensagem.
+    """
+    orig = error.orig
+    return (
+        getattr(orig, "sqlstate", None) == "23505"
+        or getattr(orig, "sqlite_errorname", None) in ("SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY")
+    )
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from hashlib import blake2b
+from typing import NamedTuple, Optional
+
+from fastapi import Header, Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from workout_api.contrib.response_cache import CacheBackend
+
+HEADER = "Idempotency-Key"
+
+
+class RespostaSalva(NamedTuple):
+    fingerprint: bytes
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    def dumps(self) -> bytes:
+        headers = [[name.decode("latin-1"), value.decode("latin-1")] for name, value in self.headers]
+        return json.dumps([self.fingerprint.hex(), self.status, headers]).encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "RespostaSalva":
+        head, _, body = data.partition(b"\n")
+        fingerprint, status, headers = json.loads(head)
+        return cls(bytes.fromhex(fingerprint), status,
+                   [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers], body)
+
+
+def idempotency_key(
+    request: Request,
+    key: Optional[str] = Header(
+        None, alias=HEADER, max_length=255,
+        description="Chave única da operação: repetições com a mesma chave recebem a resposta original"
+    )
+) -> None:
+    """Dependência das rotas cujas respostas podem ser reaproveitadas por `IdempotencyMiddleware`."""
+    if key is not None:
+        request.state.idempotente = True
+
+
+class IdempotencyMiddleware:
+    """Guarda em `backend` a resposta de POSTs com `Idempotency-Key` em rotas que usam a dependência
+    `idempotency_key`. Repetições com o mesmo corpo recebem a resposta salva (com `Idempotent-Replayed: true`) sem
+    executar a rota; com outro corpo, 422. Respostas 5xx não são guardadas, para que a repetição possa ter sucesso.
+
+    A chave vale por cliente: combina rota, `Idempotency-Key` e a identidade de quem chama (o cabeçalho
+    `Authorization`, ou o IP quando não há um), então clientes diferentes não recebem a resposta um do outro.
+
+    Com vários workers, respostas concluídas só são vistas pelos demais se `backend` for compartilhado
+    (`IDEMPOTENCY_BACKEND`); com o padrão em memória, uma repetição atendida por outro worker executa a rota de
+    novo. A espera de repetições concorrentes pela primeira vale apenas dentro do mesmo worker.
+    """
+
+    def __init__(self, app: ASGIApp, backend: CacheBackend) -> None:
+        self.app = app
+        self.backend = backend
+        self.em_andamento: dict[str, asyncio.Event] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self._key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        while (evento := self.em_andamento.get(key)) is not None:
+            await evento.wait()
+
+        salva = await self.backend.get(key)
+        if salva is not None:
+            fingerprint = blake2b(digest_size=16)
+            while True:
+                message = await receive()
+                fingerprint.update(message.get("body", b""))
+                if not message.get("more_body", False):
+                    break
+            await self._replay(RespostaSalva.loads(salva), fingerprint.digest(), send)
+            return
+
+        self.em_andamento[key] = evento = asyncio.Event()
+        try:
+            await self._run(key, scope, receive, send)
+        finally:
+            del self.em_andamento[key]
+            evento.set()
+
+    def _key(self, scope: Scope) -> Optional[str]:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            return None
+
+        headers = dict(scope["headers"])
+        key = headers.get(b"idempotency-key")
+        if key is None:
+            return None
+
+        cliente = headers.get(b"authorization") or (scope.get("client") or ("",))[0].encode()
+        digest = blake2b(digest_size=16)
+        for parte in (scope["path"].encode(), cliente, key):
+            digest.update(len(parte).to_bytes(4, "big") + parte)
+        return f"idempotency:{digest.hexdigest()}"
+
+    async def _replay(self, salva: RespostaSalva, fingerprint: bytes, send: Send) -> None:
+        if fingerprint != salva.fingerprint:
+            body = f'{{"detail":"{HEADER} já usada com outro corpo de requisição"}}'.encode()
+            status = 422
+            headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        else:
+            status, headers, body = salva.status, [*salva.headers, (b"idempotent-replayed", b"true")], salva.body
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _run(self, key: str, scope: Scope, receive: Receive, send: Send) -> None:
+        fingerprint = blake2b(digest_size=16)
+        response: dict = {}
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                fingerprint.update(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            # A dependência já rodou quando a resposta começa; rotas sem ela não têm o corpo guardado
+            if message["type"] == "http.response.start":
+                if scope.get("state", {}).get("idempotente") and message["status"] < 500:
+                    response.update(status=message["status"], headers=list(message.get("headers", [])), body=[])
+            elif message["type"] == "http.response.body" and response:
+                response["body"].append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
+
+        if response:
+            await self.backend.set(key, RespostaSalva(
+                fingerprint.digest(), response["status"], response["headers"], b"".join(response["body"])
+            ).dumps())
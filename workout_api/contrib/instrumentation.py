@@ -0,0 +1,238 @@
+import logging
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional
+
+import fastapi.routing
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    serialize_time: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def server_timing(self, total: float) -> str:
+        return ", ".join((
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+            f"pool;dur={self.pool_wait * 1000:.2f}",
+            f"serialize;dur={self.serialize_time * 1000:.2f}",
+            f"total;dur={total * 1000:.2f}",
+        ))
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool que contabiliza o tempo de espera por uma conexão na requisição corrente e mantém a média móvel
+    dessa espera em `checkout_wait`.
+    """
+
+    checkout_wait: float = 0.0
+
+    def _do_get(self) -> Any:
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait = perf_counter() - start
+            self.checkout_wait += (wait - self.checkout_wait) * 0.1
+            stats = _current.get()
+            if stats is not None:
+                stats.pool_wait += wait
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._instrumentation_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    if stats is None or context is None:
+        return
+
+    stats.queries += 1
+    stats.db_time += perf_counter() - getattr(context, "_instrumentation_start", perf_counter())
+    stats.statements[statement] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    if not event.contains(engine.sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def instrument_serialization() -> None:
+    """Mede o tempo gasto pelo FastAPI validando e convertendo o retorno das rotas (`serialize_response`)."""
+    original = fastapi.routing.serialize_response
+    if getattr(original, "__instrumented__", False):
+        return
+
+    async def serialize_response(*args: Any, **kwargs: Any) -> Any:
+        stats = _current.get()
+        start = perf_counter()
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            if stats is not None:
+                stats.serialize_time += perf_counter() - start
+
+    serialize_response.__instrumented__ = True
+    fastapi.routing.serialize_response = serialize_response
+
+
+def _escape(value: Any) -> str:
+    # Formato de exposição do Prometheus: barra invertida, aspas e quebra de linha
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+@dataclass
+class _RouteMetrics:
+    count: int = 0
+    duration: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    queries: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    serialize_time: float = 0.0
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.requests: Counter = Counter()
+        self.routes: defaultdict[tuple[str, str], _RouteMetrics] = defaultdict(_RouteMetrics)
+        self.collectors: list[Callable[[], Iterable[str]]] = []
+
+    def observe(self, method: str, route: str, status_code: int, duration: float, stats: RequestStats) -> None:
+        self.requests[(method, route, status_code)] += 1
+
+        route_metrics = self.routes[(method, route)]
+        route_metrics.count += 1
+        route_metrics.duration += duration
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+        if bucket < len(LATENCY_BUCKETS):
+            route_metrics.buckets[bucket] += 1
+        route_metrics.queries += stats.queries
+        route_metrics.db_time += stats.db_time
+        route_metrics.pool_wait += stats.pool_wait
+        route_metrics.serialize_time += stats.serialize_time
+
+    def render(self) -> str:
+        lines = ["# TYPE http_requests_total counter"]
+        for (method, route, status_code), count in sorted(self.requests.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status_code)} {count}")
+
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for (method, route), route_metrics in sorted(self.routes.items()):
+            cumulative = 0
+            for upper, count in zip(LATENCY_BUCKETS, route_metrics.buckets):
+                cumulative += count
+                lines.append(f"http_request_duration_seconds_bucket"
+                             f"{_labels(method=method, route=route, le=upper)} {cumulative}")
+            lines.append(f"http_request_duration_seconds_bucket"
+                         f"{_labels(method=method, route=route, le='+Inf')} {route_metrics.count}")
+            lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {route_metrics.duration}")
+            lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {route_metrics.count}")
+
+        for name, attribute in (
+            ("db_queries_total", "queries"),
+            ("db_time_seconds_total", "db_time"),
+            ("db_pool_wait_seconds_total", "pool_wait"),
+            ("response_serialization_seconds_total", "serialize_time"),
+        ):
+            lines.append(f"# TYPE {name} counter")
+            for (method, route), route_metrics in sorted(self.routes.items()):
+                lines.append(f"{name}{_labels(method=method, route=route)} {getattr(route_metrics, attribute)}")
+
+        for collector in self.collectors:
+            lines.extend(collector())
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+class InstrumentationMiddleware:
+    """Mede consultas, tempo de banco, espera pelo pool e serialização de cada requisição HTTP.
+
+    Os valores são publicados no cabeçalho `Server-Timing` e agregados em `metrics`. Com `repeat_threshold`,
+    registra um aviso quando a mesma consulta é executada mais vezes que o limite em uma única requisição.
+    """
+
+    def __init__(
+        self, app: ASGIApp, server_timing: bool = True, repeat_threshold: int = 0, registry: Metrics = metrics
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.repeat_threshold = repeat_threshold
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self.registry.observe(scope["method"], route, status_code, perf_counter() - start, stats)
+            self._check_repeated(scope["method"], route, stats)
+
+    def _check_repeated(self, method: str, route: str, stats: RequestStats) -> None:
+        if not self.repeat_threshold:
+            return
+
+        for statement, count in stats.statements.items():
+            if count > self.repeat_threshold:
+                logger.warning("%s %s executou %d vezes a mesma consulta (possível N+1): %s",
+                               method, route, count, " ".join(statement.split())[:300])
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,8 +1,14 @@
+from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import UUID
+from sqlalchemy import UUID, DateTime
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 
 class BaseModel(DeclarativeBase):
-    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), default=uuid4, nullable=False)
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), default=uuid4, nullable=False, unique=True, index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
@@ -0,0 +1,140 @@
+import json
+from math import ceil
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, status
+from fastapi_pagination.api import apply_items_transformer, create_page, resolve_params
+from fastapi_pagination.bases import CursorRawParams
+from fastapi_pagination import Params
+from fastapi_pagination.cursor import CursorPage, CursorParams, decode_cursor, encode_cursor
+from fastapi_pagination.ext.utils import unwrap_scalars
+from fastapi_pagination.types import SyncItemsTransformer
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import Select
+
+T = TypeVar("T")
+
+
+class KeysetParams(CursorParams):
+    size: int = Query(50, ge=1, le=500, description="Quantidade de itens por página")
+    include_total: bool = Query(False, description="Inclui a contagem total de itens (executa um COUNT)")
+
+    def to_raw_params(self) -> CursorRawParams:
+        try:
+            cursor = decode_cursor(self.cursor, to_str=self.str_cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+
+        return CursorRawParams(
+            cursor=cursor,
+            size=self.size,
+            include_total=self.include_total,
+        )
+
+
+class KeysetPage(CursorPage[T], Generic[T]):
+    __params_type__ = KeysetParams
+
+
+def _decode_keys(cursor: Optional[str], size: int) -> Optional[list]:
+    if cursor is None:
+        return None
+
+    try:
+        keys = json.loads(cursor)
+    except ValueError:
+        keys = None
+
+    if not isinstance(keys, list) or len(keys) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+
+    return keys
+
+
+async def _fetch_keyset(
+    db_session: AsyncSession,
+    query: Select,
+    keys: Sequence[InstrumentedAttribute],
+    params: KeysetParams,
+    total: Optional[int] = None,
+) -> tuple[Sequence[Any], Optional[int], Optional[str]]:
+    raw_params = params.to_raw_params()
+
+    if total is None and raw_params.include_total:
+        count = select(func.count()).select_from(query.order_by(None).subquery())
+        total = await db_session.scalar(count)
+
+    after = _decode_keys(raw_params.cursor, len(keys))
+    if after is not None:
+        query = query.where(tuple_(*keys) > tuple_(*after))
+
+    rows = unwrap_scalars((await db_session.execute(query.order_by(*keys).limit(raw_params.size + 1))).all())
+    items: Sequence[Any] = rows[:raw_params.size]
+
+    next_ = None
+    if len(rows) > raw_params.size:
+        last = items[-1]
+        next_ = json.dumps([getattr(last, key.key) for key in keys])
+
+    return items, total, next_
+
+
+async def paginate_keyset(
+    db_session: AsyncSession,
+    query: Select,
+    *keys: InstrumentedAttribute,
+    params: Optional[KeysetParams] = None,
+    transformer: Optional[SyncItemsTransformer] = None,
+    total: Optional[int] = None,
+) -> KeysetPage[Any]:
+    """Página ordenada por `keys`; `total`, quando já conhecido, é usado no lugar do COUNT."""
+    params = resolve_params(params)
+    items, total, next_ = await _fetch_keyset(db_session, query, keys, params, total)
+
+    return create_page(apply_items_transformer(items, transformer), total=total, params=params, next_=next_)
+
+
+async def paginate_keyset_content(
+    db_session: AsyncSession,
+    query: Select,
+    *keys: InstrumentedAttribute,
+    transformer: SyncItemsTransformer,
+    params: Optional[KeysetParams] = None,
+    total: Optional[int] = None,
+) -> dict[str, Any]:
+    """Mesma página de `paginate_keyset`, como dicionário pronto para serializar, sem validar os itens."""
+    params = resolve_params(params)
+    items, total, next_ = await _fetch_keyset(db_session, query, keys, params, total)
+
+    return {
+        "items": transformer(items),
+        "total": total,
+        "current_page": None,
+        "current_page_backwards": None,
+        "previous_page": None,
+        "next_page": encode_cursor(next_),
+    }
+
+
+async def paginate_content(
+    db_session: AsyncSession,
+    query: Select,
+    transformer: SyncItemsTransformer,
+    params: Optional[Params] = None,
+) -> dict[str, Any]:
+    """Mesma página do `paginate` do fastapi_pagination, como dicionário pronto para serializar, sem validar os itens."""
+    params = resolve_params(params)
+    raw_params = params.to_raw_params()
+
+    total = await db_session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    rows = unwrap_scalars((await db_session.execute(query.limit(raw_params.limit).offset(raw_params.offset))).all())
+
+    return {
+        "items": transformer(rows),
+        "total": total,
+        "page": params.page,
+        "size": params.size,
+        "pages": ceil(total / params.size) if params.size else None,
+    }
@@ -0,0 +1,226 @@
+import asyncio
+import random
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter, sleep
+from types import FrameType
+from typing import Annotated, Any, Iterable, Optional
+
+from fastapi import APIRouter, Query, status
+from greenlet import getcurrent, greenlet
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from workout_api.configs.settings import settings
+
+Pilha = tuple[str, ...]
+
+
+def _frame(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _subir(frame: Optional[FrameType], raiz: FrameType) -> tuple[list[str], bool]:
+    frames = []
+    while frame is not None:
+        frames.append(_frame(frame))
+        if frame is raiz:
+            return frames, True
+        frame = frame.f_back
+    return frames, False
+
+
+def _pilha_em_execucao(frame: Optional[FrameType], raiz: FrameType, loop: Optional[FrameType]) -> Optional[Pilha]:
+    """Frames da thread do loop, da função em execução até `raiz`.
+
+    Dentro de um greenlet do SQLAlchemy (código síncrono do ORM) a pilha da thread termina na função do
+    greenlet; o restante vem do greenlet do loop (`loop`), suspenso em `greenlet_spawn`.
+    """
+    frames, completa = _subir(frame, raiz)
+    if not completa and loop is not None:
+        restante, completa = _subir(loop, raiz)
+        frames += restante
+    return tuple(reversed(frames)) if completa else None
+
+
+def _pilha_suspensa(coro: Any, raiz: FrameType) -> Pilha:
+    """Cadeia de `await` de uma task parada, de `raiz` até o que ela aguarda (consulta, pool, ...)."""
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        if frame is raiz:
+            frames.clear()
+        frames.append(_frame(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    return tuple(frames)
+
+
+@dataclass
+class _Requisicao:
+    task: asyncio.Task
+    raiz: FrameType
+    amostras: Counter = field(default_factory=Counter)
+
+
+class SamplingProfiler:
+    """Amostra, a cada `intervalo` segundos, a pilha de uma fração (`taxa`) das requisições em andamento.
+
+    A amostragem é por tempo de relógio: a task em execução contribui com a pilha da thread do loop e as
+    demais com a cadeia de `await` em que estão paradas, de modo que a espera pelo banco ou pelo pool aparece
+    tanto quanto o uso de CPU (compilação de SQL, validação do Pydantic, paginação). Ao final, apenas as
+    requisições acima de `limiar` segundos são agregadas, por rota, no formato collapsed do flamegraph.
+
+    A thread de amostragem fica parada enquanto nenhuma requisição sorteada estiver em andamento.
+    """
+
+    def __init__(self, intervalo: float, limiar: float, taxa: float, max_pilhas: int) -> None:
+        self.intervalo = intervalo
+        self.limiar = limiar
+        self.taxa = taxa
+        self.max_pilhas = max_pilhas
+        self.pilhas: Counter = Counter()
+        self.amostradas = 0
+        self.lentas: Counter = Counter()
+        self.descartadas = 0
+        self._em_andamento: dict[int, _Requisicao] = {}
+        self._lock = threading.Lock()
+        self._acordar = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._loop_greenlet: Optional[greenlet] = None
+        self._thread: Optional[threading.Thread] = None
+        self._parar = False
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._loop_greenlet = getcurrent()
+        self._parar = False
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._parar = True
+            self._acordar.set()
+            self._thread.join()
+            self._thread = None
+
+    def sortear(self) -> bool:
+        return self._thread is not None and random.random() < self.taxa
+
+    def iniciar(self) -> _Requisicao:
+        # As pilhas começam em quem chamou (o middleware), sem os frames do servidor
+        requisicao = _Requisicao(asyncio.current_task(), sys._getframe(1))
+        self._em_andamento[id(requisicao)] = requisicao
+        self.amostradas += 1
+        self._acordar.set()
+        return requisicao
+
+    def finalizar(self, requisicao: _Requisicao, rota: str, duracao: float) -> None:
+        del self._em_andamento[id(requisicao)]
+        if duracao < self.limiar:
+            return
+
+        self.lentas[rota] += 1
+        with self._lock:
+            for pilha, amostras in requisicao.amostras.items():
+                chave = (rota, *pilha)
+                if chave not in self.pilhas and len(self.pilhas) >= self.max_pilhas:
+                    self.descartadas += amostras
+                    continue
+                self.pilhas[chave] += amostras
+
+    def _run(self) -> None:
+        while not self._parar:
+            self._acordar.clear()
+            if not self._em_andamento:
+                self._acordar.wait()
+                continue
+            self._amostrar()
+            sleep(self.intervalo)
+
+    def _amostrar(self) -> None:
+        frame = sys._current_frames().get(self._loop_thread)
+        loop = self._loop_greenlet.gr_frame
+        em_execucao = asyncio.current_task(self._loop)
+        # list() de um dict com chaves int é copiado sem liberar o GIL, mesmo com o loop alterando o dict
+        for requisicao in list(self._em_andamento.values()):
+            pilha = None
+            if requisicao.task is em_execucao:
+                pilha = _pilha_em_execucao(frame, requisicao.raiz, loop)
+            if pilha is None:
+                pilha = _pilha_suspensa(requisicao.task.get_coro(), requisicao.raiz)
+            with self._lock:
+                requisicao.amostras[pilha] += 1
+
+    def collapsed(self, prefixo: Optional[str] = None) -> str:
+        with self._lock:
+            pilhas = list(self.pilhas.items())
+        linhas = [
+            f"{';'.join(pilha)} {amostras}" for pilha, amostras in sorted(pilhas)
+            if prefixo is None or pilha[0].split(" ", 1)[1].startswith(prefixo)
+        ]
+        return "\n".join(linhas) + "\n" if linhas else ""
+
+    def clear(self) -> None:
+        with self._lock:
+            self.pilhas.clear()
+        self.lentas.clear()
+        self.descartadas = 0
+
+    def metrics(self) -> Iterable[str]:
+        yield "# TYPE profiler_sampled_requests_total counter"
+        yield f"profiler_sampled_requests_total {self.amostradas}"
+        yield "# TYPE profiler_slow_requests gauge"
+        for rota, total in sorted(self.lentas.items()):
+            metodo, caminho = rota.split(" ", 1)
+            yield f'profiler_slow_requests{{method="{metodo}",route="{caminho}"}} {total}'
+        yield "# TYPE profiler_dropped_samples gauge"
+        yield f"profiler_dropped_samples {self.descartadas}"
+
+
+class ProfilerMiddleware:
+    def __init__(self, app: ASGIApp, profiler: SamplingProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.sortear():
+            await self.app(scope, receive, send)
+            return
+
+        requisicao = self.profiler.iniciar()
+        inicio = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            rota = getattr(scope.get("route"), "path", "unmatched")
+            self.profiler.finalizar(requisicao, f"{scope['method']} {rota}", perf_counter() - inicio)
+
+
+profiler = SamplingProfiler(
+    intervalo=settings.PROFILER_INTERVAL_MS / 1000,
+    limiar=settings.PROFILER_SLOW_THRESHOLD_MS / 1000,
+    taxa=settings.PROFILER_SAMPLE_RATE,
+    max_pilhas=settings.PROFILER_MAX_STACKS,
+)
+
+router = APIRouter(prefix="/admin/profile", include_in_schema=False)
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_profile(
+    rota: Annotated[Optional[str], Query(description="Prefixo das rotas, ex.: /atletas")] = None,
+) -> PlainTextResponse:
+    """Uma linha por pilha, `METODO rota;modulo:funcao;... amostras`, para flamegraph.pl ou speedscope."""
+    return PlainTextResponse(profiler.collapsed(rota))
+
+
+@router.delete("", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_profile() -> None:
+    profiler.clear()
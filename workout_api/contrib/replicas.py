@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from itertools import count
+from time import time
+from typing import Callable, Iterable, Optional
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+STICKY_COOKIE = "workout_primary_until"
+
+# Réplica sem WAL pendente não está atrasada, mesmo que o primário esteja ocioso há muito tempo
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    session: Callable[[], AsyncSession]
+    saudavel: bool = False
+    atraso: Optional[float] = None
+    leituras: int = 0
+
+    @property
+    def nome(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+def is_replica(db_session: AsyncSession) -> bool:
+    return bool(db_session.info.get("replica"))
+
+
+class ReplicaSet:
+    """Réplicas de leitura escolhidas em rodízio entre as saudáveis com atraso até `max_lag` segundos.
+
+    A saúde e o atraso de cada réplica são verificados a cada `interval` segundos. Sem réplica disponível, ou
+    quando o cliente escreveu há pouco (cookie gravado por `ReadYourWritesMiddleware`), a leitura vai para o
+    primário.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], max_lag: float, interval: float) -> None:
+        self.replicas = [
+            Replica(engine, sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, info={"replica": True}))
+            for engine in engines
+        ]
+        self.max_lag = max_lag
+        self.interval = interval
+        self.leituras_primario = 0
+        self._rodizio = count()
+        self._task: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def sticky(self, request: Request) -> bool:
+        try:
+            return float(request.cookies.get(STICKY_COOKIE, 0)) > time()
+        except ValueError:
+            return False
+
+    def escolher(self, request: Request) -> Optional[Replica]:
+        disponiveis = [
+            replica for replica in self.replicas
+            if replica.saudavel and replica.atraso is not None and replica.atraso <= self.max_lag
+        ]
+
+        if not disponiveis or self.sticky(request):
+            self.leituras_primario += 1
+            return None
+
+        replica = disponiveis[next(self._rodizio) % len(disponiveis)]
+        replica.leituras += 1
+        return replica
+
+    async def _verificar(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                if connection.dialect.name == "postgresql":
+                    atraso = await asyncio.wait_for(connection.scalar(LAG_QUERY), self.interval)
+                else:
+                    atraso = await asyncio.wait_for(connection.scalar(text("SELECT 0")), self.interval)
+        except Exception:
+            if replica.saudavel:
+                logger.warning("Réplica %s indisponível", replica.nome, exc_info=True)
+            replica.saudavel, replica.atraso = False, None
+            return
+
+        if not replica.saudavel:
+            logger.info("Réplica %s disponível (atraso %.1fs)", replica.nome, float(atraso))
+        replica.saudavel, replica.atraso = True, float(atraso)
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._verificar(replica) for replica in self.replicas))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    async def start(self) -> None:
+        if self.replicas:
+            await self.check()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def metrics(self) -> Iterable[str]:
+        yield "# TYPE db_replica_up gauge"
+        for replica in self.replicas:
+            yield f'db_replica_up{{replica="{replica.nome}"}} {int(replica.saudavel)}'
+        yield "# TYPE db_replica_lag_seconds gauge"
+        for replica in self.replicas:
+            if replica.atraso is not None:
+                yield f'db_replica_lag_seconds{{replica="{replica.nome}"}} {replica.atraso}'
+        yield "# TYPE db_reads_total counter"
+        yield f'db_reads_total{{target="primary"}} {self.leituras_primario}'
+        for replica in self.replicas:
+            yield f'db_reads_total{{target="{replica.nome}"}} {replica.leituras}'
+
+
+class ReadYourWritesMiddleware:
+    """Após uma escrita bem-sucedida, grava um cookie que direciona as leituras do cliente ao primário por
+    `window` segundos, para que ele veja a própria alteração mesmo com réplicas atrasadas.
+    """
+
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            # POSTs que apenas consultam (ex.: /batch) declaram prioridade de leitura
+            admissao = scope.get("state", {}).get("admissao")
+            leitura = admissao is not None and admissao.prioridade == "leitura"
+            if message["type"] == "http.response.start" and message["status"] < 400 and not leitura:
+                MutableHeaders(scope=message).append("Set-Cookie", self._cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _cookie(self) -> str:
+        max_age = max(1, round(self.window))
+        return f"{STICKY_COOKIE}={time() + self.window:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
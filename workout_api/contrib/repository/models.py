@@ -1,3 +1,7 @@
+# Todos os modelos, para que os relacionamentos declarados pelo nome da classe se resolvam (Alembic, scripts)
 from workout_api.categorias.models import CategoriaModel
 from workout_api.atleta.models import AtletaModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.resultados.models import (
+    ResultadoAtletaPeriodoModel, ResultadoCentroPeriodoModel, ResultadoModel
+)
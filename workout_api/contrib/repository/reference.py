@@ -0,0 +1,167 @@
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Sequence, Type
+from uuid import UUID
+
+from pydantic import BaseModel as PydanticModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from workout_api.categorias.models import CategoriaModel
+from workout_api.categorias.schemas import CategoriaSchemaOut
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.centro_treinamento.schemas import CentroTreinamentoSchemaOut
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import SingleFlight, TTLCache
+from workout_api.contrib.changes import ChangeEvent
+from workout_api.contrib.dataloader import DataLoader
+from workout_api.contrib.dialects import in_array
+from workout_api.contrib.models import BaseModel
+from workout_api.contrib.replicas import is_replica
+
+
+class Referencia(NamedTuple):
+    pk_id: int
+    data: Any
+    updated_at: Optional[datetime] = None
+
+
+class Versao(NamedTuple):
+    """Quantidade de linhas e maior `updated_at` da tabela: muda a cada inclusão, alteração ou remoção."""
+    total: int
+    updated_at: Optional[datetime]
+
+
+class ReferenceCache:
+    """Cache de entidades de referência (pequenas e raramente alteradas), indexado por nome e por id.
+
+    Consultas concorrentes pela mesma chave fazem uma única carga, em uma sessão própria (`session_factory`):
+    a requisição que a iniciou pode terminar ou ser cancelada antes das demais que aguardam o resultado.
+    """
+
+    def __init__(
+        self, model: Type[BaseModel], schema: Type[PydanticModel], session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        self.model = model
+        self.schema = schema
+        self.session_factory = session_factory
+        self.cache: TTLCache[Referencia] = TTLCache(
+            maxsize=settings.REFERENCE_CACHE_SIZE, ttl=settings.REFERENCE_CACHE_TTL
+        )
+        self.versoes: TTLCache[Versao] = TTLCache(maxsize=1, ttl=settings.REFERENCE_CACHE_TTL)
+        self.inflight = SingleFlight()
+
+    async def versao(self, db_session: AsyncSession) -> Versao:
+        """Versão vista pela sessão da requisição: lida de uma réplica, acompanha os dados que a rota vai listar."""
+        query = select(func.count(), func.max(self.model.updated_at))
+        # Lida de uma réplica atrasada, ficaria em cache como se fosse a versão atual
+        if is_replica(db_session):
+            return Versao(*(await db_session.execute(query)).one())
+
+        versao = self.versoes.get("versao")
+        if versao is not None:
+            return versao
+
+        async def load() -> Versao:
+            async with self.session_factory() as load_session:
+                versao = Versao(*(await load_session.execute(query)).one())
+            self.versoes.set("versao", versao)
+            return versao
+
+        return await self.inflight.do("versao", load)
+
+    async def by_nome(self, nome: str) -> Optional[Referencia]:
+        return await self._get("nome", nome)
+
+    async def by_id(self, id: Any) -> Optional[Referencia]:
+        return await self._get("id", id)
+
+    async def _get(self, key: str, value: Any) -> Optional[Referencia]:
+        referencia = self.cache.get((key, value))
+        if referencia is not None:
+            return referencia
+
+        async def load() -> Optional[Referencia]:
+            async with self.session_factory() as db_session:
+                instance = (await db_session.execute(select(self.model).filter_by(**{key: value}))).scalars().first()
+            return None if instance is None else self.add(instance)
+
+        return await self.inflight.do((key, value), load)
+
+    async def by_ids(self, db_session: AsyncSession, ids: Sequence[UUID]) -> dict[UUID, Referencia]:
+        """Busca do cache e, para os ids que faltam, uma única consulta `id = ANY(:ids)`."""
+        encontradas = {}
+        for id_ in ids:
+            referencia = self.cache.get(("id", id_))
+            if referencia is not None:
+                encontradas[id_] = referencia
+
+        faltantes = [id_ for id_ in ids if id_ not in encontradas]
+        if faltantes:
+            query = select(self.model).where(in_array(db_session, self.model.id, faltantes))
+            for instance in (await db_session.execute(query)).scalars():
+                encontradas[instance.id] = self.add(instance)
+
+        return encontradas
+
+    def loader(self, db_session: AsyncSession) -> DataLoader[UUID, Referencia]:
+        return DataLoader(partial(self.by_ids, db_session))
+
+    def add(self, instance: BaseModel) -> Referencia:
+        referencia = Referencia(instance.pk_id, self.schema.model_validate(instance), instance.updated_at)
+        self.cache.set(("nome", instance.nome), referencia)
+        self.cache.set(("id", instance.id), referencia)
+        return referencia
+
+    def changed(self) -> None:
+        self.versoes.clear()
+
+    def invalidate(self, nome: Optional[str] = None, id: Any = None) -> None:
+        self.changed()
+        for key in (("nome", nome), ("id", id)):
+            referencia = self.cache.peek(key)
+            if referencia is not None:
+                self.cache.delete(("nome", referencia.data.nome))
+                self.cache.delete(("id", referencia.data.id))
+            self.cache.delete(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.versoes.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+
+categorias = ReferenceCache(CategoriaModel, CategoriaSchemaOut, async_session)
+centros_treinamento = ReferenceCache(CentroTreinamentoModel, CentroTreinamentoSchemaOut, async_session)
+
+
+async def on_change(event: ChangeEvent) -> None:
+    caches = {"categoria": categorias, "centro_treinamento": centros_treinamento}
+    cache = caches.get(event.entidade)
+    if cache is None:
+        return
+
+    for id_ in event.ids:
+        cache.invalidate(id=UUID(id_))
+
+
+async def clear() -> None:
+    categorias.clear()
+    centros_treinamento.clear()
+
+
+def metrics() -> Iterator[str]:
+    caches = {"categorias": categorias, "centros_treinamento": centros_treinamento}
+
+    for name, kind, key in (
+        ("reference_cache_hits_total", "counter", "hits"),
+        ("reference_cache_misses_total", "counter", "misses"),
+        ("reference_cache_size", "gauge", "size"),
+    ):
+        yield f"# TYPE {name} {kind}"
+        for cache_name, cache in caches.items():
+            yield f'{name}{{cache="{cache_name}"}} {cache.stats()[key]}'
@@ -0,0 +1,127 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from importlib import import_module
+from typing import AsyncContextManager, Awaitable, Callable, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.cache import SingleFlight, TTLCache
+
+
+class CacheBackend(ABC):
+    """Armazenamento das respostas serializadas; implemente esta interface para usar um cache compartilhado."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()) -> None:
+        ...
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """Remove todas as entradas gravadas com alguma das `tags`."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        ...
+
+
+class MemoryBackend(CacheBackend):
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.cache: TTLCache[bytes] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.tags: defaultdict[str, set[str]] = defaultdict(set)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()) -> None:
+        self.cache.set(key, value)
+        for tag in tags:
+            self.tags[tag].add(key)
+
+        if len(self.tags) > 2 * self.cache.maxsize:
+            self._prune()
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self.tags.pop(tag, ()):
+                self.cache.delete(key)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+        self.tags.clear()
+
+    def _prune(self) -> None:
+        for tag in [tag for tag, keys in self.tags.items() if all(self.cache.peek(key) is None for key in keys)]:
+            del self.tags[tag]
+
+
+Loader = Callable[[AsyncSession], Awaitable[Optional[tuple[bytes, Iterable[str]]]]]
+# sessionmaker ou fábrica de um gerenciador de contexto assíncrono que entrega a sessão
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class ResponseCache:
+    """Cache read-through de respostas: consultas concorrentes pela mesma chave executam o `loader` uma única vez.
+
+    O `loader` recebe uma sessão própria (`session_factory`, ou a passada em `get_or_load`), e não a da requisição
+    que iniciou a carga: essa requisição pode terminar ou ser cancelada antes das demais que aguardam o mesmo
+    resultado. Acertos no cache não abrem sessão.
+
+    Cada invalidação avança `geracao`. Uma carga iniciada antes da invalidação de alguma de suas tags ainda é
+    entregue a quem a aguardava, mas não é gravada (teria o corpo anterior à escrita), e requisições posteriores
+    à invalidação não se juntam a ela.
+    """
+
+    def __init__(self, backend: CacheBackend, session_factory: SessionFactory) -> None:
+        self.backend = backend
+        self.session_factory = session_factory
+        self.inflight = SingleFlight()
+        self.geracao = 0
+        # Geração da última invalidação de cada tag, enquanto houver cargas em andamento que possam precisar dela
+        self.invalidadas: dict[str, int] = {}
+        self.limpeza = 0
+
+    async def get_or_load(
+        self, key: str, loader: Loader, session_factory: Optional[SessionFactory] = None
+    ) -> Optional[bytes]:
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cached
+
+        geracao = self.geracao
+
+        async def load() -> Optional[bytes]:
+            async with (session_factory or self.session_factory)() as db_session:
+                loaded = await loader(db_session)
+            if loaded is None:
+                return None
+
+            content, tags = loaded
+            if self.limpeza <= geracao and all(self.invalidadas.get(tag, -1) <= geracao for tag in tags):
+                await self.backend.set(key, content, tags)
+            return content
+
+        return await self.inflight.do((key, geracao), load)
+
+    async def invalidate(self, *tags: str) -> None:
+        if not self.inflight:
+            self.invalidadas.clear()
+        self.geracao += 1
+        for tag in tags:
+            self.invalidadas[tag] = self.geracao
+        await self.backend.invalidate(tags)
+
+    async def clear(self) -> None:
+        self.geracao += 1
+        self.limpeza = self.geracao
+        self.invalidadas.clear()
+        await self.backend.clear()
+
+
+def load_backend(path: str, maxsize: int, ttl: float) -> CacheBackend:
+    """Instancia o backend a partir de `modulo:Classe`, passando `maxsize` e `ttl`."""
+    module, _, name = path.partition(":")
+    return getattr(import_module(module), name)(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from functools import cache
+from typing import Any, Callable, Optional, Sequence, Type, Union, get_args, get_origin
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+Serializer = Callable[[Any], Any]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """JSON compacto; UUID, datetime e dataclasses são convertidos pelo próprio orjson."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """Resposta JSON renderizada com orjson, para conteúdo que já está no formato de saída."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+@cache
+def serializer_for(schema: Type[BaseModel]) -> Serializer:
+    """Gera, uma única vez por schema, uma função que lê os campos por atributo (objeto ORM ou Row) e devolve o
+    dicionário de saída sem validação; campos que são outros schemas são serializados recursivamente.
+
+    Use apenas com dados vindos do banco, que já respeitam o schema.
+    """
+    namespace: dict[str, Any] = {}
+    items = []
+
+    for name, field in schema.model_fields.items():
+        key = field.serialization_alias or field.alias or name
+        nested = _nested_model(field.annotation)
+        if nested is None:
+            items.append(f"{key!r}: obj.{name}")
+        else:
+            namespace[f"_{name}"] = serializer_for(nested)
+            items.append(f"{key!r}: _{name}(obj.{name})")
+
+    source = (
+        "def serialize(obj):\n"
+        "    if obj is None:\n"
+        "        return None\n"
+        f"    return {{{', '.join(items)}}}\n"
+    )
+    exec(compile(source, f"<serializer {schema.__name__}>", "exec"), namespace)
+    return namespace["serialize"]
+
+
+def serialize_many(schema: Type[BaseModel]) -> Callable[[Sequence[Any]], list[Any]]:
+    serialize = serializer_for(schema)
+
+    def transformer(items: Sequence[Any]) -> list[Any]:
+        return [serialize(item) for item in items]
+
+    return transformer
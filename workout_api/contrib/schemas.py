@@ -1,6 +1,10 @@
 from pydantic import BaseModel, UUID4, Field
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Generic, TypeVar
+
+T = TypeVar("T")
+
+BATCH_MAX_SIZE = 500
 
 
 class BaseSchema(BaseModel):
@@ -12,3 +16,12 @@ class BaseSchema(BaseModel):
 class OutMixin(BaseModel):
     id: Annotated[UUID4, Field(description="Identificador")]
     created_at: Annotated[datetime, Field(description="Data de criação")]
+
+
+class BatchSchemaIn(BaseSchema):
+    ids: Annotated[list[UUID4], Field(max_length=BATCH_MAX_SIZE, description="Identificadores buscados")]
+
+
+class BatchSchemaOut(BaseSchema, Generic[T]):
+    items: Annotated[list[T], Field(description="Itens encontrados, na ordem em que foram pedidos")]
+    ausentes: Annotated[list[str], Field(description="Chaves pedidas que não foram encontradas")]
@@ -1,8 +1,105 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi_pagination import add_pagination
 
-from workout_api.routers import api_router
+from workout_api import openapi
+from workout_api.atleta import cache as atleta_cache
+from workout_api.atleta.batching import atletas_writer
+from workout_api.atleta.snapshot import atletas_snapshot
+from workout_api.configs.database import admission, engine, replicas
+from workout_api.configs.settings import settings
+from workout_api.contrib import instrumentation
+from workout_api.contrib.changes import change_feed
+from workout_api.contrib.conditional import CacheControlMiddleware
+from workout_api.contrib.idempotency import IdempotencyMiddleware
+from workout_api.contrib.profiler import ProfilerMiddleware, profiler, router as profiler_router
+from workout_api.contrib.replicas import ReadYourWritesMiddleware
+from workout_api.contrib.repository import reference
+from workout_api.contrib.response_cache import load_backend
+from workout_api.contrib.responses import FastJSONResponse
+from workout_api.resultados.ingestao import particoes
+from workout_api.routers import include_routers
+from workout_api.warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Depois do add_pagination, que descarta o schema ao iniciar
+    if settings.OPENAPI_SCHEMA_PATH:
+        openapi.carregar(app, settings.OPENAPI_SCHEMA_PATH)
+
+    if settings.DB_WARMUP:
+        await warm_up(engine)
+
+    await change_feed.start()
+    await replicas.start()
+    await particoes.start(engine)
+
+    if settings.SNAPSHOT_ENABLED:
+        await atletas_snapshot.start()
+
+    if settings.PROFILER_ENABLED:
+        profiler.start()
+
+    yield
 
-app = FastAPI(title='Workout API')
+    profiler.stop()
+    await atletas_snapshot.stop()
+    await particoes.stop()
+    await atletas_writer.close()
+    await change_feed.stop()
+    await replicas.stop()
+    await engine.dispose()
+
+
+change_feed.on("atleta", atleta_cache.on_change)
+change_feed.on("categoria", reference.on_change)
+change_feed.on("centro_treinamento", reference.on_change)
+change_feed.on_reset(atleta_cache.atletas_cache.clear)
+change_feed.on_reset(reference.clear)
+
+if settings.SNAPSHOT_ENABLED:
+    change_feed.on("atleta", atletas_snapshot.apply, local=True)
+    change_feed.on_reset(atletas_snapshot.reset)
+
+app = FastAPI(
+    title='Workout API',
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if settings.FAST_JSON_ENABLED else JSONResponse,
+)
+include_routers(app)
+# Depois das rotas: ajustadas já na importação, como as vê o schema gerado no build
 add_pagination(app)
-app.include_router(api_router)
+app.add_middleware(CacheControlMiddleware)
+app.add_middleware(
+    IdempotencyMiddleware,
+    backend=load_backend(settings.IDEMPOTENCY_BACKEND, settings.IDEMPOTENCY_CACHE_SIZE, settings.IDEMPOTENCY_TTL),
+)
+
+if replicas:
+    app.add_middleware(ReadYourWritesMiddleware, window=settings.DB_STICKY_WINDOW)
+
+if settings.METRICS_ENABLED:
+    instrumentation.instrument_engine(engine)
+    instrumentation.instrument_serialization()
+    instrumentation.metrics.collectors.append(reference.metrics)
+    if settings.ADMISSION_ENABLED:
+        instrumentation.metrics.collectors.append(admission.metrics)
+    if replicas:
+        instrumentation.metrics.collectors.append(replicas.metrics)
+    if settings.SNAPSHOT_ENABLED:
+        instrumentation.metrics.collectors.append(atletas_snapshot.metrics)
+    if settings.PROFILER_ENABLED:
+        instrumentation.metrics.collectors.append(profiler.metrics)
+    app.add_middleware(
+        instrumentation.InstrumentationMiddleware,
+        server_timing=settings.SERVER_TIMING_HEADER,
+        repeat_threshold=settings.SQL_REPEAT_WARNING_THRESHOLD,
+    )
+    app.include_router(instrumentation.router)
+
+if settings.PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware, profiler=profiler)
+    app.include_router(profiler_router)
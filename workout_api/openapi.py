@@ -0,0 +1,66 @@
+"""Schema OpenAPI gerado no build da imagem, para que o worker não o monte na primeira requisição a /docs.
+
+    python -m workout_api.openapi openapi.json
+
+e `OPENAPI_SCHEMA_PATH=openapi.json` no ambiente do worker.
+"""
+import json
+import logging
+import sys
+from hashlib import blake2b
+from importlib.metadata import version
+from pathlib import Path
+
+import fastapi
+import pydantic
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = "x-fingerprint"
+PACOTE = Path(__file__).parent
+
+
+def fingerprint(app: FastAPI) -> str:
+    """Muda com qualquer alteração no código da aplicação, nas bibliotecas que geram o schema ou nas rotas
+    incluídas (que dependem das configurações).
+    """
+    digest = blake2b(digest_size=16)
+    for arquivo in sorted(PACOTE.rglob("*.py")):
+        digest.update(arquivo.relative_to(PACOTE).as_posix().encode())
+        digest.update(arquivo.read_bytes())
+    digest.update(f"{fastapi.__version__} {pydantic.VERSION} {version('fastapi-pagination')}".encode())
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.include_in_schema:
+            digest.update(f"{route.path} {sorted(route.methods)}".encode())
+    return digest.hexdigest()
+
+
+def gerar(app: FastAPI, caminho: str) -> None:
+    schema = {**app.openapi(), FINGERPRINT_KEY: fingerprint(app)}
+    Path(caminho).write_text(json.dumps(schema, ensure_ascii=False), encoding="utf-8")
+
+
+def carregar(app: FastAPI, caminho: str) -> bool:
+    """Usa o schema gerado no build, se corresponder ao código em execução; senão o FastAPI o gera sob demanda."""
+    try:
+        schema = json.loads(Path(caminho).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.warning("Schema OpenAPI %s não encontrado; será gerado na primeira requisição", caminho)
+        return False
+
+    if schema.pop(FINGERPRINT_KEY, None) != fingerprint(app):
+        logger.warning("Schema OpenAPI %s desatualizado; será gerado na primeira requisição", caminho)
+        return False
+
+    app.openapi_schema = schema
+    return True
+
+
+if __name__ == "__main__":
+    from workout_api.main import app
+
+    destino = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    gerar(app, destino)
+    print(f"Schema OpenAPI salvo em {destino}")
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from pydantic import UUID4
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.contrib.conditional import not_modified
+from workout_api.contrib.dependencies import DatabaseDependency, ReadOnlyDatabaseDependency
+from workout_api.contrib.idempotency import idempotency_key
+from workout_api.contrib.repository import reference
+from workout_api.resultados.historico import HISTORICO_MAX_DIAS, historico
+from workout_api.resultados.ingestao import registrar_resultados
+from workout_api.resultados.schemas import (
+    Periodo, ResultadoPeriodoSchemaOut, ResultadosLoteSchemaIn, ResultadosLoteSchemaOut
+)
+
+router = APIRouter()
+
+
+def _intervalo(inicio: Optional[date], fim: Optional[date]) -> tuple[date, date]:
+    # realizado_em é gravado em UTC
+    fim = fim or datetime.utcnow().date()
+    inicio = inicio or fim - timedelta(days=90)
+
+    if inicio > fim:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Início posterior ao fim")
+    if (fim - inicio).days > HISTORICO_MAX_DIAS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Intervalo maior que {HISTORICO_MAX_DIAS} dias")
+
+    return inicio, fim
+
+
+@router.post(
+    "/",
+    status_code=status.HTTP_200_OK,
+    summary="Registra resultados de treinos em lote",
+    response_model=ResultadosLoteSchemaOut,
+    dependencies=[Depends(idempotency_key)]
+)
+async def post(
+    db_session: DatabaseDependency,
+    lote: ResultadosLoteSchemaIn = Body(...)
+) -> ResultadosLoteSchemaOut:
+    try:
+        resumo = await registrar_resultados(db_session, lote.resultados)
+        await db_session.commit()
+    except Exception:
+        await db_session.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail="Erro ao registrar resultados")
+
+    return resumo
+
+
+@router.get(
+    "/atletas/{id_atleta}",
+    status_code=status.HTTP_200_OK,
+    summary="Histórico diário ou semanal de um atleta",
+    response_model=list[ResultadoPeriodoSchemaOut]
+)
+async def get_atleta(
+    request: Request,
+    response: Response,
+    db_session: ReadOnlyDatabaseDependency,
+    id_atleta: UUID4,
+    periodo: Periodo = Query("dia"),
+    inicio: Optional[date] = Query(None, description="Padrão: 90 dias antes do fim"),
+    fim: Optional[date] = Query(None, description="Padrão: hoje"),
+    treino: Optional[str] = Query(None, max_length=50)
+) -> list[ResultadoPeriodoSchemaOut]:
+    inicio, fim = _intervalo(inicio, fim)
+    pk_id = await db_session.scalar(select(AtletaModel.pk_id).where(AtletaModel.id == id_atleta))
+
+    if pk_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Atleta não encontrado")
+
+    rows, etag = await historico(db_session, "atleta", pk_id, periodo, inicio, fim, treino)
+    if (not_modified_response := not_modified(request, response, etag)) is not None:
+        return not_modified_response
+
+    return rows
+
+
+@router.get(
+    "/centros_treinamento/{id_centro_treinamento}",
+    status_code=status.HTTP_200_OK,
+    summary="Histórico diário ou semanal de um centro de treinamento",
+    response_model=list[ResultadoPeriodoSchemaOut]
+)
+async def get_centro_treinamento(
+    request: Request,
+    response: Response,
+    db_session: ReadOnlyDatabaseDependency,
+    id_centro_treinamento: UUID4,
+    periodo: Periodo = Query("dia"),
+    inicio: Optional[date] = Query(None, description="Padrão: 90 dias antes do fim"),
+    fim: Optional[date] = Query(None, description="Padrão: hoje"),
+    treino: Optional[str] = Query(None, max_length=50)
+) -> list[ResultadoPeriodoSchemaOut]:
+    inicio, fim = _intervalo(inicio, fim)
+    centro_treinamento = await reference.centros_treinamento.by_id(id_centro_treinamento)
+
+    if centro_treinamento is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Centro de treinamento não encontrado")
+
+    rows, etag = await historico(
+        db_session, "centro_treinamento", centro_treinamento.pk_id, periodo, inicio, fim, treino
+    )
+    if (not_modified_response := not_modified(request, response, etag)) is not None:
+        return not_modified_response
+
+    return rows
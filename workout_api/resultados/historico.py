@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.conditional import weak_etag
+from workout_api.resultados.ingestao import inicio_periodo
+from workout_api.resultados.models import ResultadoAtletaPeriodoModel, ResultadoCentroPeriodoModel
+
+HISTORICO_MAX_DIAS = 400
+
+DONOS = {
+    "atleta": (ResultadoAtletaPeriodoModel, ResultadoAtletaPeriodoModel.atleta_id),
+    "centro_treinamento": (ResultadoCentroPeriodoModel, ResultadoCentroPeriodoModel.centro_treinamento_id),
+}
+
+
+async def historico(
+    db_session: AsyncSession, dono: str, pk_id: int, periodo: str, inicio: date, fim: date, treino: Optional[str]
+) -> tuple[list[dict[str, Any]], str]:
+    """Lê apenas os agregados: uma linha por período, treino e unidade, qualquer que seja o volume de resultados.
+
+    Retorna também um ETag derivado da quantidade e do maior `updated_at` das linhas lidas.
+    """
+    model, coluna = DONOS[dono]
+    query = (
+        select(
+            model.inicio, model.treino, model.unidade, model.quantidade,
+            case((model.unidade == "segundos", model.minimo), else_=model.maximo).label("melhor"),
+            (model.soma / model.quantidade).label("media"),
+            model.updated_at,
+        )
+        .where(coluna == pk_id, model.periodo == periodo)
+        .where(model.inicio >= inicio_periodo(periodo, inicio), model.inicio <= fim)
+        .order_by(model.inicio, model.treino, model.unidade)
+    )
+    if treino is not None:
+        query = query.where(model.treino == treino)
+
+    rows = (await db_session.execute(query)).mappings().all()
+    ultima = max((row["updated_at"] for row in rows), default=None)
+    etag = weak_etag(dono, pk_id, periodo, inicio, fim, treino, len(rows), ultima)
+    return [{key: row[key] for key in row.keys() if key != "updated_at"} for row in rows], etag
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.settings import settings
+from workout_api.contrib.dialects import greatest, in_array, insert_many, least
+from workout_api.contrib.repository import reference
+from workout_api.resultados.models import ResultadoAtletaPeriodoModel, ResultadoCentroPeriodoModel, ResultadoModel
+from workout_api.resultados.schemas import ResultadoSchemaIn
+
+logger = logging.getLogger(__name__)
+
+# Tolerância para relógios adiantados; além disso a data é rejeitada
+FUTURO_MAX = timedelta(days=1)
+
+
+def _mes(dia: date) -> date:
+    return dia.replace(day=1)
+
+
+def _proximo_mes(mes: date) -> date:
+    return (mes + timedelta(days=32)).replace(day=1)
+
+
+class Particoes:
+    """Mantém as partições mensais de `resultados` (apenas no PostgreSQL): na inicialização e a cada
+    `RESULTADOS_PARTICOES_INTERVALO` segundos, cria do mês anterior até `RESULTADOS_PARTICOES_MESES` meses à frente.
+
+    Fora das requisições: criar uma partição bloqueia a tabela pai até o commit e exigiria uma segunda conexão por
+    requisição. Datas sem partição (cargas antigas) vão para `resultados_default`. Cada mês é criado em uma
+    transação própria e curta; o advisory lock serializa workers que tentam criar o mesmo mês ao mesmo tempo.
+    """
+
+    def __init__(self) -> None:
+        self.existentes: set[date] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def meses(hoje: date) -> list[date]:
+        meses = [_mes(_mes(hoje) - timedelta(days=1))]
+        for _ in range(settings.RESULTADOS_PARTICOES_MESES + 1):
+            meses.append(_proximo_mes(meses[-1]))
+        return meses
+
+    async def garantir(self, engine: AsyncEngine, meses: Iterable[date]) -> None:
+        if engine.dialect.name != "postgresql":
+            return
+
+        for mes in sorted(set(meses) - self.existentes):
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('resultados_particoes'))"))
+                    await conn.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS resultados_{mes:%Y_%m} PARTITION OF resultados "
+                        f"FOR VALUES FROM ('{mes.isoformat()}') TO ('{_proximo_mes(mes).isoformat()}')"
+                    ))
+            except Exception:
+                # Ex.: resultados_default já tem linhas do mês; elas precisam ser movidas manualmente
+                logger.warning("Falha ao criar a partição de resultados de %s", f"{mes:%Y-%m}", exc_info=True)
+                continue
+            self.existentes.add(mes)
+
+    async def _run(self, engine: AsyncEngine) -> None:
+        while True:
+            await asyncio.sleep(settings.RESULTADOS_PARTICOES_INTERVALO)
+            await self.garantir(engine, self.meses(datetime.utcnow().date()))
+
+    async def start(self, engine: AsyncEngine) -> None:
+        if engine.dialect.name != "postgresql":
+            return
+
+        await self.garantir(engine, self.meses(datetime.utcnow().date()))
+        self._task = asyncio.create_task(self._run(engine))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def clear(self) -> None:
+        self.existentes.clear()
+
+
+particoes = Particoes()
+
+
+def inicio_periodo(periodo: str, dia: date) -> date:
+    return dia - timedelta(days=dia.weekday()) if periodo == "semana" else dia
+
+
+def _utc(instante: datetime) -> datetime:
+    if instante.tzinfo is None:
+        return instante
+    return instante.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def _validar(
+    db_session: AsyncSession, resultados: Sequence[ResultadoSchemaIn]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """Linhas a inserir, rejeitados (`indice`, `erro`) e repetidos dentro do próprio lote."""
+    ids = list({resultado.atleta_id for resultado in resultados})
+    query = select(AtletaModel.id, AtletaModel.pk_id, AtletaModel.centro_treinamento_id).where(
+        in_array(db_session, AtletaModel.id, ids)
+    )
+    atletas = {id_: (pk_id, centro_id) for id_, pk_id, centro_id in await db_session.execute(query)}
+
+    centros = {}
+    for nome in {r.centro_treinamento.nome for r in resultados if r.centro_treinamento is not None}:
+        centros[nome] = await reference.centros_treinamento.by_nome(nome)
+
+    limite = datetime.utcnow() + FUTURO_MAX
+    rows, invalidos, vistos, repetidos = [], [], set(), 0
+    for indice, resultado in enumerate(resultados):
+        atleta = atletas.get(resultado.atleta_id)
+        if atleta is None:
+            invalidos.append({"indice": indice, "erro": "Atleta não encontrado"})
+            continue
+
+        centro_id = atleta[1]
+        if resultado.centro_treinamento is not None:
+            centro = centros[resultado.centro_treinamento.nome]
+            if centro is None:
+                invalidos.append({"indice": indice, "erro": "Centro de treinamento não encontrado"})
+                continue
+            centro_id = centro.pk_id
+
+        realizado_em = _utc(resultado.realizado_em)
+        if realizado_em > limite:
+            invalidos.append({"indice": indice, "erro": "Data do resultado no futuro"})
+            continue
+
+        chave = (atleta[0], realizado_em, resultado.treino)
+        if chave in vistos:
+            repetidos += 1
+            continue
+        vistos.add(chave)
+
+        rows.append({
+            "id": uuid4(),
+            "updated_at": datetime.utcnow(),
+            "atleta_id": atleta[0],
+            "realizado_em": realizado_em,
+            "treino": resultado.treino,
+            "unidade": resultado.unidade,
+            "valor": resultado.valor,
+            "centro_treinamento_id": centro_id,
+        })
+
+    return rows, invalidos, repetidos
+
+
+def _agregar(inseridos: Iterable[Any], dono: str) -> list[dict[str, Any]]:
+    agregados: dict[tuple, list[float]] = defaultdict(lambda: [0, 0.0, float("inf"), float("-inf")])
+    for row in inseridos:
+        dia = row.realizado_em.date()
+        for periodo in ("dia", "semana"):
+            chave = (getattr(row, dono), periodo, inicio_periodo(periodo, dia), row.treino, row.unidade)
+            agregado = agregados[chave]
+            agregado[0] += 1
+            agregado[1] += row.valor
+            agregado[2] = min(agregado[2], row.valor)
+            agregado[3] = max(agregado[3], row.valor)
+
+    agora = datetime.utcnow()
+    # Ordenadas pela chave: lotes concorrentes bloqueiam as mesmas linhas na mesma ordem, sem deadlock
+    return [
+        {
+            "updated_at": agora, dono: chave[0], "periodo": chave[1], "inicio": chave[2],
+            "treino": chave[3], "unidade": chave[4],
+            "quantidade": quantidade, "soma": soma, "minimo": minimo, "maximo": maximo,
+        }
+        for chave, (quantidade, soma, minimo, maximo) in sorted(agregados.items())
+    ]
+
+
+async def _atualizar_periodos(db_session: AsyncSession, model, dono: str, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+
+    statement = insert_many(db_session, model, rows)
+    excluded = statement.excluded
+    await db_session.execute(statement.on_conflict_do_update(
+        index_elements=[dono, "periodo", "inicio", "treino", "unidade"],
+        set_={
+            "quantidade": model.quantidade + excluded.quantidade,
+            "soma": model.soma + excluded.soma,
+            "minimo": least(db_session, model.minimo, excluded.minimo),
+            "maximo": greatest(db_session, model.maximo, excluded.maximo),
+            "updated_at": excluded.updated_at,
+        },
+    ))
+
+
+async def registrar_resultados(db_session: AsyncSession, resultados: Sequence[ResultadoSchemaIn]) -> dict[str, Any]:
+    """Insere o lote com um único comando e soma aos agregados diários e semanais apenas as linhas de fato
+    inseridas (`ON CONFLICT DO NOTHING ... RETURNING`), na mesma transação: reenviar um lote não conta duas vezes.
+    """
+    rows, invalidos, repetidos = await _validar(db_session, resultados)
+    if not rows:
+        return {"inseridos": 0, "duplicados": repetidos, "invalidos": invalidos}
+
+    statement = (
+        insert_many(db_session, ResultadoModel, rows)
+        .on_conflict_do_nothing(index_elements=["atleta_id", "realizado_em", "treino"])
+        .returning(
+            ResultadoModel.atleta_id, ResultadoModel.centro_treinamento_id, ResultadoModel.realizado_em,
+            ResultadoModel.treino, ResultadoModel.unidade, ResultadoModel.valor,
+        )
+    )
+    inseridos = (await db_session.execute(statement)).all()
+
+    await _atualizar_periodos(
+        db_session, ResultadoAtletaPeriodoModel, "atleta_id", _agregar(inseridos, "atleta_id")
+    )
+    await _atualizar_periodos(
+        db_session, ResultadoCentroPeriodoModel, "centro_treinamento_id", _agregar(inseridos, "centro_treinamento_id")
+    )
+
+    return {
+        "inseridos": len(inseridos),
+        "duplicados": repetidos + len(rows) - len(inseridos),
+        "invalidos": invalidos,
+    }
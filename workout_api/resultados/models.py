@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from uuid import uuid4
+
+from sqlalchemy import DDL, Date, DateTime, Float, ForeignKey, Integer, PrimaryKeyConstraint, String, UUID, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from workout_api.contrib.models import BaseModel
+
+
+class ResultadoModel(BaseModel):
+    """Resultado bruto, particionado por mês de `realizado_em` no PostgreSQL (`resultados_AAAA_MM`, criadas com
+    antecedência por `workout_api.resultados.ingestao.particoes`); datas sem partição vão para `resultados_default`.
+
+    Toda restrição única de uma tabela particionada precisa incluir a chave de partição, por isso `id` não é
+    único no banco (é um uuid4 gerado na ingestão) e a chave é (atleta, instante, treino).
+    """
+
+    __tablename__ = "resultados"
+    __table_args__ = (
+        PrimaryKeyConstraint("atleta_id", "realizado_em", "treino"),
+        {"postgresql_partition_by": "RANGE (realizado_em)"},
+    )
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), default=uuid4, nullable=False)
+    atleta_id: Mapped[int] = mapped_column(ForeignKey("atletas.pk_id", ondelete="CASCADE"))
+    realizado_em: Mapped[datetime] = mapped_column(DateTime)
+    treino: Mapped[str] = mapped_column(String(50))
+    unidade: Mapped[str] = mapped_column(String(10), nullable=False)
+    valor: Mapped[float] = mapped_column(Float, nullable=False)
+    centro_treinamento_id: Mapped[int] = mapped_column(
+        ForeignKey("centros_treinamento.pk_id", ondelete="CASCADE"), nullable=False
+    )
+
+
+# create_all (scripts e testes); nas migrações, a partição é criada pela c4a1d8e6f052
+event.listen(ResultadoModel.__table__, "after_create", DDL(
+    "CREATE TABLE resultados_default PARTITION OF resultados DEFAULT"
+).execute_if(dialect="postgresql"))
+
+
+class _Periodo:
+    """Agregado incremental dos resultados de um dia ou de uma semana (iniciada na segunda-feira)."""
+
+    # Identificado pela chave primária composta; sem o `id` de BaseModel, que ninguém lê e custaria um índice único
+    id = None
+
+    periodo: Mapped[str] = mapped_column(String(6))
+    inicio: Mapped[date] = mapped_column(Date)
+    treino: Mapped[str] = mapped_column(String(50))
+    unidade: Mapped[str] = mapped_column(String(10))
+    quantidade: Mapped[int] = mapped_column(Integer, nullable=False)
+    soma: Mapped[float] = mapped_column(Float, nullable=False)
+    minimo: Mapped[float] = mapped_column(Float, nullable=False)
+    maximo: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class ResultadoAtletaPeriodoModel(_Periodo, BaseModel):
+    __tablename__ = "resultados_atleta_periodo"
+    __table_args__ = (PrimaryKeyConstraint("atleta_id", "periodo", "inicio", "treino", "unidade"),)
+
+    atleta_id: Mapped[int] = mapped_column(ForeignKey("atletas.pk_id", ondelete="CASCADE"))
+
+
+class ResultadoCentroPeriodoModel(_Periodo, BaseModel):
+    __tablename__ = "resultados_centro_periodo"
+    __table_args__ = (PrimaryKeyConstraint("centro_treinamento_id", "periodo", "inicio", "treino", "unidade"),)
+
+    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id", ondelete="CASCADE"))
@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from typing import Annotated, Literal, Optional
+from pydantic import Field, PositiveFloat, UUID4
+from workout_api.contrib.schemas import BaseSchema
+from workout_api.centro_treinamento.schemas import CentroTreinamentoAtleta
+
+LOTE_MAX_SIZE = 2000
+
+Unidade = Literal["segundos", "repeticoes", "kg"]
+Periodo = Literal["dia", "semana"]
+
+
+class ResultadoSchemaIn(BaseSchema):
+    atleta_id: Annotated[UUID4, Field(description="Identificador do atleta")]
+    treino: Annotated[str, Field(max_length=50, description="Nome do treino", example="Fran")]
+    unidade: Annotated[Unidade, Field(description="Unidade do valor; em segundos, menor é melhor", example="segundos")]
+    valor: Annotated[PositiveFloat, Field(description="Tempo, repetições ou carga", example=185.0)]
+    realizado_em: Annotated[datetime, Field(description="Data e hora do treino (sem fuso: UTC)")]
+    centro_treinamento: Annotated[Optional[CentroTreinamentoAtleta], Field(
+        None, description="Centro onde o treino foi feito; padrão: o do atleta")]
+
+
+class ResultadosLoteSchemaIn(BaseSchema):
+    resultados: Annotated[list[ResultadoSchemaIn], Field(
+        min_length=1, max_length=LOTE_MAX_SIZE, description="Resultados registrados")]
+
+
+class ResultadoInvalidoSchema(BaseSchema):
+    indice: Annotated[int, Field(description="Posição do resultado no lote")]
+    erro: Annotated[str, Field(description="Motivo da rejeição", example="Atleta não encontrado")]
+
+
+class ResultadosLoteSchemaOut(BaseSchema):
+    inseridos: Annotated[int, Field(description="Resultados gravados")]
+    duplicados: Annotated[int, Field(description="Resultados já registrados (mesmo atleta, instante e treino)")]
+    invalidos: Annotated[list[ResultadoInvalidoSchema], Field(description="Resultados rejeitados")]
+
+
+class ResultadoPeriodoSchemaOut(BaseSchema):
+    inicio: Annotated[date, Field(description="Primeiro dia do período (segunda-feira, nas semanas)")]
+    treino: Annotated[str, Field(description="Nome do treino", example="Fran")]
+    unidade: Annotated[Unidade, Field(description="Unidade dos valores", example="segundos")]
+    quantidade: Annotated[int, Field(description="Resultados no período", example=3)]
+    melhor: Annotated[float, Field(description="Menor tempo ou maior quantidade/carga", example=172.0)]
+    media: Annotated[float, Field(description="Média dos valores", example=181.5)]
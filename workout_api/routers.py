@@ -1,9 +1,32 @@
-from fastapi import APIRouter
+from fastapi import Depends, FastAPI
 from workout_api.atleta.controller import router as atleta
+from workout_api.atleta.nested import ATLETAS_CACHE_CONTROL
 from workout_api.categorias.controller import router as categoria
 from workout_api.centro_treinamento.controller import router as centro_treinamento
+from workout_api.contrib.conditional import cache_control
+from workout_api.resultados.controller import router as resultados
 
-api_router = APIRouter()
-api_router.include_router(atleta, prefix="/atletas", tags=["Atletas"])
-api_router.include_router(categoria, prefix="/categorias", tags=["Categorias"])
-api_router.include_router(centro_treinamento, prefix="/centros_treinamento", tags=["Centros de Treinamento"])
+# Cache-Control das respostas GET de cada router (rotas podem definir o seu, como as listas de atletas aninhadas);
+# as rotas enviam ETag/Last-Modified para revalidação
+CATEGORIAS_CACHE_CONTROL = "public, max-age=60"
+CENTROS_TREINAMENTO_CACHE_CONTROL = "public, max-age=60"
+RESULTADOS_CACHE_CONTROL = "private, no-cache"
+
+
+def include_routers(app: FastAPI) -> None:
+    # Direto no app: cada include_router reconstrói as rotas (e os schemas de resposta) do router incluído
+    app.include_router(
+        atleta, prefix="/atletas", tags=["Atletas"], dependencies=[Depends(cache_control(ATLETAS_CACHE_CONTROL))]
+    )
+    app.include_router(
+        categoria, prefix="/categorias", tags=["Categorias"],
+        dependencies=[Depends(cache_control(CATEGORIAS_CACHE_CONTROL))]
+    )
+    app.include_router(
+        centro_treinamento, prefix="/centros_treinamento", tags=["Centros de Treinamento"],
+        dependencies=[Depends(cache_control(CENTROS_TREINAMENTO_CACHE_CONTROL))]
+    )
+    app.include_router(
+        resultados, prefix="/resultados", tags=["Resultados"],
+        dependencies=[Depends(cache_control(RESULTADOS_CACHE_CONTROL))]
+    )
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from fastapi_pagination.ext.sqlalchemy import count_query
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import Select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.queries import select_atletas_completo, select_atletas_resumo
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.settings import settings
+from workout_api.contrib.repository import reference
+
+logger = logging.getLogger(__name__)
+
+NIL = UUID(int=0)
+
+
+def hot_statements() -> list[Select]:
+    """Consultas executadas em quase toda requisição; os parâmetros não retornam linhas."""
+    listagem = select_atletas_resumo().order_by(AtletaModel.nome, AtletaModel.pk_id)
+
+    return [
+        select(CategoriaModel).filter_by(nome=""),
+        select(CategoriaModel).filter_by(id=NIL),
+        select(CentroTreinamentoModel).filter_by(nome=""),
+        select(CentroTreinamentoModel).filter_by(id=NIL),
+        select(AtletaModel).filter_by(id=NIL),
+        select(AtletaModel).filter_by(cpf=""),
+        select_atletas_completo().where(AtletaModel.id == NIL),
+        listagem.where(AtletaModel.pk_id < 0).limit(50).offset(0),
+        count_query(listagem.where(AtletaModel.pk_id < 0)),
+    ]
+
+
+async def _warm_connection(connection: AsyncConnection) -> None:
+    async with AsyncSession(bind=connection) as db_session:
+        for statement in hot_statements():
+            await db_session.execute(statement)
+
+
+async def _load_references(engine: AsyncEngine) -> None:
+    async with AsyncSession(engine, expire_on_commit=False) as db_session:
+        for cache in (reference.categorias, reference.centros_treinamento):
+            query = select(cache.model).limit(settings.REFERENCE_CACHE_SIZE // 2)
+            for instance in (await db_session.execute(query)).scalars():
+                cache.add(instance)
+
+
+async def warm_up(engine: AsyncEngine) -> None:
+    """Abre `DB_POOL_SIZE` conexões e prepara nelas as consultas frequentes, além de carregar os caches de referência.
+
+    Falhas são registradas e não impedem a inicialização.
+    """
+    connections = [engine.connect() for _ in range(settings.DB_POOL_SIZE)]
+
+    try:
+        await asyncio.gather(*(connection.start() for connection in connections))
+        await asyncio.gather(*(_warm_connection(connection) for connection in connections))
+        await _load_references(engine)
+    except Exception:
+        logger.warning("Falha ao aquecer o pool de conexões", exc_info=True)
+    finally:
+        for connection in connections:
+            if connection.sync_connection is not None:
+                await connection.close()